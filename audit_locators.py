@@ -0,0 +1,82 @@
+"""
+Locator audit
+Lists every locator on the page objects, validates them against DOM
+snapshots (reports/dom_snapshots/<PageClass>.html, captured with
+--dom-snapshots) and suggests faster equivalent locators.
+
+Usage:
+    python audit_locators.py                              # audit against the default snapshots
+    python audit_locators.py --list                       # registry only, no snapshots needed
+    python audit_locators.py --snapshots DIR --json reports/locator_audit.json
+"""
+import argparse
+import json
+import sys
+from utils.locator_registry import audit, discover
+
+
+DEFAULT_SNAPSHOTS = "reports/dom_snapshots"
+DEFAULT_TIMINGS = "reports/action_timings.json"
+
+
+def main(argv=None):
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Validate page-object locators and suggest faster equivalents")
+    parser.add_argument("--snapshots", default=DEFAULT_SNAPSHOTS,
+                        help=f"Directory of <PageClass>.html DOM snapshots (default: {DEFAULT_SNAPSHOTS})")
+    parser.add_argument("--timings", default=DEFAULT_TIMINGS,
+                        help=f"Action timings from a browser run, if present (default: {DEFAULT_TIMINGS})")
+    parser.add_argument("--slow-factor", type=float, default=5.0,
+                        help="Flag lookups this many times slower than the page median (default: 5)")
+    parser.add_argument("--slow-ms", type=float, default=250.0,
+                        help="Flag locators whose mean browser time is at least this (default: 250)")
+    parser.add_argument("--list", action="store_true", help="Only list the registered locators")
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    entries = discover()
+    if args.list:
+        for entry in entries:
+            print(f"{entry.page + '.' + entry.name:<44} {entry.usage:<8} {entry.locator[0]}={entry.locator[1]}")
+        print(f"{len(entries)} locators")
+        return 0
+
+    try:
+        with open(args.timings, encoding="utf-8") as f:
+            timings = json.load(f)
+    except (OSError, ValueError):
+        timings = None
+
+    results = audit(entries, args.snapshots, slow_factor=args.slow_factor, live_timings=timings, slow_ms=args.slow_ms)
+    if not results:
+        print(f"❌ No snapshots in {args.snapshots}; run pytest --dom-snapshots={args.snapshots} first")
+        return 2
+
+    icons = {"ok": "✓", "absent": "·", "ambiguous": "❌", "invalid": "❌"}
+    for r in results:
+        if r["status"] == "invalid":
+            print(f"  ❌ {r['page']}.{r['name']} [invalid] {r['error']}")
+            continue
+        line = f"  {icons[r['status']]} {r['page']}.{r['name']} [{r['status']}, {r['matches']} match(es), "
+        line += f"scans {r['scanned']}, {r['lookup_us']}us"
+        if r.get("live_ms") is not None:
+            line += f", browser {r['live_ms']}ms"
+        line += "]"
+        if r["slow"]:
+            line += " SLOW"
+        if r["rewrite"]:
+            line += f" -> {r['rewrite'][0]}={r['rewrite'][1]} ({r['rewrite_us']}us)"
+        print(line)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    problems = [r for r in results if r["status"] in ("ambiguous", "invalid")]
+    print(f"{len(results)} locators checked: {len(problems)} problem(s), "
+          f"{sum(r['slow'] for r in results)} slow, {sum(bool(r['rewrite']) for r in results)} rewrite(s) suggested")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
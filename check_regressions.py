@@ -0,0 +1,99 @@
+"""
+Slow-test regression check
+Compares per-test, per-phase durations of a commit against the runs of
+earlier commits recorded in the duration history and flags tests whose p50
+or p95 got slower than a threshold.
+
+Usage:
+    python check_regressions.py                          # latest commit vs the 10 before it
+    python check_regressions.py --threshold 30 --phase all
+    python check_regressions.py --commit abc123 --profile lean
+"""
+import argparse
+import sys
+from utils.browser_profiles import DEFAULT_PROFILE
+from utils.duration_history import DEFAULT_DB, DurationHistory, percentile
+
+
+def find_regressions(candidate, baseline, threshold, min_delta, min_samples):
+    """
+    Compare duration samples
+
+    Args:
+        candidate (dict): (nodeid, phase) -> seconds for the commit under test
+        baseline (dict): (nodeid, phase) -> seconds for earlier commits
+        threshold (float): Allowed slowdown in percent
+        min_delta (float): Ignore slowdowns smaller than this many seconds
+        min_samples (int): Baseline samples needed before a test is judged
+
+    Returns:
+        list: One dict per regressed (test, phase, percentile)
+    """
+    regressions = []
+    for key, samples in sorted(candidate.items()):
+        history = baseline.get(key, [])
+        if len(history) < min_samples:
+            continue
+        for pct in (50, 95):
+            before = percentile(history, pct)
+            after = percentile(samples, pct)
+            if after - before >= min_delta and after > before * (1 + threshold / 100):
+                regressions.append({
+                    "nodeid": key[0], "phase": key[1], "percentile": f"p{pct}",
+                    "baseline": before, "current": after,
+                    "change": (after / before - 1) * 100 if before else float("inf"),
+                })
+    return regressions
+
+
+def main(argv=None):
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Flag tests whose p50/p95 duration regressed")
+    parser.add_argument("--db", default=DEFAULT_DB, help=f"Duration history database (default: {DEFAULT_DB})")
+    parser.add_argument("--profile", default=DEFAULT_PROFILE, help="Browser profile to compare")
+    parser.add_argument("--commit", help="Commit to check (default: the newest recorded)")
+    parser.add_argument("--baseline-commits", type=int, default=10,
+                        help="Number of earlier commits forming the baseline (default: 10)")
+    parser.add_argument("--phase", choices=["setup", "call", "teardown", "all"], default="call",
+                        help="Test phase to compare (default: call)")
+    parser.add_argument("--threshold", type=float, default=20.0,
+                        help="Allowed slowdown in percent (default: 20)")
+    parser.add_argument("--min-delta", type=float, default=0.25,
+                        help="Ignore slowdowns smaller than this many seconds (default: 0.25)")
+    parser.add_argument("--min-samples", type=int, default=3,
+                        help="Baseline samples needed per test (default: 3)")
+    args = parser.parse_args(argv)
+
+    history = DurationHistory(args.db)
+    commits = history.commits(args.profile)
+    commit = args.commit or (commits[0] if commits else None)
+    if commit not in commits:
+        print(f"❌ No recorded runs for commit {commit} with profile {args.profile}")
+        return 2
+    # Only commits recorded before the candidate; later ones are not a baseline for it
+    baseline_commits = commits[commits.index(commit) + 1:][:args.baseline_commits]
+    if not baseline_commits:
+        print(f"❌ No earlier commits recorded for profile {args.profile}")
+        return 2
+
+    phase = None if args.phase == "all" else args.phase
+    regressions = find_regressions(
+        history.samples(args.profile, [commit], phase),
+        history.samples(args.profile, baseline_commits, phase),
+        args.threshold, args.min_delta, args.min_samples,
+    )
+
+    print(f"Commit {commit[:12]} vs {len(baseline_commits)} earlier commits "
+          f"(profile {args.profile}, phase {args.phase}, threshold {args.threshold:g}%)")
+    for r in regressions:
+        print(f"  ❌ {r['nodeid']} [{r['phase']}] {r['percentile']}: "
+              f"{r['baseline']:.2f}s -> {r['current']:.2f}s (+{r['change']:.0f}%)")
+    if not regressions:
+        print("✓ No duration regressions")
+        return 0
+    print(f"{len(regressions)} regression(s) found")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
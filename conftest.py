@@ -2,10 +2,28 @@
 PyTest configuration and fixtures
 Contains setup and teardown for all tests
 """
+import os
+import re
 import pytest
-from datetime import datetime
+from _pytest.runner import runtestprotocol
+from datetime import date, datetime
+from pages.base_page import BasePage
+from utils.action_timing import ActionTimer
+from utils.browser_profiles import PROFILES, DEFAULT_PROFILE
 from utils.driver_setup import DriverSetup
+from utils.driver_pool import DriverPool
+from utils.currency_converter import CurrencyConverter
+from utils.driver_resolver import DriverResolver
+from utils.duration_history import DEFAULT_DB, DurationHistory, current_commit
+from utils.exchange_rates import FileRateProvider
+from utils.command_replay import CommandRecorder
+from utils.flaky import DEFAULT_HISTORY, FlakyTracker
 from utils.screenshot import Screenshot
+from utils.session_cache import SessionCache
+from utils.storefront_server import StorefrontServer
+from utils.stream_report import StreamReporter
+from utils.test_impact import ImpactMap, git_changes
+from utils.wait_engine import WaitEngine
 
 
 # Test data constants
@@ -14,28 +32,438 @@ VALID_USERNAME = "standard_user"
 VALID_PASSWORD = "secret_sauce"
 
 
+def pytest_addoption(parser):
+    """Register custom command line options"""
+    parser.addoption(
+        "--local-storefront", action="store_true",
+        default=os.environ.get("LOCAL_STOREFRONT", "") not in ("", "0"),
+        help="Run against the bundled demo_site/ storefronts on localhost instead of saucedemo.com"
+    )
+    parser.addoption(
+        "--browser-profile", choices=sorted(PROFILES),
+        default=os.environ.get("BROWSER_PROFILE", DEFAULT_PROFILE),
+        help="Browser profile: headed-debug, headless, or lean (headless, no images/fonts/third-party hosts)"
+    )
+    parser.addoption(
+        "--driver-pool", type=int,
+        default=int(os.environ.get("DRIVER_POOL_SIZE", "0")),
+        help="Number of browsers kept alive per worker and reused across tests (0 disables pooling)"
+    )
+    parser.addoption(
+        "--select-from", default=None,
+        help="File with one test node ID per line; only those tests run (used by run_parallel.py)"
+    )
+    parser.addoption(
+        "--impacted-since", default=None, metavar="GIT_REF",
+        help="Only run tests whose page objects, locators, utils or test code changed since this git ref"
+    )
+    parser.addoption(
+        "--record-commands", default=os.environ.get("RECORD_COMMANDS"),
+        help="Record each test's WebDriver commands and responses to DIR/<test>.json.gz for ReplayDriver"
+    )
+    parser.addoption(
+        "--dom-snapshots", default=os.environ.get("DOM_SNAPSHOTS"),
+        help="Save the page source at the end of each test to DIR/<PageClass>.html for audit_locators.py"
+    )
+    parser.addoption(
+        "--flaky-reruns", type=int,
+        default=int(os.environ.get("FLAKY_RERUNS", "0")),
+        help="Rerun a failing test this many times with a fresh driver; a later pass marks it flaky (default 0: off)"
+    )
+    parser.addoption(
+        "--flaky-history", default=os.environ.get("FLAKY_HISTORY"),
+        help=f"JSON file with recent outcomes per test, used to compute flake rates "
+             f"(default with --flaky-reruns: {DEFAULT_HISTORY}; otherwise not tracked)"
+    )
+    parser.addoption(
+        "--flaky-threshold", type=float,
+        default=float(os.environ.get("FLAKY_THRESHOLD", "0.2")),
+        help="Flake rate above which a test is quarantined"
+    )
+    parser.addoption(
+        "--quarantine", choices=["include", "skip", "only"],
+        default=os.environ.get("QUARANTINE", "include"),
+        help="Quarantined tests: run without failing the build (include), deselect (skip), or run only them (only)"
+    )
+    parser.addoption(
+        "--no-session-cache", action="store_true", default=False,
+        help="Log in through the UI for every test instead of restoring a cached session"
+    )
+    parser.addoption(
+        "--no-element-cache", action="store_true", default=False,
+        help="Look elements up for every page action instead of reusing located handles"
+    )
+    parser.addoption(
+        "--page-cache", choices=["off", "actions", "observe"],
+        default=os.environ.get("PAGE_CACHE", "off"),
+        help="Cache page object reads until an action (or, with 'observe', a DOM mutation) invalidates them"
+    )
+    parser.addoption(
+        "--wait-timeout", type=float,
+        default=float(os.environ.get("WAIT_TIMEOUT", WaitEngine.DEFAULT_TIMEOUT)),
+        help="Default explicit wait timeout in seconds"
+    )
+    parser.addoption(
+        "--wait-poll", type=float,
+        default=float(os.environ.get("WAIT_POLL_INTERVAL", WaitEngine.POLL_INTERVAL)),
+        help="Seconds between wait condition checks"
+    )
+    parser.addoption(
+        "--action-timings", default=os.environ.get("ACTION_TIMINGS", "reports/action_timings.json"),
+        help="Where to write per-test and per-locator page action timings (JSON)"
+    )
+    parser.addoption(
+        "--exchange-rates", default=os.environ.get("EXCHANGE_RATES_FILE"),
+        help="JSON file of exchange rates by pair and effective date (default: the built-in USD->INR rate)"
+    )
+    parser.addoption(
+        "--rate-date", default=os.environ.get("RATE_DATE"),
+        help="Pin exchange rates to those effective on this date (YYYY-MM-DD)"
+    )
+    parser.addoption(
+        "--stream-report", default=os.environ.get("STREAM_REPORT", "reports/live_report"),
+        help="Path prefix of the streaming report (<prefix>.html and <prefix>.jsonl, written as tests finish)"
+    )
+    parser.addoption(
+        "--duration-history", default=os.environ.get("DURATION_HISTORY", DEFAULT_DB),
+        help="SQLite database that per-phase test durations are appended to (see check_regressions.py)"
+    )
+    parser.addoption(
+        "--no-duration-history", action="store_true", default=False,
+        help="Do not record test durations"
+    )
+    parser.addoption(
+        "--no-stream-report", action="store_true", default=False,
+        help="Do not write the streaming report"
+    )
+    parser.addoption(
+        "--no-action-timings", action="store_true", default=False,
+        help="Do not time page object actions"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Restrict the run to the node IDs listed in --select-from and to tests impacted since --impacted-since"""
+    selection_file = config.getoption("--select-from")
+    if selection_file:
+        with open(selection_file, encoding="utf-8") as f:
+            selected_ids = {line.strip() for line in f if line.strip()}
+        _deselect(config, items, lambda item: item.nodeid in selected_ids)
+    since = config.getoption("--impacted-since")
+    if since:
+        impacted = ImpactMap(str(config.rootpath)).impacted(git_changes(since, str(config.rootpath)))
+        # Parametrized tests share the impact of their function
+        _deselect(config, items, lambda item: item.nodeid.split("[")[0] in impacted)
+    _apply_quarantine(config, items)
+
+
+def _apply_quarantine(config, items):
+    """Mark quarantined tests (by marker or flake rate) and route them to the chosen lane"""
+    tracker = FlakyTracker.current
+    quarantined = set()
+    for item in items:
+        if item.get_closest_marker("quarantine"):
+            quarantined.add(item.nodeid)
+        elif tracker and tracker.is_quarantined(item.nodeid):
+            item.add_marker(pytest.mark.quarantine)
+            quarantined.add(item.nodeid)
+    if tracker:
+        tracker.quarantined = quarantined
+    mode = config.getoption("--quarantine")
+    if mode == "skip":
+        _deselect(config, items, lambda item: item.nodeid not in quarantined)
+    elif mode == "only":
+        _deselect(config, items, lambda item: item.nodeid in quarantined)
+    # With "include", failures are turned into xfails in pytest_runtest_protocol, after
+    # the reruns, so the recorded outcome is still passed, flaky or failed
+
+
+def _deselect(config, items, keep):
+    """Drop items for which keep(item) is false, reporting them as deselected"""
+    deselected = [item for item in items if not keep(item)]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if keep(item)]
+
+
+@pytest.fixture(scope="session")
+def local_storefront(request):
+    """Bundled storefront server, or None when running against saucedemo.com"""
+    if not request.config.getoption("--local-storefront"):
+        yield None
+        return
+    server = StorefrontServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def base_url(local_storefront):
+    """URL of the saucedemo-style login page under test"""
+    return local_storefront.url if local_storefront else BASE_URL
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request, base_url):
+    """Session-wide browser pool, or None when pooling is disabled"""
+    size = request.config.getoption("--driver-pool")
+    if size <= 0:
+        yield None
+        return
+    pool = DriverPool(size, base_url)
+    yield pool
+    pool.close()
+
+
+def _start_driver(pool, base_url):
+    """Get a driver on base_url from the pool or a fresh browser"""
+    if pool:
+        return pool.acquire()
+    driver = DriverSetup.get_driver()
+    driver.get(base_url)
+    return driver
+
+
+def _stop_driver(pool, driver):
+    """Return the driver to the pool or quit it"""
+    if pool:
+        pool.release(driver)
+    else:
+        DriverSetup.quit_driver(driver)
+
+
+def _start_recording(request, driver):
+    """Recorder for the test's WebDriver traffic when --record-commands is set"""
+    if not request.config.getoption("--record-commands"):
+        return None
+    return CommandRecorder.attach(driver)
+
+
+def _save_dom_snapshot(request, driver):
+    """Save the final page source under the class of the page object that acted last"""
+    directory = request.config.getoption("--dom-snapshots")
+    page = ActionTimer.last_page
+    ActionTimer.last_page = None
+    if not directory or not page:
+        return
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, f"{page}.html"), "w", encoding="utf-8") as f:
+        f.write(driver.page_source)
+
+
+def _save_recording(request, recorder):
+    """Write the test's recording, named after its node id"""
+    if recorder:
+        name = re.sub(r"[^\w.-]+", "_", request.node.nodeid)
+        recorder.save(os.path.join(request.config.getoption("--record-commands"), f"{name}.json.gz"))
+
+
 @pytest.fixture(scope="function")
-def driver():
+def driver(request, driver_pool, base_url):
     """Setup and teardown WebDriver for each test"""
-    driver = DriverSetup.get_driver()
-    driver.get(BASE_URL)
+    driver = _start_driver(driver_pool, base_url)
+    recorder = _start_recording(request, driver)
     yield driver
-    DriverSetup.quit_driver(driver)
+    _save_recording(request, recorder)
+    _save_dom_snapshot(request, driver)
+    _stop_driver(driver_pool, driver)
 
 
 @pytest.fixture(scope="function")
-def driver_with_screenshot(request):
+def driver_with_screenshot(request, driver_pool, base_url):
     """Setup WebDriver with screenshot on failure"""
-    driver = DriverSetup.get_driver()
-    driver.get(BASE_URL)
-    
+    driver = _start_driver(driver_pool, base_url)
+    recorder = _start_recording(request, driver)
+
     yield driver
-    
+
+    _save_recording(request, recorder)
+    _save_dom_snapshot(request, driver)
+
     # Capture screenshot on test failure
     if request.node.rep_call.failed:
-        Screenshot.capture(driver, request.node.name)
-    
-    DriverSetup.quit_driver(driver)
+        screenshot = Screenshot.capture(driver, request.node.name)
+        if StreamReporter.current:
+            StreamReporter.current.attach_future(request.node.nodeid, "screenshot", screenshot)
+
+    _stop_driver(driver_pool, driver)
+
+
+def _quarantine_reason(item):
+    """xfail reason for a quarantined test run in the "include" lane, or None"""
+    if not item.get_closest_marker("quarantine") or item.config.getoption("--quarantine") != "include":
+        return None
+    tracker = FlakyTracker.current
+    rate = tracker.flake_rate(item.nodeid) if tracker else 0.0
+    return f"quarantined (flake rate {rate:.0%})"
+
+
+def _reset_fixtures(item):
+    """Drop the test's fixture values so the next attempt sets them up again"""
+    # pytest has no public API for this; Function._initrequest is private (pytest 3 to 8)
+    # and is what pytest-rerunfailures calls too. pytest_configure checks it exists.
+    item._initrequest()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Rerun a failing test with fresh function fixtures (a new or reset driver) to tell flakes from failures"""
+    reruns = item.config.getoption("--flaky-reruns")
+    quarantine_reason = _quarantine_reason(item)
+    if reruns <= 0 and not FlakyTracker.current and not quarantine_reason:
+        return None
+    item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    failed_attempts = 0
+    for attempt in range(reruns + 1):
+        reports = runtestprotocol(item, nextitem=nextitem, log=False)
+        failed = any(report.failed for report in reports)
+        if not failed or attempt == reruns:
+            break
+        failed_attempts += 1
+        for report in reports:
+            if report.failed:
+                report.outcome = "rerun"
+            # Lets reporting hooks keep only the final attempt
+            report.retried = True
+            item.ihook.pytest_runtest_logreport(report=report)
+        _reset_fixtures(item)
+
+    if FlakyTracker.current and not any(report.skipped for report in reports):
+        outcome = "failed" if failed else "flaky" if failed_attempts else "passed"
+        FlakyTracker.current.record(item.nodeid, outcome)
+    if quarantine_reason:
+        # Reported as a non-strict xfail, so a quarantined failure does not fail the run
+        for report in reports:
+            if report.failed:
+                report.outcome = "skipped"
+                report.wasxfail = quarantine_reason
+    for report in reports:
+        item.ihook.pytest_runtest_logreport(report=report)
+    item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    return True
+
+
+def pytest_report_teststatus(report):
+    """Show failed attempts that will be rerun as R / RERUN"""
+    if report.outcome == "rerun":
+        return "rerun", "R", ("RERUN", {"yellow": True})
+    return None
+
+
+def pytest_runtest_logstart(nodeid, location):
+    """Attribute page action timings to the test that is starting"""
+    ActionTimer.current_test = nodeid
+
+
+def _shard_path(path):
+    """Give each parallel shard (run_parallel.py) its own output file"""
+    shard = os.environ.get("SHARD_INDEX")
+    if shard is None:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}_shard{shard}{ext}"
+
+
+def pytest_sessionstart(session):
+    """Open the streaming report and the duration history"""
+    config = session.config
+    if config.option.collectonly:
+        return
+    if not config.getoption("--no-stream-report"):
+        StreamReporter.current = StreamReporter(_shard_path(config.getoption("--stream-report")))
+    if not config.getoption("--no-duration-history"):
+        DurationHistory.current = DurationHistory(config.getoption("--duration-history"))
+
+
+def pytest_runtest_logreport(report):
+    """Record phase durations and stream each test's result"""
+    if getattr(report, "retried", False):
+        # Attempts before a rerun would add extra stream rows and skew the duration baseline
+        return
+    if DurationHistory.current:
+        DurationHistory.current.record(report.nodeid, report.when, report.duration, report.outcome)
+    if not StreamReporter.current:
+        return
+    if report.when == "call":
+        outcome = report.outcome
+    elif report.failed:
+        outcome = "error"
+    elif report.when == "setup" and report.skipped:
+        outcome = "skipped"
+    else:
+        return
+    if report.passed:
+        details = ""
+    elif isinstance(report.longrepr, tuple):
+        # Skips carry (path, line, reason)
+        details = report.longrepr[2]
+    else:
+        details = report.longreprtext
+    StreamReporter.current.add_result(report.nodeid, outcome, report.duration, report.when, details)
+
+
+def pytest_sessionfinish(session):
+    """Finish queued screenshot writes, then close the streaming report and save durations and page action timings"""
+    Screenshot.wait_for_pending()
+    if StreamReporter.current:
+        StreamReporter.current.close()
+        StreamReporter.current = None
+    if FlakyTracker.current and not session.config.option.collectonly:
+        FlakyTracker.current.save()
+    if DurationHistory.current:
+        DurationHistory.current.save(current_commit(), DriverSetup.PROFILE, os.environ.get("SHARD_INDEX"))
+        DurationHistory.current = None
+    if not ActionTimer.enabled or not ActionTimer.has_records():
+        return
+    ActionTimer.write_json(_shard_path(session.config.getoption("--action-timings")))
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report driver resolution cost, browser memory and page cache effectiveness for this run"""
+    samples = [s["peak_rss_mb"] for s in DriverSetup.memory_samples if s["peak_rss_mb"] is not None]
+    if samples:
+        terminalreporter.write_line(
+            f"Browser peak RSS ({DriverSetup.PROFILE}): max {max(samples):.1f}MB, "
+            f"mean {sum(samples) / len(samples):.1f}MB over {len(samples)} browsers"
+        )
+    tracker = FlakyTracker.current
+    if tracker:
+        flaky = sorted(nodeid for nodeid, outcome in tracker.session.items() if outcome == "flaky")
+        for nodeid in flaky:
+            terminalreporter.write_line(f"Flaky (passed on rerun): {nodeid}")
+        if tracker.quarantined:
+            terminalreporter.write_line(
+                f"Quarantined: {len(tracker.quarantined)} tests "
+                f"(--quarantine {terminalreporter.config.getoption('--quarantine')})"
+            )
+    for failure in Screenshot.failures:
+        terminalreporter.write_line(f"Screenshot write failed: {failure}")
+    store = Screenshot.store()
+    if store.writes or store.hits:
+        terminalreporter.write_line(
+            f"Screenshot store: {store.writes} files written, {store.hits} duplicates skipped, "
+            f"{store.evicted} evicted"
+        )
+    if BasePage.CACHE_MODE:
+        stats = BasePage.cache_stats
+        terminalreporter.write_line(
+            f"Page cache ({BasePage.CACHE_MODE}): {stats['hits']} hits, {stats['misses']} misses"
+        )
+    handles = BasePage.element_stats
+    if handles["hits"] or handles["misses"]:
+        reused = handles["hits"] - handles["stale"]
+        terminalreporter.write_line(
+            f"Element handles: {reused} lookups saved of {handles['hits'] + handles['misses']} "
+            f"({reused / (handles['hits'] + handles['misses']):.0%}), {handles['stale']} stale handles re-looked up"
+        )
+    if DriverResolver.timings["cold"] is None:
+        return
+    timings = DriverResolver.timings
+    warm = f"{timings['warm'] * 1000:.3f}ms" if timings["warm"] is not None else "n/a"
+    terminalreporter.write_line(
+        f"ChromeDriver resolution: cold {timings['cold'] * 1000:.1f}ms, warm {warm} "
+        f"(source: {DriverResolver.source})"
+    )
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -53,7 +481,27 @@ def pytest_html_report_title(report):
 
 
 def pytest_configure(config):
-    """Configure pytest-html metadata"""
+    """Configure session cache and pytest-html metadata"""
+    DriverSetup.PROFILE = config.getoption("--browser-profile")
+    SessionCache.enabled = not config.getoption("--no-session-cache")
+    page_cache = config.getoption("--page-cache")
+    BasePage.CACHE_MODE = None if page_cache == "off" else page_cache
+    BasePage.ELEMENT_CACHE = not config.getoption("--no-element-cache")
+    WaitEngine.DEFAULT_TIMEOUT = config.getoption("--wait-timeout")
+    WaitEngine.POLL_INTERVAL = config.getoption("--wait-poll")
+    ActionTimer.enabled = not config.getoption("--no-action-timings")
+    reruns = config.getoption("--flaky-reruns")
+    if reruns > 0 and not hasattr(pytest.Function, "_initrequest"):
+        raise pytest.UsageError(f"--flaky-reruns is not supported on pytest {pytest.__version__}")
+    FlakyTracker.current = None
+    if reruns > 0 or config.getoption("--flaky-history"):
+        history = config.getoption("--flaky-history") or DEFAULT_HISTORY
+        FlakyTracker.current = FlakyTracker(history, config.getoption("--flaky-threshold"))
+    if config.getoption("--exchange-rates"):
+        CurrencyConverter.use_rates(FileRateProvider(config.getoption("--exchange-rates")))
+    if config.getoption("--rate-date"):
+        CurrencyConverter.RATE_DATE = date.fromisoformat(config.getoption("--rate-date"))
+
     config._metadata['Project'] = 'E-Commerce Automation Testing'
     config._metadata['Test Engineer'] = 'QA Automation Team'
     config._metadata['Environment'] = 'SauceDemo Test Site'
@@ -0,0 +1,305 @@
+/*
+ * Local stand-in for saucedemo.com
+ * Reproduces the DOM contracts used by LoginPage, ProductsPage and CartPage
+ * with fixed product data. Session is the "session-username" cookie and the
+ * cart is the "cart-contents" localStorage key, as on the real site.
+ */
+(function () {
+    "use strict";
+
+    var PRODUCTS = [
+        {id: 4, name: "Sauce Labs Backpack", price: 29.99,
+         desc: "Sly Pack that melds uncompromising style with unequaled laptop and tablet protection."},
+        {id: 0, name: "Sauce Labs Bike Light", price: 9.99,
+         desc: "A red light isn't the desired state in testing but it sure helps when riding your bike at night."},
+        {id: 1, name: "Sauce Labs Bolt T-Shirt", price: 15.99,
+         desc: "Get your testing superhero on with the Sauce Labs bolt T-shirt."},
+        {id: 5, name: "Sauce Labs Fleece Jacket", price: 49.99,
+         desc: "It's not every day that you come across a midweight quarter-zip fleece jacket."},
+        {id: 2, name: "Sauce Labs Onesie", price: 7.99,
+         desc: "Rib snap infant onesie for the junior automation engineer in development."},
+        {id: 3, name: "Test.allTheThings() T-Shirt (Red)", price: 15.99,
+         desc: "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard."}
+    ];
+    var USERS = ["standard_user", "locked_out_user", "problem_user", "performance_glitch_user", "error_user", "visual_user"];
+    var PASSWORD = "secret_sauce";
+    var SESSION_COOKIE = "session-username";
+    var CART_KEY = "cart-contents";
+    var ERROR_KEY = "storefront-error";
+
+    var sortOrder = "az";
+
+    function escapeHtml(text) {
+        return String(text).replace(/[&<>"']/g, function (c) {
+            return {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"}[c];
+        });
+    }
+
+    function slug(name) {
+        return name.toLowerCase().replace(/\s+/g, "-");
+    }
+
+    function money(value) {
+        return "$" + value.toFixed(2);
+    }
+
+    function productById(id) {
+        for (var i = 0; i < PRODUCTS.length; i++) {
+            if (PRODUCTS[i].id === id) { return PRODUCTS[i]; }
+        }
+        return null;
+    }
+
+    function getSessionUser() {
+        var match = document.cookie.match(new RegExp("(?:^|; )" + SESSION_COOKIE + "=([^;]*)"));
+        return match ? decodeURIComponent(match[1]) : null;
+    }
+
+    function setSessionUser(user) {
+        if (user) {
+            document.cookie = SESSION_COOKIE + "=" + encodeURIComponent(user) + "; path=/";
+        } else {
+            document.cookie = SESSION_COOKIE + "=; path=/; expires=Thu, 01 Jan 1970 00:00:00 GMT";
+        }
+    }
+
+    function getCart() {
+        try {
+            var ids = JSON.parse(window.localStorage.getItem(CART_KEY));
+            return Array.isArray(ids) ? ids.filter(function (id) { return productById(id); }) : [];
+        } catch (e) {
+            return [];
+        }
+    }
+
+    function setCart(ids) {
+        if (ids.length) {
+            window.localStorage.setItem(CART_KEY, JSON.stringify(ids));
+        } else {
+            window.localStorage.removeItem(CART_KEY);
+        }
+    }
+
+    function sortedProducts() {
+        var products = PRODUCTS.slice();
+        var compare = {
+            az: function (a, b) { return a.name < b.name ? -1 : 1; },
+            za: function (a, b) { return a.name < b.name ? 1 : -1; },
+            lohi: function (a, b) { return a.price - b.price; },
+            hilo: function (a, b) { return b.price - a.price; }
+        }[sortOrder];
+        return products.sort(compare);
+    }
+
+    /* ---------- Login page ---------- */
+
+    function renderLogin(root) {
+        var error = window.sessionStorage.getItem(ERROR_KEY);
+        root.innerHTML =
+            '<div class="login_logo">Swag Labs</div>' +
+            '<div class="login_wrapper"><div class="login-box"><form>' +
+            '<div class="form_group"><input class="input_error form_input" placeholder="Username" type="text" ' +
+            'data-test="username" id="user-name" name="user-name" autocorrect="off" autocapitalize="none" value=""></div>' +
+            '<div class="form_group"><input class="input_error form_input" placeholder="Password" type="password" ' +
+            'data-test="password" id="password" name="password" autocorrect="off" autocapitalize="none" value=""></div>' +
+            '<div class="error-message-container' + (error ? " error" : "") + '">' +
+            (error ? '<h3 data-test="error">' + escapeHtml(error) +
+                '<button class="error-button" data-test="error-button" type="button" aria-label="Close"></button></h3>' : "") +
+            '</div>' +
+            '<input type="submit" class="submit-button btn_action" data-test="login-button" id="login-button" name="login-button" value="Login">' +
+            '</form></div></div>';
+
+        root.querySelector("form").addEventListener("submit", function (event) {
+            event.preventDefault();
+            login(root.querySelector("#user-name").value, root.querySelector("#password").value);
+        });
+        var close = root.querySelector(".error-button");
+        if (close) {
+            close.addEventListener("click", function () {
+                window.sessionStorage.removeItem(ERROR_KEY);
+                renderLogin(root);
+            });
+        }
+    }
+
+    function login(username, password) {
+        var error = null;
+        if (!username) {
+            error = "Epic sadface: Username is required";
+        } else if (!password) {
+            error = "Epic sadface: Password is required";
+        } else if (USERS.indexOf(username) === -1 || password !== PASSWORD) {
+            error = "Epic sadface: Username and password do not match any user in this service";
+        } else if (username === "locked_out_user") {
+            error = "Epic sadface: Sorry, this user has been locked out.";
+        }
+        if (error) {
+            window.sessionStorage.setItem(ERROR_KEY, error);
+            renderLogin(document.getElementById("root"));
+            return;
+        }
+        window.sessionStorage.removeItem(ERROR_KEY);
+        setSessionUser(username);
+        window.location.href = "inventory.html";
+    }
+
+    /* ---------- Shared header ---------- */
+
+    function badgeHtml() {
+        var count = getCart().length;
+        return count ? '<span class="shopping_cart_badge">' + count + '</span>' : "";
+    }
+
+    // Updates the badge in place; existing element references stay valid, as with React
+    function updateBadge(root) {
+        root.querySelector(".shopping_cart_link").innerHTML = badgeHtml();
+    }
+
+    function header(title, extra) {
+        return '<div class="primary_header">' +
+            '<div class="bm-burger-button"><button type="button" id="react-burger-menu-btn">Open Menu</button></div>' +
+            '<div class="bm-menu-wrap" style="display:none"><nav class="bm-item-list">' +
+            '<a id="inventory_sidebar_link" class="bm-item menu-item" href="inventory.html">All Items</a>' +
+            '<a id="about_sidebar_link" class="bm-item menu-item" href="#">About</a>' +
+            '<a id="logout_sidebar_link" class="bm-item menu-item" href="#">Logout</a>' +
+            '<a id="reset_sidebar_link" class="bm-item menu-item" href="#">Reset App State</a>' +
+            '<button type="button" id="react-burger-cross-btn">Close Menu</button>' +
+            '</nav></div>' +
+            '<div class="app_logo">Swag Labs</div>' +
+            '<div id="shopping_cart_container" class="shopping_cart_container">' +
+            '<a class="shopping_cart_link" href="cart.html">' + badgeHtml() + '</a></div></div>' +
+            '<div class="header_secondary_container"><span class="title">' + title + '</span>' + (extra || "") + '</div>';
+    }
+
+    function bindHeader(root, rerender) {
+        var menu = root.querySelector(".bm-menu-wrap");
+        root.querySelector("#react-burger-menu-btn").addEventListener("click", function () {
+            menu.style.display = "block";
+        });
+        root.querySelector("#react-burger-cross-btn").addEventListener("click", function () {
+            menu.style.display = "none";
+        });
+        root.querySelector("#logout_sidebar_link").addEventListener("click", function (event) {
+            event.preventDefault();
+            setSessionUser(null);
+            window.location.href = "./";
+        });
+        root.querySelector("#reset_sidebar_link").addEventListener("click", function (event) {
+            event.preventDefault();
+            setCart([]);
+            rerender();
+        });
+    }
+
+    function requireSession(page) {
+        if (getSessionUser()) { return true; }
+        window.sessionStorage.setItem(
+            ERROR_KEY, "Epic sadface: You can only access '/" + page + "' when you are logged in."
+        );
+        window.location.replace("./");
+        return false;
+    }
+
+    /* ---------- Inventory page ---------- */
+
+    function renderInventory(root) {
+        var cart = getCart();
+        var sortSelect = '<select class="product_sort_container" data-test="product-sort-container">' +
+            [["az", "Name (A to Z)"], ["za", "Name (Z to A)"], ["lohi", "Price (low to high)"], ["hilo", "Price (high to low)"]]
+                .map(function (o) {
+                    return '<option value="' + o[0] + '"' + (o[0] === sortOrder ? " selected" : "") + '>' + o[1] + '</option>';
+                }).join("") +
+            '</select>';
+
+        var items = sortedProducts().map(function (p) {
+            var inCart = cart.indexOf(p.id) !== -1;
+            var buttonId = (inCart ? "remove-" : "add-to-cart-") + slug(p.name);
+            return '<div class="inventory_item">' +
+                '<div class="inventory_item_description"><div class="inventory_item_label">' +
+                '<a href="#" id="item_' + p.id + '_title_link"><div class="inventory_item_name">' + escapeHtml(p.name) + '</div></a>' +
+                '<div class="inventory_item_desc">' + escapeHtml(p.desc) + '</div></div>' +
+                '<div class="pricebar"><div class="inventory_item_price">' + money(p.price) + '</div>' +
+                '<button class="btn btn_' + (inCart ? "secondary" : "primary") + ' btn_small btn_inventory" ' +
+                'data-test="' + buttonId + '" id="' + buttonId + '" name="' + buttonId + '" data-product-id="' + p.id + '">' +
+                (inCart ? "Remove" : "Add to cart") + '</button></div></div></div>';
+        }).join("");
+
+        root.innerHTML = header("Products", sortSelect) +
+            '<div class="inventory_container"><div class="inventory_list">' + items + '</div></div>';
+
+        bindHeader(root, function () { renderInventory(root); });
+        root.querySelector(".product_sort_container").addEventListener("change", function (event) {
+            sortOrder = event.target.value;
+            renderInventory(root);
+        });
+        Array.prototype.forEach.call(root.querySelectorAll(".btn_inventory"), function (button) {
+            button.addEventListener("click", function () {
+                var id = Number(button.getAttribute("data-product-id"));
+                var ids = getCart();
+                var index = ids.indexOf(id);
+                var adding = index === -1;
+                if (adding) { ids.push(id); } else { ids.splice(index, 1); }
+                setCart(ids);
+
+                var buttonId = (adding ? "remove-" : "add-to-cart-") + slug(productById(id).name);
+                button.id = buttonId;
+                button.name = buttonId;
+                button.setAttribute("data-test", buttonId);
+                button.className = "btn btn_" + (adding ? "secondary" : "primary") + " btn_small btn_inventory";
+                button.textContent = adding ? "Remove" : "Add to cart";
+                updateBadge(root);
+            });
+        });
+    }
+
+    /* ---------- Cart page ---------- */
+
+    function renderCart(root) {
+        var rows = getCart().map(function (id) {
+            var p = productById(id);
+            var buttonId = "remove-" + slug(p.name);
+            return '<div class="cart_item"><div class="cart_quantity">1</div>' +
+                '<div class="cart_item_label"><a href="#" id="item_' + p.id + '_title_link">' +
+                '<div class="inventory_item_name">' + escapeHtml(p.name) + '</div></a>' +
+                '<div class="inventory_item_desc">' + escapeHtml(p.desc) + '</div>' +
+                '<div class="item_pricebar"><div class="inventory_item_price">' + money(p.price) + '</div>' +
+                '<button class="btn btn_secondary btn_small cart_button" data-test="' + buttonId + '" id="' + buttonId +
+                '" name="' + buttonId + '" data-product-id="' + p.id + '">Remove</button></div></div></div>';
+        }).join("");
+
+        root.innerHTML = header("Your Cart") +
+            '<div id="cart_contents_container" class="cart_contents_container"><div class="cart_list">' +
+            '<div class="cart_quantity_label">QTY</div><div class="cart_desc_label">Description</div>' + rows +
+            '</div><div class="cart_footer">' +
+            '<button class="btn btn_secondary back btn_medium" data-test="continue-shopping" id="continue-shopping">Continue Shopping</button>' +
+            '<button class="btn btn_action btn_medium checkout_button" data-test="checkout" id="checkout">Checkout</button>' +
+            '</div></div>';
+
+        bindHeader(root, function () { renderCart(root); });
+        Array.prototype.forEach.call(root.querySelectorAll(".cart_button"), function (button) {
+            button.addEventListener("click", function () {
+                var id = Number(button.getAttribute("data-product-id"));
+                setCart(getCart().filter(function (other) { return other !== id; }));
+                var row = button.closest(".cart_item");
+                row.parentNode.removeChild(row);
+                updateBadge(root);
+            });
+        });
+        root.querySelector("#continue-shopping").addEventListener("click", function () {
+            window.location.href = "inventory.html";
+        });
+        // The checkout flow is not part of the stand-in; #checkout is rendered for CartPage only
+    }
+
+    document.addEventListener("DOMContentLoaded", function () {
+        var root = document.getElementById("root");
+        var page = document.body.getAttribute("data-page");
+        if (page === "login") {
+            renderLogin(root);
+        } else if (page === "inventory" && requireSession("inventory.html")) {
+            renderInventory(root);
+        } else if (page === "cart" && requireSession("cart.html")) {
+            renderCart(root);
+        }
+    });
+}());
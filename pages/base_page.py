@@ -1,54 +1,337 @@
 """
 Base Page class containing common methods used across all page objects
 """
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+import weakref
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
+from utils.action_timing import timed
+from utils.wait_engine import WaitEngine
+
+
+# Text of every element matching a CSS selector, in document order
+TEXTS_SCRIPT = """
+var nodes = document.querySelectorAll(arguments[0]);
+var texts = [];
+for (var i = 0; i < nodes.length; i++) { texts.push(nodes[i].innerText.trim()); }
+return texts;
+"""
+
+# One row per container element; each field is [css selector, "text" or attribute name]
+ROWS_SCRIPT = """
+var containers = document.querySelectorAll(arguments[0]);
+var fields = arguments[1];
+var rows = [];
+for (var i = 0; i < containers.length; i++) {
+    var row = {};
+    for (var name in fields) {
+        var el = containers[i].querySelector(fields[name][0]);
+        if (!el) { row[name] = null; }
+        else if (fields[name][1] === "text") { row[name] = el.innerText.trim(); }
+        else { row[name] = el.getAttribute(fields[name][1]); }
+    }
+    rows.push(row);
+}
+return rows;
+"""
+
+# Number of elements matching a CSS selector
+COUNT_SCRIPT = "return document.querySelectorAll(arguments[0]).length;"
+
+# DOM mutation counter for the current document, installing the observer on
+# first use. Returns -1 when the observer was missing (new document).
+MUTATION_COUNT_SCRIPT = """
+if (window.__pageCacheMutations === undefined) {
+    window.__pageCacheMutations = 0;
+    new MutationObserver(function () { window.__pageCacheMutations++; }).observe(
+        document, {childList: true, subtree: true, attributes: true, characterData: true}
+    );
+    return -1;
+}
+return window.__pageCacheMutations;
+"""
+
+# Replace a localStorage entry with a JSON-encoded value, or remove it for null
+SET_STORAGE_SCRIPT = """
+if (arguments[1] === null) { window.localStorage.removeItem(arguments[0]); }
+else { window.localStorage.setItem(arguments[0], JSON.stringify(arguments[1])); }
+"""
+
+
+class ElementNotFoundError(NoSuchElementException):
+    """An element did not appear within its wait timeout"""
+
+    def __init__(self, locator, timeout=None):
+        self.locator = locator
+        self.timeout = timeout
+        waited = f" within {timeout}s" if timeout is not None else ""
+        super().__init__(f"Element not found{waited}: {locator}")
 
 
 class BasePage:
-    def __init__(self, driver):
+    # Snapshot cache for read methods: None (off), "actions" (invalidated by
+    # page actions) or "observe" (also validated against a MutationObserver)
+    CACHE_MODE = None
+
+    # Hits and misses across every page instance in this process
+    cache_stats = {"hits": 0, "misses": 0}
+
+    # Driver -> cache generation, bumped by any page's action on that driver, so
+    # every page object sharing the driver drops its cached reads
+    _cache_generations = weakref.WeakKeyDictionary()
+
+    # Locator -> timeout in seconds; 0 means "check once, never wait"
+    TIMEOUT_BUDGETS = {}
+
+    # Reuse located elements per page object until they go stale (--no-element-cache turns it off)
+    ELEMENT_CACHE = True
+
+    # Element handle reuse across every page instance in this process
+    element_stats = {"hits": 0, "misses": 0, "stale": 0}
+
+    # localStorage key holding the app's cart as a JSON list of product ids; pages that
+    # set it define CART_BADGE, listed_product_ids() and get_cart_badge_count() for seed_cart()
+    CART_STORAGE_KEY = None
+
+    def __init__(self, driver, cache=None):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = WaitEngine(driver, budgets=self.TIMEOUT_BUDGETS)
+        self.cache_mode = cache if cache is not None else BasePage.CACHE_MODE
+        self._cache = {}
+        self._cache_generation = None
+        self._cache_mutations = None
+        self._elements = {}
 
+    @timed("find_element")
     def find_element(self, locator):
         """Find element with explicit wait"""
+        element = self._find(locator)
+        if BasePage.ELEMENT_CACHE:
+            self._elements[locator] = element
+        return element
+
+    def _find(self, locator):
+        """Fresh lookup with the locator's wait budget"""
         try:
-            return self.wait.until(EC.presence_of_element_located(locator))
-        except TimeoutException:
-            raise Exception(f"Element not found: {locator}")
+            return self.wait.present(locator)
+        except TimeoutException as e:
+            raise ElementNotFoundError(locator, self.wait.budget_for(locator)) from e
 
+    @timed("find_elements")
     def find_elements(self, locator):
         """Find multiple elements"""
-        try:
-            return self.wait.until(EC.presence_of_all_elements_located(locator))
-        except TimeoutException:
-            return []
+        return self.wait.all_present(locator)
 
+    @timed("click")
     def click(self, locator):
         """Click on element with explicit wait"""
-        element = self.wait.until(EC.element_to_be_clickable(locator))
-        element.click()
+        self.invalidate_cache()
+        self._on_element(
+            locator, self.wait.clickable, lambda element: element.click(),
+            recheck=lambda element: self.wait.clickable(locator, element),
+        )
 
+    @timed("enter_text")
     def enter_text(self, locator, text):
         """Enter text into input field"""
-        element = self.find_element(locator)
-        element.clear()
-        element.send_keys(text)
+        self.invalidate_cache()
+
+        def type_into(element):
+            element.clear()
+            element.send_keys(text)
+
+        self._on_element(locator, self._find, type_into)
 
+    @timed("navigate_to")
+    def navigate_to(self, url):
+        """Load a URL in the current window"""
+        self.invalidate_cache()
+        self._elements.clear()
+        self.driver.get(url)
+
+    @timed("seed_storage")
+    def seed_storage(self, key, value):
+        """
+        Write app state straight to localStorage and reload once so the app renders it
+
+        Args:
+            key (str): localStorage key used by the app
+            value: JSON-serialisable state; None removes the key
+        """
+        self.invalidate_cache()
+        self._elements.clear()
+        self.driver.execute_script(SET_STORAGE_SCRIPT, key, value)
+        self.driver.refresh()
+
+    def listed_product_ids(self):
+        """Ids of the products listed on the page, in display order"""
+        raise NotImplementedError(f"{type(self).__name__} does not list products")
+
+    def seed_cart(self, count=2):
+        """
+        Put the first `count` listed products in the cart without clicking
+
+        Selects the same products as add_multiple_products_to_cart(), writes the
+        cart to localStorage in one call and reloads the page once, so setup
+        cost does not grow with the number of items. Use the add_* methods in
+        tests that cover adding to cart itself.
+
+        Returns:
+            list: Product ids now in the cart
+
+        Raises:
+            RuntimeError: If fewer than `count` products are listed, or the
+                reloaded page does not show the seeded cart
+        """
+        listed = self.listed_product_ids()
+        if len(listed) < count:
+            raise RuntimeError(f"Cart seeding failed: {len(listed)} products listed, {count} requested")
+        ids = listed[:count]
+        self.seed_storage(self.CART_STORAGE_KEY, ids or None)
+        expected = str(len(ids))
+        shown = self.get_text(self.CART_BADGE) if ids else self.get_cart_badge_count()
+        if shown != expected:
+            raise RuntimeError(f"Cart seeding failed: badge shows {shown}, expected {expected}")
+        return ids
+
+    @timed("get_text")
     def get_text(self, locator):
         """Get text from element"""
-        element = self.find_element(locator)
-        return element.text
+        return self._cached(("text", locator), lambda: self._on_element(locator, self._find, lambda element: element.text))
+
+    @timed("get_texts")
+    def get_texts(self, locator):
+        """Get text of all matching elements in a single script call"""
+        return self._cached(("texts", locator), lambda: self._wait_for_script(locator, TEXTS_SCRIPT, self.to_css(locator)))
+
+    @timed("count_elements")
+    def count_elements(self, locator):
+        """Count matching elements in a single script call"""
+        return self._cached(("count", locator), lambda: self._wait_for_script(locator, COUNT_SCRIPT, self.to_css(locator)) or 0)
+
+    @timed("extract_rows")
+    def extract_rows(self, item_locator, fields):
+        """
+        Read structured rows for a listing in a single script call
+
+        Args:
+            item_locator (tuple): Locator of each row container (e.g. product card)
+            fields (dict): Field name -> (locator inside the row, "text" or attribute name)
+
+        Returns:
+            list: One dict per row, e.g. {"name": ..., "price": ..., "button_id": ...}
+        """
+        css_fields = {name: [self.to_css(locator), source] for name, (locator, source) in fields.items()}
+        key = ("rows", item_locator, tuple(sorted(fields)))
+        return self._cached(key, lambda: self._wait_for_script(item_locator, ROWS_SCRIPT, self.to_css(item_locator), css_fields))
 
+    @timed("is_element_displayed")
     def is_element_displayed(self, locator):
         """Check if element is displayed"""
+        return self._cached(("displayed", locator), lambda: self._is_displayed(locator))
+
+    @timed("is_element_present")
+    def is_element_present(self, locator):
+        """Check if element is in the DOM right now, without waiting"""
+        return self.wait.present_now(locator)
+
+    @timed("is_element_absent")
+    def is_element_absent(self, locator, timeout=None):
+        """Expect element to be absent; returns immediately when it already is"""
+        return self.wait.absent(locator, timeout)
+
+    def _is_displayed(self, locator):
+        """Uncached displayed check"""
         try:
-            element = self.find_element(locator)
-            return element.is_displayed()
-        except:
+            return self._on_element(locator, self._find, lambda element: element.is_displayed())
+        except (ElementNotFoundError, StaleElementReferenceException):
             return False
 
+    def _on_element(self, locator, lookup, action, recheck=None):
+        """
+        Run action(element) on the element for a locator, reusing a cached handle
+
+        A cached handle that has gone stale is dropped and looked up once more
+        with lookup(locator); staleness of a fresh handle is raised as usual.
+
+        Args:
+            locator (tuple): Element locator
+            lookup (callable): Fresh lookup, e.g. self._find or self.wait.clickable
+            action (callable): Receives the element
+            recheck (callable): Wait applied to a cached handle before use (e.g. clickable)
+        """
+        if not BasePage.ELEMENT_CACHE:
+            return action(lookup(locator))
+        element = self._elements.get(locator)
+        if element is not None:
+            BasePage.element_stats["hits"] += 1
+            try:
+                return action(recheck(element) if recheck else element)
+            except StaleElementReferenceException:
+                BasePage.element_stats["stale"] += 1
+                self._elements.pop(locator, None)
+        else:
+            BasePage.element_stats["misses"] += 1
+        element = lookup(locator)
+        self._elements[locator] = element
+        return action(element)
+
     def get_current_url(self):
         """Get current page URL"""
         return self.driver.current_url
+
+    def invalidate_cache(self):
+        """Drop cached reads of every page on this driver (called by every action that can change the page)"""
+        generations = BasePage._cache_generations
+        generations[self.driver] = generations.get(self.driver, 0) + 1
+        self._cache.clear()
+        self._cache_mutations = None
+
+    def _cached(self, key, loader):
+        """Serve a read from the snapshot cache, loading it on a miss"""
+        if not self.cache_mode:
+            return loader()
+        generation = BasePage._cache_generations.get(self.driver, 0)
+        if generation != self._cache_generation:
+            # Another page object acted on the driver since these reads were cached
+            self._cache.clear()
+            self._cache_generation = generation
+        if self.cache_mode == "observe":
+            mutations = self.driver.execute_script(MUTATION_COUNT_SCRIPT)
+            if mutations == -1 or mutations != self._cache_mutations:
+                self._cache.clear()
+                self._cache_mutations = mutations if mutations != -1 else 0
+        if key in self._cache:
+            BasePage.cache_stats["hits"] += 1
+            return self._cache[key]
+        BasePage.cache_stats["misses"] += 1
+        value = loader()
+        # Negative reads (absent, empty) are usually transient, so only cache positive ones
+        if value:
+            self._cache[key] = value
+        return value
+
+    def _wait_for_script(self, locator, script, *args):
+        """Run a script until it returns a non-empty result, [] once the locator's budget runs out"""
+        try:
+            return self.wait.until(
+                lambda driver: driver.execute_script(script, *args) or False,
+                self.wait.budget_for(locator),
+            )
+        except TimeoutException:
+            return []
+
+    @staticmethod
+    def to_css(locator):
+        """Convert a (By, value) locator into an equivalent CSS selector"""
+        by, value = locator
+        if by == By.CSS_SELECTOR:
+            return value
+        if by == By.ID:
+            return f'[id="{value}"]'
+        if by == By.CLASS_NAME:
+            return f".{value}"
+        if by == By.NAME:
+            return f'[name="{value}"]'
+        if by == By.TAG_NAME:
+            return value
+        raise ValueError(f"Locator cannot be converted to CSS: {locator}")
@@ -4,11 +4,13 @@ Contains cart items, price validation, and checkout functionality
 """
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from utils.currency_converter import CurrencyConverter
 
 
 class CartPage(BasePage):
     # Locators
     PAGE_TITLE = (By.CLASS_NAME, "title")
+    CART_LIST = (By.CLASS_NAME, "cart_list")
     CART_ITEMS = (By.CLASS_NAME, "cart_item")
     ITEM_NAMES = (By.CLASS_NAME, "inventory_item_name")
     ITEM_PRICES = (By.CLASS_NAME, "inventory_item_price")
@@ -17,8 +19,19 @@ class CartPage(BasePage):
     CONTINUE_SHOPPING = (By.ID, "continue-shopping")
     CHECKOUT_BUTTON = (By.ID, "checkout")
 
-    def __init__(self, driver):
-        super().__init__(driver)
+    # Fields read per cart row by get_cart_rows()
+    CART_FIELDS = {
+        "name": (ITEM_NAMES, "text"),
+        "price": (ITEM_PRICES, "text"),
+        "quantity": (ITEM_QUANTITIES, "text"),
+        "button_id": ((By.TAG_NAME, "button"), "id"),
+    }
+
+    # Cart rows are counted once the cart list has rendered, never waited for
+    TIMEOUT_BUDGETS = {CART_ITEMS: 0}
+
+    def __init__(self, driver, cache=None):
+        super().__init__(driver, cache)
 
     def is_cart_page_displayed(self):
         """Verify cart page is displayed"""
@@ -30,35 +43,33 @@ class CartPage(BasePage):
 
     def get_cart_item_count(self):
         """Get number of items in cart"""
-        items = self.find_elements(self.CART_ITEMS)
-        return len(items)
+        self.find_element(self.CART_LIST)
+        return self.count_elements(self.CART_ITEMS)
 
     def get_item_names(self):
         """Get list of item names in cart"""
-        elements = self.find_elements(self.ITEM_NAMES)
-        return [element.text for element in elements]
+        return self.get_texts(self.ITEM_NAMES)
 
     def get_item_prices(self):
         """Get list of item prices in cart"""
-        elements = self.find_elements(self.ITEM_PRICES)
-        return [element.text for element in elements]
+        return self.get_texts(self.ITEM_PRICES)
 
     def get_item_quantities(self):
         """Get list of item quantities"""
-        elements = self.find_elements(self.ITEM_QUANTITIES)
-        return [element.text for element in elements]
+        return self.get_texts(self.ITEM_QUANTITIES)
+
+    def get_cart_rows(self):
+        """Get name, price, quantity and button id of every cart item in one call"""
+        return self.extract_rows(self.CART_ITEMS, self.CART_FIELDS)
 
     def calculate_total_price(self):
         """Calculate total price of items in cart"""
-        prices = self.get_item_prices()
-        total = 0.0
-        for price in prices:
-            # Remove $ symbol and convert to float
-            total += float(price.replace("$", ""))
-        return total
+        # Summed exactly in cents/paise; converted to float only at the end
+        return float(CurrencyConverter.sum_prices(self.get_item_prices()))
 
     def remove_item_by_index(self, index=0):
         """Remove item from cart by index"""
+        self.invalidate_cache()
         buttons = self.find_elements(self.REMOVE_BUTTONS)
         if index < len(buttons):
             buttons[index].click()
@@ -3,6 +3,7 @@ Page Object Model for Indian E-Commerce Shopping Cart Page
 """
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from utils.currency_converter import CurrencyConverter
 import re
 
 
@@ -18,8 +19,18 @@ class IndianCartPage(BasePage):
     EMPTY_CART = (By.ID, "emptyCart")
     REMOVE_BUTTONS = (By.CSS_SELECTOR, ".cart-item .remove-btn")
 
-    def __init__(self, driver):
-        super().__init__(driver)
+    # Fields read per cart row by get_cart_rows()
+    CART_FIELDS = {
+        "name": (ITEM_NAMES, "text"),
+        "price": (ITEM_PRICES, "text"),
+        "button_id": ((By.CLASS_NAME, "remove-btn"), "id"),
+    }
+
+    # Cart rows are counted once the cart view has rendered, never waited for
+    TIMEOUT_BUDGETS = {CART_ITEMS: 0}
+
+    def __init__(self, driver, cache=None):
+        super().__init__(driver, cache)
 
     def is_cart_page_displayed(self):
         """Verify cart page is displayed"""
@@ -31,18 +42,20 @@ class IndianCartPage(BasePage):
 
     def get_cart_item_count(self):
         """Get number of items in cart"""
-        items = self.find_elements(self.CART_ITEMS)
-        return len(items)
+        self.find_element(self.CART_TITLE)
+        return self.count_elements(self.CART_ITEMS)
 
     def get_item_names(self):
         """Get list of item names in cart"""
-        elements = self.find_elements(self.ITEM_NAMES)
-        return [element.text for element in elements]
+        return self.get_texts(self.ITEM_NAMES)
 
     def get_item_prices(self):
         """Get list of item prices in cart (INR)"""
-        elements = self.find_elements(self.ITEM_PRICES)
-        return [element.text for element in elements]
+        return self.get_texts(self.ITEM_PRICES)
+
+    def get_cart_rows(self):
+        """Get name, price and button id of every cart item in one call"""
+        return self.extract_rows(self.CART_ITEMS, self.CART_FIELDS)
 
     def get_total_amount(self):
         """Get total amount in INR"""
@@ -50,16 +63,12 @@ class IndianCartPage(BasePage):
 
     def calculate_total_price(self):
         """Calculate total price of items in cart"""
-        prices = self.get_item_prices()
-        total = 0.0
-        for price in prices:
-            # Remove ₹ symbol and commas, then convert to float
-            price_text = price.replace("₹", "").replace(",", "").strip()
-            total += float(price_text)
-        return total
+        # Summed exactly in cents/paise; converted to float only at the end
+        return float(CurrencyConverter.sum_prices(self.get_item_prices()))
 
     def remove_item_by_index(self, index=0):
         """Remove item from cart by index"""
+        self.invalidate_cache()
         buttons = self.find_elements(self.REMOVE_BUTTONS)
         if index < len(buttons):
             buttons[index].click()
@@ -12,8 +12,8 @@ class IndianLoginPage(BasePage):
     LOGIN_BUTTON = (By.ID, "login-button")
     ERROR_MESSAGE = (By.ID, "errorMessage")
 
-    def __init__(self, driver):
-        super().__init__(driver)
+    def __init__(self, driver, cache=None):
+        super().__init__(driver, cache)
 
     def enter_username(self, username):
         """Enter username in the username field"""
@@ -44,3 +44,11 @@ class IndianLoginPage(BasePage):
     def is_login_page(self):
         """Verify if on login page"""
         return self.is_element_displayed(self.LOGIN_BUTTON)
+
+    def is_error_absent(self):
+        """Verify no error message is shown; returns at once when there is none"""
+        return self.is_element_absent(self.ERROR_MESSAGE)
+
+    def has_left_login_page(self):
+        """Verify the login form is gone, e.g. after a successful login"""
+        return self.is_element_absent(self.LOGIN_BUTTON)
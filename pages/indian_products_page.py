@@ -16,8 +16,21 @@ class IndianProductsPage(BasePage):
     CART_ICON = (By.ID, "cartIcon")
     LOGOUT_BUTTON = (By.ID, "logout-sidebar-link")
 
-    def __init__(self, driver):
-        super().__init__(driver)
+    # Fields read per product card by get_product_rows()
+    PRODUCT_FIELDS = {
+        "name": (PRODUCT_NAMES, "text"),
+        "price": (PRODUCT_PRICES, "text"),
+        "button_id": (ADD_TO_CART_BUTTONS, "id"),
+    }
+
+    # localStorage cart key of the Indian demo, for seed_cart()
+    CART_STORAGE_KEY = "indian-demo-cart"
+
+    # Product id per card, read by listed_product_ids()
+    SEED_FIELDS = {"product_id": (ADD_TO_CART_BUTTONS, "data-product-id")}
+
+    def __init__(self, driver, cache=None):
+        super().__init__(driver, cache)
 
     def is_products_page_displayed(self):
         """Verify products page is displayed"""
@@ -29,21 +42,23 @@ class IndianProductsPage(BasePage):
 
     def get_product_count(self):
         """Get total number of products displayed"""
-        products = self.find_elements(self.PRODUCT_CARDS)
-        return len(products)
+        return self.count_elements(self.PRODUCT_CARDS)
 
     def get_product_names(self):
         """Get list of all product names"""
-        elements = self.find_elements(self.PRODUCT_NAMES)
-        return [element.text for element in elements]
+        return self.get_texts(self.PRODUCT_NAMES)
 
     def get_product_prices(self):
         """Get list of all product prices in INR"""
-        elements = self.find_elements(self.PRODUCT_PRICES)
-        return [element.text for element in elements]
+        return self.get_texts(self.PRODUCT_PRICES)
+
+    def get_product_rows(self):
+        """Get name, price and button id of every product in one call"""
+        return self.extract_rows(self.PRODUCT_CARDS, self.PRODUCT_FIELDS)
 
     def add_product_to_cart_by_index(self, index=0):
         """Add product to cart by index"""
+        self.invalidate_cache()
         buttons = self.find_elements(self.ADD_TO_CART_BUTTONS)
         if index < len(buttons):
             buttons[index].click()
@@ -52,16 +67,22 @@ class IndianProductsPage(BasePage):
 
     def add_multiple_products_to_cart(self, count=2):
         """Add multiple products to cart"""
+        self.invalidate_cache()
         buttons = self.find_elements(self.ADD_TO_CART_BUTTONS)
         for i in range(min(count, len(buttons))):
             buttons[i].click()
 
+    def listed_product_ids(self):
+        """Ids of the listed products, from their add-to-cart buttons"""
+        rows = self.extract_rows(self.PRODUCT_CARDS, self.SEED_FIELDS)
+        return [int(row["product_id"]) for row in rows]
+
     def get_cart_badge_count(self):
         """Get cart item count from badge"""
-        try:
-            return self.get_text(self.CART_BADGE)
-        except:
+        # The badge is only rendered for a non-empty cart, so don't wait for it
+        if not self.is_element_present(self.CART_BADGE):
             return "0"
+        return self.get_text(self.CART_BADGE)
 
     def click_cart_icon(self):
         """Navigate to cart page"""
@@ -14,8 +14,8 @@ class LoginPage(BasePage):
     ERROR_MESSAGE = (By.CSS_SELECTOR, "h3[data-test='error']")
     ERROR_CLOSE_BUTTON = (By.CLASS_NAME, "error-button")
 
-    def __init__(self, driver):
-        super().__init__(driver)
+    def __init__(self, driver, cache=None):
+        super().__init__(driver, cache)
 
     def enter_username(self, username):
         """Enter username in the username field"""
@@ -46,3 +46,11 @@ class LoginPage(BasePage):
     def is_login_page(self):
         """Verify if on login page"""
         return self.is_element_displayed(self.LOGIN_BUTTON)
+
+    def is_error_absent(self):
+        """Verify no error message is shown; returns at once when there is none"""
+        return self.is_element_absent(self.ERROR_MESSAGE)
+
+    def has_left_login_page(self):
+        """Verify the login form is gone, e.g. after a successful login"""
+        return self.is_element_absent(self.LOGIN_BUTTON)
@@ -0,0 +1,205 @@
+"""
+Parallel test runner
+Shards the collected tests across worker processes (one browser each),
+balances shards by previously recorded durations and merges the results
+into a single JUnit XML report.
+
+Usage:
+    python run_parallel.py                 # one worker per CPU core
+    python run_parallel.py -n 4 -- -m smoke
+"""
+import argparse
+import heapq
+import json
+import os
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime
+
+
+REPORTS_DIR = "reports"
+SHARDS_DIR = os.path.join(REPORTS_DIR, "shards")
+DURATIONS_FILE = os.path.join(REPORTS_DIR, "test_durations.json")
+DEFAULT_DURATION = 5.0
+
+
+def collect_tests(pytest_args):
+    """
+    Collect test node IDs without running them
+
+    Args:
+        pytest_args (list): Extra pytest arguments (markers, paths, ...)
+
+    Returns:
+        list: Node IDs like "tests/test_login.py::TestLogin::test_x"
+    """
+    cmd = [sys.executable, "-m", "pytest", "--collect-only", "-qq"] + pytest_args
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode not in (0, 5):
+        print(result.stdout)
+        print(result.stderr)
+        raise SystemExit("❌ Test collection failed")
+    return [line.strip() for line in result.stdout.splitlines() if "::" in line]
+
+
+def load_durations(path=DURATIONS_FILE):
+    """Load recorded test durations (node ID -> seconds)"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_durations(durations, path=DURATIONS_FILE):
+    """Persist recorded test durations"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(durations, f, indent=2, sort_keys=True)
+
+
+def plan_shards(test_ids, durations, workers):
+    """
+    Split tests into balanced shards (longest processing time first)
+
+    Args:
+        test_ids (list): Node IDs to distribute
+        durations (dict): Known durations in seconds
+        workers (int): Number of shards
+
+    Returns:
+        list: One list of node IDs per non-empty shard
+    """
+    known = [durations[t] for t in test_ids if t in durations]
+    fallback = sum(known) / len(known) if known else DEFAULT_DURATION
+    weighted = sorted(test_ids, key=lambda t: durations.get(t, fallback), reverse=True)
+
+    heap = [(0.0, index, []) for index in range(max(1, workers))]
+    for test_id in weighted:
+        load, index, shard = heapq.heappop(heap)
+        shard.append(test_id)
+        heapq.heappush(heap, (load + durations.get(test_id, fallback), index, shard))
+    shards = [shard for _, index, shard in sorted(heap, key=lambda entry: entry[1])]
+    return [shard for shard in shards if shard]
+
+
+def run_shards(shards, pytest_args):
+    """
+    Run every shard in its own pytest process
+
+    Returns:
+        list: JUnit XML paths, one per shard
+    """
+    os.makedirs(SHARDS_DIR, exist_ok=True)
+    processes = []
+    for index, shard in enumerate(shards):
+        selection_file = os.path.join(SHARDS_DIR, f"shard_{index}.txt")
+        junit_file = os.path.join(SHARDS_DIR, f"shard_{index}.xml")
+        log_file = os.path.join(SHARDS_DIR, f"shard_{index}.log")
+        with open(selection_file, "w", encoding="utf-8") as f:
+            f.write("\n".join(shard))
+
+        cmd = [
+            sys.executable, "-m", "pytest",
+            f"--select-from={selection_file}",
+            f"--junitxml={junit_file}",
+            "-p", "no:cacheprovider",
+        ] + pytest_args
+        env = dict(os.environ, SHARD_INDEX=str(index), SHARD_COUNT=str(len(shards)))
+        log = open(log_file, "w", encoding="utf-8")
+        processes.append((subprocess.Popen(cmd, stdout=log, stderr=subprocess.STDOUT, env=env), log))
+        print(f"  ▶ Shard {index}: {len(shard)} tests (log: {log_file})")
+
+    for process, log in processes:
+        process.wait()
+        log.close()
+    return [os.path.join(SHARDS_DIR, f"shard_{index}.xml") for index in range(len(shards))]
+
+
+def _node_id_key(test_id):
+    """Map a node ID to the (classname, name) pair pytest writes in JUnit XML"""
+    parts = test_id.split("::")
+    module = parts[0][:-3].replace("/", ".") if parts[0].endswith(".py") else parts[0]
+    return ".".join([module] + parts[1:-1]), parts[-1]
+
+
+def merge_reports(junit_files, output_file, test_ids):
+    """
+    Merge shard JUnit files into one report
+
+    Returns:
+        tuple: (totals dict, node ID -> duration of every executed test)
+    """
+    key_to_id = {_node_id_key(test_id): test_id for test_id in test_ids}
+    merged = ET.Element("testsuites")
+    totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0, "time": 0.0}
+    durations = {}
+
+    for junit_file in junit_files:
+        if not os.path.exists(junit_file):
+            totals["errors"] += 1
+            print(f"  ⚠ Missing shard report: {junit_file}")
+            continue
+        root = ET.parse(junit_file).getroot()
+        suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+        for suite in suites:
+            merged.append(suite)
+            for key in ("tests", "failures", "errors", "skipped"):
+                totals[key] += int(suite.get(key, 0))
+            totals["time"] = max(totals["time"], float(suite.get("time", 0)))
+            for case in suite.iter("testcase"):
+                test_id = key_to_id.get((case.get("classname"), case.get("name")))
+                if test_id:
+                    durations[test_id] = float(case.get("time", 0))
+
+    for key, value in totals.items():
+        merged.set(key, f"{value:.3f}" if key == "time" else str(value))
+    ET.ElementTree(merged).write(output_file, encoding="utf-8", xml_declaration=True)
+    return totals, durations
+
+
+def main(argv=None):
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Run the test suite in parallel shards")
+    parser.add_argument("-n", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes (default: CPU count)")
+    parser.add_argument("pytest_args", nargs="*", help="Extra pytest arguments (after --)")
+    args = parser.parse_args(argv)
+
+    print("\n" + "="*60)
+    print("Running Tests in Parallel")
+    print("="*60 + "\n")
+
+    test_ids = collect_tests(args.pytest_args)
+    if not test_ids:
+        print("❌ No tests collected")
+        return 5
+
+    durations = load_durations()
+    shards = plan_shards(test_ids, durations, min(args.workers, len(test_ids)))
+    print(f"✓ Collected {len(test_ids)} tests, running {len(shards)} shards\n")
+
+    start = time.perf_counter()
+    junit_files = run_shards(shards, args.pytest_args)
+    wall_time = time.perf_counter() - start
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    report_file = os.path.join(REPORTS_DIR, f"parallel_report_{timestamp}.xml")
+    totals, new_durations = merge_reports(junit_files, report_file, test_ids)
+    durations.update(new_durations)
+    save_durations(durations)
+
+    passed = totals["tests"] - totals["failures"] - totals["errors"] - totals["skipped"]
+    print("\n" + "="*60)
+    print(f"Passed: {passed}  Failed: {totals['failures']}  "
+          f"Errors: {totals['errors']}  Skipped: {totals['skipped']}")
+    print(f"Wall time: {wall_time:.1f}s across {len(shards)} workers")
+    print(f"✓ Report generated: {report_file}")
+    print("="*60)
+    return 0 if totals["failures"] == 0 and totals["errors"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
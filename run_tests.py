@@ -20,23 +20,23 @@ def create_reports_directory():
 
 
 def run_all_tests():
-    """Run all tests with HTML report"""
+    """Run all tests with a streaming HTML/JSONL report"""
     print("\n" + "="*60)
     print("Running All Tests")
     print("="*60 + "\n")
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    report_file = f"reports/test_report_{timestamp}.html"
+    report_prefix = f"reports/test_report_{timestamp}"
+    print(f"Live report: {report_prefix}.html (updates while tests run)\n")
     
     cmd = [
         "pytest",
         "-v",
-        f"--html={report_file}",
-        "--self-contained-html"
+        f"--stream-report={report_prefix}"
     ]
     
     subprocess.run(cmd)
-    print(f"\n✓ Report generated: {report_file}")
+    print(f"\n✓ Report generated: {report_prefix}.html")
 
 
 def run_smoke_tests():
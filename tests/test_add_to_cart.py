@@ -6,15 +6,19 @@ import pytest
 from pages.login_page import LoginPage
 from pages.products_page import ProductsPage
 from pages.cart_page import CartPage
+from utils.price_consistency import PriceIndex
+from utils.session_cache import SessionCache
 from conftest import VALID_USERNAME, VALID_PASSWORD
 
 
 @pytest.fixture
 def logged_in_driver(driver_with_screenshot):
-    """Fixture to login before each test"""
+    """Fixture to login before each test (restores the cached session after the first UI login)"""
     login_page = LoginPage(driver_with_screenshot)
-    login_page.login(VALID_USERNAME, VALID_PASSWORD)
-    return driver_with_screenshot
+    return SessionCache.login(
+        driver_with_screenshot, f"saucedemo:{VALID_USERNAME}",
+        lambda: login_page.login(VALID_USERNAME, VALID_PASSWORD)
+    )
 
 
 class TestAddToCart:
@@ -51,7 +55,10 @@ class TestAddToCart:
     def test_validate_cart_total_price(self, logged_in_driver):
         """TC_013: Verify cart total price calculation"""
         products_page = ProductsPage(logged_in_driver)
-        products_page.add_multiple_products_to_cart(2)
+        price_index = PriceIndex.for_session(
+            "saucedemo", lambda: PriceIndex.from_rows(products_page.get_product_rows())
+        )
+        products_page.seed_cart(2)
         products_page.click_cart_icon()
         
         cart_page = CartPage(logged_in_driver)
@@ -59,6 +66,12 @@ class TestAddToCart:
         
         assert total_price > 0, "Total price should be greater than 0"
         assert cart_page.get_cart_item_count() == 2, "Cart should contain 2 items"
+        
+        # Cart prices and total must match what the listing page showed
+        cart_rows = cart_page.get_cart_rows()
+        problems = price_index.verify_rows(cart_rows)
+        assert problems == [], f"Cart prices should match the listing: {problems}"
+        assert total_price == float(price_index.expected_total(cart_rows)), "Total should equal the listing prices"
 
     def test_verify_product_details_in_cart(self, logged_in_driver):
         """TC_014: Verify product details are displayed in cart"""
@@ -77,7 +90,7 @@ class TestAddToCart:
     def test_remove_item_from_cart(self, logged_in_driver):
         """TC_015: Verify removing item from cart"""
         products_page = ProductsPage(logged_in_driver)
-        products_page.add_multiple_products_to_cart(2)
+        products_page.seed_cart(2)
         products_page.click_cart_icon()
         
         cart_page = CartPage(logged_in_driver)
@@ -7,15 +7,18 @@ from pages.login_page import LoginPage
 from pages.products_page import ProductsPage
 from pages.cart_page import CartPage
 from utils.currency_converter import CurrencyConverter
+from utils.session_cache import SessionCache
 from conftest import VALID_USERNAME, VALID_PASSWORD
 
 
 @pytest.fixture
 def logged_in_driver(driver_with_screenshot):
-    """Fixture to login before each test"""
+    """Fixture to login before each test (restores the cached session after the first UI login)"""
     login_page = LoginPage(driver_with_screenshot)
-    login_page.login(VALID_USERNAME, VALID_PASSWORD)
-    return driver_with_screenshot
+    return SessionCache.login(
+        driver_with_screenshot, f"saucedemo:{VALID_USERNAME}",
+        lambda: login_page.login(VALID_USERNAME, VALID_PASSWORD)
+    )
 
 
 class TestCartWithINR:
@@ -48,7 +51,7 @@ class TestCartWithINR:
     def test_cart_total_in_both_currencies(self, logged_in_driver):
         """TC_INR_002: Verify cart total in both USD and INR"""
         products_page = ProductsPage(logged_in_driver)
-        products_page.add_multiple_products_to_cart(3)
+        products_page.seed_cart(3)
         products_page.click_cart_icon()
         
         cart_page = CartPage(logged_in_driver)
@@ -126,7 +129,7 @@ class TestCartWithINR:
         
         # Add all products to cart
         product_count = products_page.get_product_count()
-        products_page.add_multiple_products_to_cart(product_count)
+        products_page.seed_cart(product_count)
         products_page.click_cart_icon()
         
         cart_page = CartPage(logged_in_driver)
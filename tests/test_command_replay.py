@@ -0,0 +1,90 @@
+"""
+Test cases for page objects replayed from recorded WebDriver traffic
+Runs without a browser
+"""
+import pytest
+from selenium.webdriver.remote.command import Command
+from pages.base_page import TEXTS_SCRIPT, BasePage
+from pages.cart_page import CartPage
+from pages.products_page import ProductsPage
+from utils.command_replay import CommandRecorder, CommandRecording, ReplayDriver, ReplayMissError
+
+
+def texts(recording, locator, values):
+    """Record the get_texts() script call for a locator"""
+    params = {"script": TEXTS_SCRIPT, "args": [BasePage.to_css(locator)]}
+    return recording.respond(Command.W3C_EXECUTE_SCRIPT, params, values)
+
+
+@pytest.mark.unit
+class TestCommandReplay:
+
+    def test_calculate_total_price(self):
+        """TC_RPL_001: Verify cart total from replayed cart prices"""
+        recording = texts(CommandRecording(), CartPage.ITEM_PRICES, ["$29.99", "$9.99", "$15.99"])
+        assert CartPage(ReplayDriver(recording)).calculate_total_price() == 55.97
+
+    def test_cart_badge_count(self):
+        """TC_RPL_002: Verify the badge count falls back to 0 without a badge"""
+        empty = CommandRecording().respond_elements(ProductsPage.CART_BADGE, [])
+        assert ProductsPage(ReplayDriver(empty)).get_cart_badge_count() == "0"
+
+        badge = (
+            CommandRecording()
+            .respond_elements(ProductsPage.CART_BADGE, ["badge"])
+            .respond_element(ProductsPage.CART_BADGE, "badge")
+            .respond(Command.GET_ELEMENT_TEXT, {"id": "badge"}, "3")
+        )
+        assert ProductsPage(ReplayDriver(badge)).get_cart_badge_count() == "3"
+
+    def test_add_product_index_bounds(self):
+        """TC_RPL_003: Verify adding by index clicks the right button and rejects bad indexes"""
+        recording = (
+            CommandRecording()
+            .respond_elements(ProductsPage.ADD_TO_CART_BUTTONS, ["first", "second"])
+            .respond(Command.CLICK_ELEMENT, {"id": "second"})
+        )
+        driver = ReplayDriver(recording)
+        products_page = ProductsPage(driver)
+        products_page.add_product_to_cart_by_index(1)
+        assert driver.commands[-1] == Command.CLICK_ELEMENT
+        with pytest.raises(IndexError):
+            products_page.add_product_to_cart_by_index(2)
+        with pytest.raises(ReplayMissError):
+            products_page.add_product_to_cart_by_index(0)
+
+    def test_error_responses(self):
+        """TC_RPL_004: Verify recorded errors are raised as WebDriver exceptions"""
+        recording = CommandRecording().respond_error(
+            Command.FIND_ELEMENT, CommandRecording.find_params(CartPage.PAGE_TITLE), "no such element"
+        )
+        cart_page = CartPage(ReplayDriver(recording))
+        cart_page.wait.timeout = 0
+        assert cart_page.is_cart_page_displayed() is False
+
+    def test_record_save_and_replay(self, tmp_path):
+        """TC_RPL_005: Verify a recorded session replays to the same results"""
+        source = ReplayDriver(texts(CommandRecording(), CartPage.ITEM_PRICES, ["$7.99", "$49.99"]))
+        recorder = CommandRecorder.attach(source)
+        recorded_total = CartPage(source).calculate_total_price()
+        path = str(tmp_path / "cart.json.gz")
+        recorder.save(path)
+
+        replayed = ReplayDriver(path)
+        assert CartPage(replayed).calculate_total_price() == recorded_total == 57.98
+        assert CommandRecording.load(path).calls[0][0] == Command.W3C_EXECUTE_SCRIPT
+
+    def test_repeated_responses_replay_in_order(self):
+        """TC_RPL_006: Verify a call answered A, A, B live replays as A, A, B, then repeats B"""
+        source = ReplayDriver(
+            CommandRecording()
+            .respond(Command.GET_TITLE, value="1")
+            .respond(Command.GET_TITLE, value="1")
+            .respond(Command.GET_TITLE, value="2")
+        )
+        recorder = CommandRecorder.attach(source)
+        live = [source.title for _ in range(3)]
+        replayed = ReplayDriver(recorder.detach())
+        assert live == ["1", "1", "2"]
+        assert [replayed.title for _ in range(4)] == ["1", "1", "2", "2"]
+        assert [call[3] for call in recorder.recording.calls] == [2, 1]
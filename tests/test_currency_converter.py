@@ -0,0 +1,56 @@
+"""
+Test cases for bulk currency conversion
+Runs without a browser
+"""
+import pytest
+from decimal import Decimal
+from utils.currency_converter import CurrencyConverter
+
+
+@pytest.mark.unit
+class TestCurrencyConverter:
+
+    def test_parse_cents_handles_symbols_and_grouping(self):
+        """TC_CUR_001: Verify USD, INR and Indian-grouped prices parse to minor units"""
+        prices = ["$29.99", "₹1,24,999.00", "$1,299.5", "Rs. 500", "-$5.00"]
+        assert CurrencyConverter.parse_cents(prices) == [2999, 12499900, 129950, 50000, -500]
+
+    def test_parse_cents_rejects_non_prices(self):
+        """TC_CUR_002: Verify malformed price strings raise ValueError"""
+        with pytest.raises(ValueError):
+            CurrencyConverter.parse_cents(["$29.99", "free"])
+
+    def test_sum_prices_is_exact(self):
+        """TC_CUR_003: Verify totals over many prices carry no float error"""
+        total = CurrencyConverter.sum_prices(["$0.10"] * 3000)
+        assert total == Decimal("300.00"), "Sum of 3000 x $0.10 should be exactly $300.00"
+
+    def test_convert_batch(self):
+        """TC_CUR_004: Verify batch conversion matches per-item conversion"""
+        prices = ["$29.99", "$9.99", "$15.99"]
+        result = CurrencyConverter.convert_batch(prices, rate=83.0)
+
+        assert result.total == Decimal("55.97")
+        assert result.converted == [Decimal("2489.17"), Decimal("829.17"), Decimal("1327.17")]
+        assert result.converted_total == Decimal("4645.51"), "Total should be converted once, not summed from rounded items"
+        assert result.formatted == [CurrencyConverter.convert_and_format(p) for p in prices]
+
+    def test_convert_cents_rounds_half_up(self):
+        """TC_CUR_005: Verify conversions round half up symmetrically for negative amounts"""
+        assert CurrencyConverter.convert_cents([1, -1, 3], rate="0.5") == [1, -1, 2]
+
+    def test_parse_cents_rejects_doubled_signs(self):
+        """TC_CUR_006: Verify a sign on both sides of the symbol is rejected"""
+        assert CurrencyConverter.parse_cents(["$-5", "- ₹5"]) == [-500, -500]
+        for price in ["-$-5", "--5", "- Rs. -500"]:
+            with pytest.raises(ValueError):
+                CurrencyConverter.parse_cents([price])
+
+    def test_parse_cents_rejects_malformed_grouping(self):
+        """TC_CUR_007: Verify commas must group thousands or follow Indian grouping"""
+        assert CurrencyConverter.parse_cents(["$1,234,567.00", "₹12,34,567.00", "1234"]) == [
+            123456700, 123456700, 123400
+        ]
+        for price in ["1,2,3", "$12,34", "₹1,2345", ",123", "$1,234,56"]:
+            with pytest.raises(ValueError):
+                CurrencyConverter.parse_cents([price])
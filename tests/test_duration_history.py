@@ -0,0 +1,39 @@
+"""
+Test cases for the duration history and the regression check
+Runs without a browser
+"""
+import pytest
+import check_regressions
+from utils.duration_history import DurationHistory
+
+
+TEST = "tests/test_cart.py::TestCart::test_remove"
+
+
+def record_runs(path, runs):
+    """Save one run per (commit, seconds) pair, in order"""
+    history = DurationHistory(str(path))
+    for commit, seconds in runs:
+        for _ in range(3):
+            history.record(TEST, "call", seconds, "passed")
+        history.save(commit, "headless")
+    return history
+
+
+@pytest.mark.unit
+class TestRegressionCheck:
+
+    def test_commits_ordered_by_first_run(self, tmp_path):
+        """TC_DUR_001: Verify re-running an old commit keeps it behind newer commits"""
+        history = record_runs(tmp_path / "history.sqlite", [("aaa", 1.0), ("bbb", 1.0), ("ccc", 1.0), ("aaa", 1.0)])
+        assert history.commits("headless") == ["ccc", "bbb", "aaa"]
+
+    def test_baseline_is_earlier_commits(self, tmp_path, capsys):
+        """TC_DUR_002: Verify an older --commit is compared with the commits before it only"""
+        path = tmp_path / "history.sqlite"
+        record_runs(path, [("aaa", 1.0), ("bbb", 1.0), ("ccc", 5.0)])
+        args = ["--db", str(path), "--profile", "headless"]
+        assert check_regressions.main(args + ["--commit", "bbb"]) == 0
+        assert "vs 1 earlier commits" in capsys.readouterr().out
+        assert check_regressions.main(args) == 1
+        assert check_regressions.main(args + ["--commit", "aaa"]) == 2
@@ -0,0 +1,69 @@
+"""
+Test cases for element handle reuse and stale-element recovery in BasePage
+Runs against the fake DOM driver; no browser needed
+"""
+import pytest
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from utils.fake_dom import FakeDriver
+from utils.wait_engine import WaitEngine
+
+
+LOGIN_HTML = """
+<input id="user-name" type="text"><input id="password" type="password">
+<input id="login-button" type="submit" value="Login">
+"""
+
+HEADER_HTML = '<span class="title">Products</span><a class="shopping_cart_link"><span class="shopping_cart_badge">1</span></a>'
+
+
+@pytest.fixture(autouse=True)
+def element_stats(monkeypatch):
+    """Fresh handle counters, fast negative waits and the cache switched on"""
+    monkeypatch.setattr(WaitEngine, "DEFAULT_TIMEOUT", 0)
+    monkeypatch.setattr(WaitEngine, "POLL_INTERVAL", 0)
+    monkeypatch.setattr(BasePage, "ELEMENT_CACHE", True)
+    monkeypatch.setattr(BasePage, "element_stats", {"hits": 0, "misses": 0, "stale": 0})
+    return BasePage.element_stats
+
+
+@pytest.mark.unit
+class TestElementCache:
+
+    def test_handles_are_reused(self, element_stats):
+        """TC_ECACHE_001: Verify a second login on the same page reuses all three elements"""
+        driver = FakeDriver(LOGIN_HTML)
+        login_page = LoginPage(driver)
+        login_page.login("standard_user", "secret_sauce")
+        assert element_stats == {"hits": 0, "misses": 3, "stale": 0}
+        login_page.login("problem_user", "secret_sauce")
+        assert element_stats == {"hits": 3, "misses": 3, "stale": 0}
+        assert driver.find_element(*LoginPage.USERNAME_INPUT).get_attribute("value") == "problem_user"
+        assert len(driver.clicks) == 2
+
+    def test_stale_handle_recovers_once(self, element_stats):
+        """TC_ECACHE_002: Verify a stale handle is re-looked up transparently"""
+        driver = FakeDriver(HEADER_HTML)
+        products_page = ProductsPage(driver)
+        assert products_page.get_page_title() == "Products"
+        driver.refresh()
+        assert products_page.get_page_title() == "Products"
+        assert element_stats == {"hits": 1, "misses": 1, "stale": 1}
+
+    def test_replaced_element_reads_new_state(self, element_stats):
+        """TC_ECACHE_003: Verify a re-rendered badge is read from the new element"""
+        driver = FakeDriver(HEADER_HTML)
+        products_page = ProductsPage(driver)
+        assert products_page.get_cart_badge_count() == "1"
+        driver.find_element(*ProductsPage.CART_ICON).set_inner_html('<span class="shopping_cart_badge">2</span>')
+        assert products_page.get_cart_badge_count() == "2"
+        assert element_stats["stale"] == 1
+
+    def test_cache_disabled(self, element_stats, monkeypatch):
+        """TC_ECACHE_004: Verify every action looks elements up when the cache is off"""
+        monkeypatch.setattr(BasePage, "ELEMENT_CACHE", False)
+        login_page = LoginPage(FakeDriver(LOGIN_HTML))
+        login_page.login("standard_user", "secret_sauce")
+        login_page.login("standard_user", "secret_sauce")
+        assert element_stats == {"hits": 0, "misses": 0, "stale": 0}
@@ -0,0 +1,89 @@
+"""
+Test cases for exchange rate providers and the rate cache
+Runs without a browser
+"""
+import json
+import time
+import pytest
+from datetime import date
+from decimal import Decimal
+from utils.currency_converter import CurrencyConverter
+from utils.exchange_rates import CachedRates, FileRateProvider, StaticRateProvider
+
+
+RATES = {
+    "USD/INR": {"2023-01-01": 82.0, "2024-01-01": 83.0},
+    "EUR/INR": 90.0,
+}
+
+
+class CountingProvider(StaticRateProvider):
+    """Static provider that counts fetches"""
+
+    def __init__(self, rates):
+        super().__init__(rates)
+        self.fetches = 0
+
+    def fetch(self, base, quote, on_date):
+        self.fetches += 1
+        return super().fetch(base, quote, on_date)
+
+
+@pytest.fixture
+def pinned_rates():
+    """Route CurrencyConverter through the static rates and restore the default afterwards"""
+    CurrencyConverter.use_rates(StaticRateProvider(RATES))
+    yield
+    CurrencyConverter.use_rates(None)
+    CurrencyConverter.RATE_DATE = None
+
+
+@pytest.mark.unit
+class TestExchangeRates:
+
+    def test_rate_effective_on_date(self):
+        """TC_FX_001: Verify the rate in effect on a date is used"""
+        provider = StaticRateProvider(RATES)
+        assert provider.get_rate("USD", "INR", date(2023, 6, 30)) == Decimal("82.0")
+        assert provider.get_rate("USD", "INR", date(2024, 2, 1)) == Decimal("83.0")
+        with pytest.raises(LookupError):
+            provider.get_rate("USD", "INR", date(2022, 12, 31))
+
+    def test_inverse_pair(self):
+        """TC_FX_002: Verify a missing pair falls back to the inverse rate"""
+        provider = StaticRateProvider(RATES)
+        assert provider.get_rate("INR", "EUR", date.today()) * 90 == pytest.approx(Decimal(1))
+
+    def test_file_provider(self, tmp_path):
+        """TC_FX_003: Verify rates load from a JSON file"""
+        rates_file = tmp_path / "rates.json"
+        rates_file.write_text(json.dumps(RATES), encoding="utf-8")
+        provider = FileRateProvider(str(rates_file))
+        assert provider.get_rate("EUR", "INR", date.today()) == Decimal("90.0")
+
+    def test_cache_fetches_once_per_pair_and_date(self):
+        """TC_FX_004: Verify repeated lookups are served from the cache"""
+        provider = CountingProvider(RATES)
+        rates = CachedRates(provider)
+        for _ in range(1000):
+            rates.get("USD", "INR", date(2024, 5, 1))
+        assert provider.fetches == 1
+        assert rates.hits == 999
+
+    def test_expired_rate_refreshes_in_background(self):
+        """TC_FX_005: Verify an expired rate is served immediately and refreshed off-thread"""
+        provider = CountingProvider(RATES)
+        rates = CachedRates(provider, ttl=0)
+        assert rates.get("EUR", "INR") == Decimal("90.0")
+        assert rates.get("EUR", "INR") == Decimal("90.0"), "Stale rate should be returned without waiting"
+        deadline = time.monotonic() + 5
+        while provider.fetches < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert provider.fetches == 2
+
+    def test_converter_uses_provider(self, pinned_rates):
+        """TC_FX_006: Verify conversions use the configured, date-pinned rates"""
+        CurrencyConverter.RATE_DATE = date(2023, 6, 30)
+        assert CurrencyConverter.usd_to_inr(10) == 820.0
+        assert CurrencyConverter.convert_batch(["$10.00"]).converted_total == Decimal("820.00")
+        assert CurrencyConverter.convert("10", "EUR", "INR") == Decimal("900.00")
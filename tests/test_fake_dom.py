@@ -0,0 +1,188 @@
+"""
+Test cases for page objects against the in-memory fake DOM driver
+Runs without a browser
+"""
+import pytest
+from selenium.common.exceptions import InvalidSelectorException, StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from pages.cart_page import CartPage
+from pages.indian_cart_page import IndianCartPage
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from utils.fake_dom import FakeDriver
+from utils.wait_engine import WaitEngine
+
+
+LOGIN_URL = "https://fake.test/"
+INVENTORY_URL = "https://fake.test/inventory.html"
+
+LOGIN_HTML = """
+<form>
+  <input id="user-name" data-test="username" type="text">
+  <input id="password" data-test="password" type="password">
+  <div class="error-message-container"></div>
+  <input id="login-button" type="submit" value="Login">
+</form>
+"""
+
+PRODUCTS = [("Sauce Labs Backpack", "29.99"), ("Sauce Labs Bike Light", "9.99"), ("Sauce Labs Onesie", "7.99")]
+
+INVENTORY_HTML = """
+<div class="primary_header"><a class="shopping_cart_link" href="cart.html"></a></div>
+<span class="title">Products</span>
+<div class="inventory_list">{}</div>
+""".format("".join(
+    f'<div class="inventory_item"><a href="#" id="item_{i}_title_link"><div class="inventory_item_name">{name}</div></a>'
+    f'<div class="pricebar"><div class="inventory_item_price">${price}</div>'
+    f'<button id="add-to-cart-{i}">Add to cart</button></div></div>'
+    for i, (name, price) in enumerate(PRODUCTS)
+))
+
+CART_HTML = """
+<span class="title">Your Cart</span>
+<div class="cart_list">{}</div>
+""".format("".join(
+    f'<div class="cart_item"><div class="cart_quantity">1</div><div class="inventory_item_name">{name}</div>'
+    f'<div class="inventory_item_price">${price}</div><button id="remove-{i}">Remove</button></div>'
+    for i, (name, price) in enumerate(PRODUCTS)
+))
+
+
+@pytest.fixture(autouse=True)
+def static_waits(monkeypatch):
+    """A static DOM never changes while waiting, so negative waits fail fast"""
+    monkeypatch.setattr(WaitEngine, "DEFAULT_TIMEOUT", 0)
+    monkeypatch.setattr(WaitEngine, "POLL_INTERVAL", 0)
+
+
+def login_handler(driver, element):
+    """Stand-in for the storefront's login logic"""
+    if driver.find_element(By.ID, "password").get_attribute("value") == "secret_sauce":
+        driver.get(INVENTORY_URL)
+    else:
+        driver.find_element(By.CLASS_NAME, "error-message-container").set_inner_html(
+            '<h3 data-test="error">Epic sadface: Username and password do not match</h3>'
+        )
+
+
+def add_to_cart_handler(driver, element):
+    """Flip the button to Remove and update the badge"""
+    element.set_attribute("id", element.get_attribute("id").replace("add-to-cart", "remove"))
+    count = len(driver.find_elements(By.CSS_SELECTOR, "button[id^='remove']"))
+    driver.find_element(By.CLASS_NAME, "shopping_cart_link").set_inner_html(
+        f'<span class="shopping_cart_badge">{count}</span>'
+    )
+
+
+@pytest.fixture
+def storefront():
+    """Fake driver on the login page with login and add-to-cart behaviour"""
+    driver = FakeDriver(url=LOGIN_URL, pages={LOGIN_URL: LOGIN_HTML, INVENTORY_URL: INVENTORY_HTML})
+    driver.on_click(LoginPage.LOGIN_BUTTON, login_handler)
+    driver.on_click(ProductsPage.ADD_TO_CART_BUTTONS, add_to_cart_handler)
+    return driver
+
+
+@pytest.mark.unit
+class TestFakeDom:
+
+    def test_login(self, storefront):
+        """TC_FDOM_001: Verify login fills both fields and reaches the products page"""
+        LoginPage(storefront).login("standard_user", "secret_sauce")
+        assert storefront.current_url == INVENTORY_URL
+        assert ProductsPage(storefront).is_products_page_displayed()
+
+    def test_login_error(self, storefront):
+        """TC_FDOM_002: Verify the error message after a bad password"""
+        login_page = LoginPage(storefront)
+        assert not login_page.is_error_displayed()
+        login_page.login("standard_user", "wrong")
+        assert login_page.is_error_displayed()
+        assert "do not match" in login_page.get_error_message()
+
+    def test_product_listing_and_cart_badge(self, storefront):
+        """TC_FDOM_003: Verify listing reads, badge fallback and add-by-index bounds"""
+        storefront.get(INVENTORY_URL)
+        products_page = ProductsPage(storefront)
+        assert products_page.get_product_names() == [name for name, _ in PRODUCTS]
+        assert products_page.get_product_rows()[1]["price"] == "$9.99"
+        assert products_page.get_cart_badge_count() == "0"
+
+        products_page.add_multiple_products_to_cart(2)
+        assert products_page.get_cart_badge_count() == "2"
+        with pytest.raises(IndexError):
+            products_page.add_product_to_cart_by_index(len(PRODUCTS))
+
+    def test_cart_total_and_removal(self):
+        """TC_FDOM_004: Verify cart totals and removal through the cart page"""
+        driver = FakeDriver(CART_HTML)
+        driver.on_click(CartPage.REMOVE_BUTTONS, lambda driver, element: driver.find_elements(*CartPage.CART_ITEMS)[0].remove())
+        cart_page = CartPage(driver)
+        assert cart_page.calculate_total_price() == 47.97
+        cart_page.remove_item_by_index(0)
+        assert cart_page.get_cart_item_count() == 2
+        assert not cart_page.is_cart_empty()
+
+    def test_selectors(self):
+        """TC_FDOM_005: Verify the selector forms used by the page locators"""
+        driver = FakeDriver(INVENTORY_HTML + '<div class="cart-item"><button class="remove-btn" id="r1">x</button></div>')
+        assert len(driver.find_elements(*ProductsPage.ADD_TO_CART_BUTTONS)) == 3
+        assert len(driver.find_elements(*ProductsPage.PRODUCT_LINKS)) == 3
+        assert driver.find_element(*IndianCartPage.REMOVE_BUTTONS).get_attribute("id") == "r1"
+        assert len(driver.find_elements(By.CSS_SELECTOR, ".inventory_list > .inventory_item")) == 3
+        assert len(driver.find_elements(By.CSS_SELECTOR, ".inventory_list > button")) == 0
+        with pytest.raises(InvalidSelectorException):
+            driver.find_elements(By.CSS_SELECTOR, "div:first-child")
+
+    def test_stale_after_reload(self, storefront):
+        """TC_FDOM_006: Verify element references go stale when the page reloads"""
+        username = storefront.find_element(*LoginPage.USERNAME_INPUT)
+        username.send_keys("standard_user")
+        storefront.refresh()
+        with pytest.raises(StaleElementReferenceException):
+            username.get_attribute("value")
+        assert storefront.find_element(*LoginPage.USERNAME_INPUT).get_attribute("value") == ""
+
+    def test_seed_cart(self, storefront):
+        """TC_FDOM_007: Verify seed_cart writes the listed product ids and checks the badge"""
+        def render_cart():
+            ids = storefront.local_storage.get(ProductsPage.CART_STORAGE_KEY) or []
+            badge = f'<span class="shopping_cart_badge">{len(ids)}</span>' if ids else ""
+            storefront.pages[INVENTORY_URL] = INVENTORY_HTML.replace('href="cart.html">', f'href="cart.html">{badge}')
+            FakeDriver.refresh(storefront)
+
+        storefront.refresh = render_cart
+        storefront.get(INVENTORY_URL)
+        products_page = ProductsPage(storefront)
+        assert products_page.seed_cart(2) == [0, 1]
+        assert storefront.local_storage[ProductsPage.CART_STORAGE_KEY] == [0, 1]
+        assert products_page.get_cart_badge_count() == "2"
+
+    def test_seed_cart_needs_listed_products(self):
+        """TC_FDOM_008: Verify seed_cart fails when fewer products are listed than requested"""
+        products_page = ProductsPage(FakeDriver(INVENTORY_HTML, INVENTORY_URL))
+        with pytest.raises(RuntimeError, match="3 products listed, 4 requested"):
+            products_page.seed_cart(4)
+        empty_page = ProductsPage(FakeDriver('<span class="title">Products</span>', INVENTORY_URL))
+        with pytest.raises(RuntimeError, match="0 products listed"):
+            empty_page.seed_cart(2)
+
+    def test_page_cache_shared_across_pages(self, storefront):
+        """TC_FDOM_009: Verify an action through one page object invalidates cached reads of another"""
+        storefront.get(INVENTORY_URL)
+        reader, actor = ProductsPage(storefront, cache="actions"), ProductsPage(storefront, cache="actions")
+        actor.add_product_to_cart_by_index(0)
+        assert reader.get_cart_badge_count() == "1"
+        actor.add_product_to_cart_by_index(1)
+        assert reader.get_cart_badge_count() == "2"
+
+    def test_login_absence_checks(self, storefront):
+        """TC_FDOM_010: Verify the login page's absence checks before and after logging in"""
+        login_page = LoginPage(storefront)
+        assert login_page.is_error_absent()
+        assert not login_page.has_left_login_page()
+        login_page.login("standard_user", "wrong")
+        assert not login_page.is_error_absent()
+        login_page.login("standard_user", "secret_sauce")
+        assert login_page.has_left_login_page()
+        assert login_page.is_error_absent()
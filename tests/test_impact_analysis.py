@@ -0,0 +1,135 @@
+"""
+Test cases for test impact analysis
+Builds the dependency map of a small throwaway project; runs without a browser
+"""
+import textwrap
+import pytest
+from utils.test_impact import ImpactMap
+
+
+SOURCES = {
+    "conftest.py": """
+        import pytest
+        from utils.report import write_report
+        from utils.retry import should_retry
+
+
+        @pytest.fixture
+        def driver():
+            return object()
+
+
+        def pytest_sessionfinish(session):
+            write_report(session)
+
+
+        def pytest_runtest_protocol(item, nextitem):
+            return should_retry(item)
+    """,
+    "utils/report.py": """
+        def write_report(session):
+            return session
+    """,
+    "utils/retry.py": """
+        def should_retry(item):
+            return None
+    """,
+    "pages/base_page.py": """
+        class BasePage:
+            def __init__(self, driver):
+                self.driver = driver
+
+            def click(self, locator):
+                return locator
+    """,
+    "pages/cart_page.py": """
+        from pages.base_page import BasePage
+
+
+        class CartPage(BasePage):
+            REMOVE_BUTTONS = ("css selector", ".remove")
+            ITEM_PRICES = ("class name", "price")
+
+            def remove_first(self):
+                self.click(self.REMOVE_BUTTONS)
+
+            def get_prices(self):
+                return self.ITEM_PRICES
+    """,
+    "utils/money.py": """
+        def parse(text):
+            return float(text)
+    """,
+    "tests/test_cart.py": """
+        from pages.cart_page import CartPage
+        from utils.money import parse
+
+
+        class TestCart:
+            def test_remove(self, driver):
+                cart_page = CartPage(driver)
+                cart_page.remove_first()
+
+            def test_prices(self, driver):
+                cart_page = CartPage(driver)
+                assert [parse(p) for p in cart_page.get_prices()]
+    """,
+}
+
+REMOVE = "tests/test_cart.py::TestCart::test_remove"
+PRICES = "tests/test_cart.py::TestCart::test_prices"
+
+
+@pytest.fixture
+def impact_map(tmp_path):
+    """ImpactMap over the throwaway project"""
+    for path, source in SOURCES.items():
+        target = tmp_path / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(textwrap.dedent(source).lstrip(), encoding="utf-8")
+    return ImpactMap(str(tmp_path))
+
+
+def line_of(path, text):
+    """1-based line number of the first line containing text"""
+    lines = textwrap.dedent(SOURCES[path]).lstrip().splitlines()
+    return next(i for i, line in enumerate(lines, 1) if text in line)
+
+
+@pytest.mark.unit
+class TestImpactAnalysis:
+
+    def test_dependency_map(self, impact_map):
+        """TC_TIA_001: Verify tests map to the locators and methods they reach"""
+        assert "CartPage.REMOVE_BUTTONS" in impact_map.describe(REMOVE)
+        assert "BasePage.click" in impact_map.describe(REMOVE)
+        assert "CartPage.REMOVE_BUTTONS" not in impact_map.describe(PRICES)
+        assert "utils.money.parse" in impact_map.describe(PRICES)
+
+    def test_locator_change_selects_its_users(self, impact_map):
+        """TC_TIA_002: Verify a locator change selects only tests using it"""
+        line = line_of("pages/cart_page.py", "REMOVE_BUTTONS =")
+        assert impact_map.impacted({"pages/cart_page.py": {line}}) == {REMOVE}
+
+    def test_base_class_change_selects_callers(self, impact_map):
+        """TC_TIA_003: Verify inherited method changes reach subclasses' callers"""
+        line = line_of("pages/base_page.py", "return locator")
+        assert impact_map.impacted({"pages/base_page.py": {line}}) == {REMOVE}
+        line = line_of("pages/base_page.py", "self.driver = driver")
+        assert impact_map.impacted({"pages/base_page.py": {line}}) == {REMOVE, PRICES}
+
+    def test_util_change(self, impact_map):
+        """TC_TIA_004: Verify util changes select tests calling them"""
+        assert impact_map.impacted({"utils/money.py": None}) == {PRICES}
+
+    def test_unanalysable_changes(self, impact_map):
+        """TC_TIA_005: Verify non-code changes select everything and docs select nothing"""
+        assert impact_map.impacted({"demo_site/cart.html": None}) == {REMOVE, PRICES}
+        assert impact_map.impacted({"README.md": None}) == set()
+
+    def test_conftest_hooks(self, impact_map):
+        """TC_TIA_006: Verify reporting-only conftest utils select nothing, per-test hooks select everything"""
+        assert impact_map.impacted({"utils/report.py": None}) == set()
+        assert impact_map.impacted({"utils/retry.py": None}) == {REMOVE, PRICES}
+        line = line_of("conftest.py", "write_report(session)")
+        assert impact_map.impacted({"conftest.py": {line}}) == {REMOVE, PRICES}
@@ -7,27 +7,32 @@ import os
 from pages.indian_login_page import IndianLoginPage
 from pages.indian_products_page import IndianProductsPage
 from pages.indian_cart_page import IndianCartPage
+from utils.price_consistency import PriceIndex
+from utils.session_cache import SessionCache
 
 
 # Test data for Indian demo
 INDIAN_DEMO_URL = "file:///" + os.path.abspath("demo_site/indian_ecommerce.html").replace("\\", "/")
-VALID_USERNAME = "***"
-VALID_PASSWORD = "****"
+VALID_USERNAME = "test_user"
+VALID_PASSWORD = "test123"
 
 
 @pytest.fixture
-def indian_driver(driver_with_screenshot):
-    """Setup driver for Indian demo site"""
-    driver_with_screenshot.get(INDIAN_DEMO_URL)
+def indian_driver(driver_with_screenshot, local_storefront):
+    """Setup driver for Indian demo site (served over HTTP with --local-storefront)"""
+    driver_with_screenshot.get(local_storefront.indian_url if local_storefront else INDIAN_DEMO_URL)
     return driver_with_screenshot
 
 
 @pytest.fixture
 def logged_in_indian_driver(indian_driver):
-    """Fixture to login to Indian demo before each test"""
+    """Fixture to login to Indian demo before each test (restores the cached session after the first UI login)"""
     login_page = IndianLoginPage(indian_driver)
-    login_page.login(VALID_USERNAME, VALID_PASSWORD)
-    return indian_driver
+    return SessionCache.login(
+        indian_driver, f"indian-demo:{VALID_USERNAME}",
+        lambda: login_page.login(VALID_USERNAME, VALID_PASSWORD),
+        verify=lambda driver: IndianProductsPage(driver).is_products_page_displayed()
+    )
 
 
 class TestIndianLogin:
@@ -111,7 +116,10 @@ class TestIndianCart:
     def test_cart_total_calculation_in_rupees(self, logged_in_indian_driver):
         """TC_IND_008: Verify cart total is calculated correctly in rupees"""
         products_page = IndianProductsPage(logged_in_indian_driver)
-        products_page.add_multiple_products_to_cart(2)
+        price_index = PriceIndex.for_session(
+            "indian", lambda: PriceIndex.from_rows(products_page.get_product_rows())
+        )
+        products_page.seed_cart(2)
         products_page.click_cart_icon()
         
         cart_page = IndianCartPage(logged_in_indian_driver)
@@ -123,11 +131,15 @@ class TestIndianCart:
         # Verify total amount display has ₹ symbol
         total_display = cart_page.get_total_amount()
         assert "₹" in total_display, "Total amount should display ₹ symbol"
+        
+        # Cart rows and displayed total must match the listing page prices
+        problems = price_index.verify_total(cart_page.get_cart_rows(), total_display)
+        assert problems == [], f"Cart should match listing prices: {problems}"
 
     def test_remove_item_from_cart(self, logged_in_indian_driver):
         """TC_IND_009: Verify removing item from cart"""
         products_page = IndianProductsPage(logged_in_indian_driver)
-        products_page.add_multiple_products_to_cart(2)
+        products_page.seed_cart(2)
         products_page.click_cart_icon()
         
         cart_page = IndianCartPage(logged_in_indian_driver)
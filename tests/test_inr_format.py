@@ -0,0 +1,54 @@
+"""
+Test cases for Indian numbering (lakh/crore) formatting and parsing
+Runs without a browser
+"""
+import random
+import pytest
+from decimal import Decimal
+from utils.currency_converter import CurrencyConverter
+from utils.inr_format import format_inr, format_paise, format_paise_batch, group_indian, parse_inr, parse_paise
+
+
+@pytest.mark.unit
+class TestINRFormat:
+
+    @pytest.mark.parametrize("rupees, expected", [
+        (0, "0"),
+        (999, "999"),
+        (1000, "1,000"),
+        (99999, "99,999"),
+        (100000, "1,00,000"),
+        (100050, "1,00,050"),
+        (1234567, "12,34,567"),
+        (10000000, "1,00,00,000"),
+        (123456789012, "1,23,45,67,89,012"),
+    ])
+    def test_group_indian(self, rupees, expected):
+        """TC_INRF_001: Verify lakh/crore digit grouping"""
+        assert group_indian(rupees) == expected
+
+    def test_format_inr(self):
+        """TC_INRF_002: Verify rupee formatting rounds half up to paise"""
+        assert format_inr(1234567.891) == "₹12,34,567.89"
+        assert format_inr("0.005") == "₹0.01"
+        assert format_inr(-124999) == "-₹1,24,999.00"
+        assert CurrencyConverter.format_inr(124999) == "₹1,24,999.00"
+
+    def test_parse_inr(self):
+        """TC_INRF_003: Verify Indian-grouped strings parse exactly"""
+        assert parse_inr("₹12,34,567.89") == Decimal("1234567.89")
+        assert parse_paise("Rs. 500") == 50000
+        assert parse_paise("₹1,24,999.5") == 12499950
+
+    def test_parse_inr_rejects_western_grouping(self):
+        """TC_INRF_004: Verify 1,234,567.89 style grouping is rejected"""
+        with pytest.raises(ValueError):
+            parse_paise("₹1,234,567.89")
+
+    def test_round_trip(self):
+        """TC_INRF_005: Verify format and parse round-trip for random amounts"""
+        rng = random.Random(17)
+        values = [rng.randint(-10 ** 14, 10 ** 14) for _ in range(5000)] + [0, 99, 10000000]
+        formatted = format_paise_batch(values)
+        assert formatted == [format_paise(v) for v in values]
+        assert [parse_paise(text) for text in formatted] == values
@@ -0,0 +1,84 @@
+"""
+Test cases for the locator registry and selector compiler
+Runs against HTML snapshots with the fake DOM; no browser needed
+"""
+import pytest
+from selenium.webdriver.common.by import By
+from pages.cart_page import CartPage
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from utils.action_timing import ActionTimer
+from utils.fake_dom import FakeDriver
+from utils.locator_registry import LocatorAudit, LocatorEntry, audit, discover
+
+
+INVENTORY_SNAPSHOT = (
+    '<span class="title">Products</span><div id="shopping_cart_container">'
+    '<a class="shopping_cart_link" data-test="shopping-cart-link" href="cart.html"></a></div>'
+    '<div class="inventory_list">'
+    + "".join(
+        f'<div class="inventory_item"><div class="inventory_item_name">P{i}</div><div class="pricebar">'
+        f'<button class="btn_inventory" id="add-to-cart-p{i}">Add</button><button id="details-{i}">i</button></div></div>'
+        for i in range(20)
+    )
+    + "</div>"
+)
+
+
+def entry(page_cls, name, usage):
+    """Registry entry for a page attribute"""
+    return LocatorEntry(page_cls.__name__, name, getattr(page_cls, name), page_cls.__module__, usage)
+
+
+@pytest.mark.unit
+class TestLocatorRegistry:
+
+    def test_discover(self):
+        """TC_LOC_001: Verify every page locator is registered with how it is used"""
+        entries = {(e.page, e.name): e for e in discover()}
+        assert entries[("ProductsPage", "ADD_TO_CART_BUTTONS")].usage == "multiple"
+        assert entries[("LoginPage", "LOGIN_BUTTON")].usage == "single"
+        assert entries[("CartPage", "CART_FIELDS.button_id")].locator == (By.TAG_NAME, "button")
+        assert {page for page, _ in entries} >= {"LoginPage", "ProductsPage", "CartPage", "IndianCartPage"}
+
+    def test_rewrites(self):
+        """TC_LOC_002: Verify locators compile to an ID or a narrower CSS selector"""
+        checker = LocatorAudit(INVENTORY_SNAPSHOT, repeat=5)
+        add = checker.check(entry(ProductsPage, "ADD_TO_CART_BUTTONS", "multiple"))
+        assert add["status"] == "ok" and add["matches"] == 20
+        assert add["rewrite"] == [By.CSS_SELECTOR, "button[id^='add-to-cart'].btn_inventory"]
+
+        cart_icon = checker.check(entry(ProductsPage, "CART_ICON", "single"))
+        assert cart_icon["rewrite"] is None
+
+        title = checker.check(entry(ProductsPage, "PAGE_TITLE", "single"))
+        assert title["status"] == "ok" and title["rewrite"] is None
+
+    def test_ambiguous_and_absent(self):
+        """TC_LOC_003: Verify single-element locators matching several elements are flagged"""
+        checker = LocatorAudit('<input class="form_input" id="user-name"><span class="title">a</span>'
+                               '<span class="title">b</span>', repeat=5)
+        assert checker.check(entry(ProductsPage, "PAGE_TITLE", "single"))["status"] == "ambiguous"
+        assert checker.check(entry(LoginPage, "ERROR_MESSAGE", "single"))["status"] == "absent"
+        assert checker.check(entry(LoginPage, "USERNAME_INPUT", "single"))["rewrite"] is None
+        invalid = LocatorEntry("LoginPage", "BAD", (By.XPATH, "//h3"), "pages.login_page", "single")
+        assert checker.check(invalid)["status"] == "invalid"
+
+    def test_audit_snapshot_dir(self, tmp_path):
+        """TC_LOC_004: Verify the audit uses <PageClass>.html snapshots and browser timings"""
+        (tmp_path / "ProductsPage.html").write_text(INVENTORY_SNAPSHOT, encoding="utf-8")
+        entries = [entry(ProductsPage, "ADD_TO_CART_BUTTONS", "multiple"), entry(CartPage, "CART_ITEMS", "multiple")]
+        timings = {"locators": [
+            {"page": "ProductsPage", "action": "find_elements", "mean_ms": 400.0,
+             "locator": "css selector=button[id^='add-to-cart']"},
+        ]}
+        results = audit(entries, str(tmp_path), repeat=5, live_timings=timings)
+        assert [r["name"] for r in results] == ["ADD_TO_CART_BUTTONS"]
+        assert results[0]["live_ms"] == 400.0 and results[0]["slow"]
+
+    def test_snapshot_page_tracked_without_timings(self, monkeypatch):
+        """TC_LOC_005: Verify the page naming a DOM snapshot is tracked with action timings off"""
+        monkeypatch.setattr(ActionTimer, "enabled", False)
+        monkeypatch.setattr(ActionTimer, "last_page", None)
+        ProductsPage(FakeDriver(INVENTORY_SNAPSHOT)).get_page_title()
+        assert ActionTimer.last_page == "ProductsPage"
@@ -5,20 +5,23 @@ Verifies user can successfully logout
 import pytest
 from pages.login_page import LoginPage
 from pages.products_page import ProductsPage
-from conftest import VALID_USERNAME, VALID_PASSWORD, BASE_URL
+from utils.session_cache import SessionCache
+from conftest import VALID_USERNAME, VALID_PASSWORD
 
 
 @pytest.fixture
 def logged_in_driver(driver_with_screenshot):
-    """Fixture to login before each test"""
+    """Fixture to login before each test (restores the cached session after the first UI login)"""
     login_page = LoginPage(driver_with_screenshot)
-    login_page.login(VALID_USERNAME, VALID_PASSWORD)
-    return driver_with_screenshot
+    return SessionCache.login(
+        driver_with_screenshot, f"saucedemo:{VALID_USERNAME}",
+        lambda: login_page.login(VALID_USERNAME, VALID_PASSWORD)
+    )
 
 
 class TestLogout:
     
-    def test_logout_successfully(self, logged_in_driver):
+    def test_logout_successfully(self, logged_in_driver, base_url):
         """TC_017: Verify logout functionality"""
         products_page = ProductsPage(logged_in_driver)
         assert products_page.is_products_page_displayed(), "User should be logged in"
@@ -27,7 +30,7 @@ class TestLogout:
         
         login_page = LoginPage(logged_in_driver)
         assert login_page.is_login_page(), "Should be redirected to login page"
-        assert logged_in_driver.current_url == BASE_URL, "URL should be login page URL"
+        assert logged_in_driver.current_url == base_url, "URL should be login page URL"
 
     def test_logout_and_relogin(self, logged_in_driver):
         """TC_018: Verify logout and re-login workflow"""
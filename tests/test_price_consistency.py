@@ -0,0 +1,83 @@
+"""
+Test cases for the listing/cart price consistency engine
+Runs without a browser
+"""
+import pytest
+from decimal import Decimal
+from utils.price_consistency import PriceIndex
+
+
+LISTING = [
+    {"name": "Sauce Labs Backpack", "price": "$29.99", "button_id": "add-to-cart-sauce-labs-backpack"},
+    {"name": "Sauce Labs Bike Light", "price": "$9.99", "button_id": "add-to-cart-sauce-labs-bike-light"},
+]
+
+INDIAN_LISTING = [
+    {"name": "Samsung Galaxy S23 Ultra", "price": "₹1,24,999.00"},
+    {"name": "JBL Flip 6 Bluetooth Speaker", "price": "₹11,999.00"},
+]
+
+
+@pytest.mark.unit
+class TestPriceConsistency:
+
+    def test_matching_cart_has_no_problems(self):
+        """TC_PC_001: Verify cart rows matching the listing pass"""
+        index = PriceIndex.from_rows(LISTING)
+        cart = [{"name": "Sauce Labs Bike Light", "price": "$9.99", "quantity": "1"}]
+        assert index.verify_rows(cart) == []
+        assert index.expected_total(LISTING) == Decimal("39.98")
+
+    def test_price_mismatch_and_unknown_product(self):
+        """TC_PC_002: Verify changed prices and unknown products are reported"""
+        index = PriceIndex.from_rows(LISTING)
+        cart = [
+            {"name": "Sauce Labs Backpack", "price": "$31.99"},
+            {"name": "Sauce Labs Onesie", "price": "$7.99"},
+        ]
+        problems = index.verify_rows(cart)
+        assert len(problems) == 2
+        assert "Sauce Labs Backpack" in problems[0] and "Sauce Labs Onesie" in problems[1]
+
+    def test_displayed_inr_total(self):
+        """TC_PC_003: Verify an Indian-grouped displayed total is checked against the listing"""
+        index = PriceIndex.from_rows(INDIAN_LISTING)
+        assert index.verify_total(INDIAN_LISTING, "₹1,36,998.00") == []
+        assert len(index.verify_total(INDIAN_LISTING, "₹1,36,999.00")) == 1
+
+    def test_conflicting_listing_prices(self):
+        """TC_PC_004: Verify a product listed at two prices is rejected"""
+        with pytest.raises(ValueError):
+            PriceIndex.from_rows(LISTING + [{"name": "Sauce Labs Backpack", "price": "$19.99"}])
+
+    def test_index_captured_once_per_session(self):
+        """TC_PC_005: Verify the listing is read only once per storefront"""
+        calls = []
+        loader = lambda: calls.append(1) or PriceIndex.from_rows(LISTING)
+        try:
+            first = PriceIndex.for_session("unit-test", loader)
+            assert PriceIndex.for_session("unit-test", loader) is first
+            assert len(calls) == 1
+        finally:
+            PriceIndex.clear_session()
+
+    def test_quantities_count_in_totals(self):
+        """TC_PC_006: Verify a row with quantity > 1 counts that many times in the total"""
+        index = PriceIndex.from_rows(LISTING)
+        cart = [
+            {"name": "Sauce Labs Backpack", "price": "$29.99", "quantity": "2"},
+            {"name": "Sauce Labs Bike Light", "price": "$9.99", "quantity": "1"},
+        ]
+        assert index.expected_total(cart) == Decimal("69.97")
+        assert index.verify_total(cart, "$69.97") == []
+        assert len(index.verify_total(cart, "$39.98")) == 1
+        assert "invalid quantity" in index.verify_rows([dict(cart[0], quantity="0")])[0]
+
+    def test_unknown_product_in_total(self):
+        """TC_PC_007: Verify a product missing from the listing is reported, not counted as 0"""
+        index = PriceIndex.from_rows(LISTING)
+        cart = [{"name": "Sauce Labs Onesie", "price": "$7.99"}]
+        with pytest.raises(ValueError, match="Sauce Labs Onesie"):
+            index.expected_total(cart)
+        problems = index.verify_total(cart, "$0.00")
+        assert problems == ["'Sauce Labs Onesie' is not on the listing page"]
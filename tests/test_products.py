@@ -5,15 +5,18 @@ Verifies product listing and display
 import pytest
 from pages.login_page import LoginPage
 from pages.products_page import ProductsPage
+from utils.session_cache import SessionCache
 from conftest import VALID_USERNAME, VALID_PASSWORD
 
 
 @pytest.fixture
 def logged_in_driver(driver_with_screenshot):
-    """Fixture to login before each test"""
+    """Fixture to login before each test (restores the cached session after the first UI login)"""
     login_page = LoginPage(driver_with_screenshot)
-    login_page.login(VALID_USERNAME, VALID_PASSWORD)
-    return driver_with_screenshot
+    return SessionCache.login(
+        driver_with_screenshot, f"saucedemo:{VALID_USERNAME}",
+        lambda: login_page.login(VALID_USERNAME, VALID_PASSWORD)
+    )
 
 
 class TestProducts:
@@ -0,0 +1,47 @@
+"""
+Test cases for background screenshot writes
+Runs without a browser
+"""
+import base64
+import pytest
+from utils.screenshot import Screenshot
+
+
+class StubDriver:
+    """Driver returning a fixed screenshot payload"""
+
+    def __init__(self, png_base64):
+        self.png_base64 = png_base64
+        self.page_source = "<html></html>"
+
+    def get_screenshot_as_base64(self):
+        return self.png_base64
+
+    def get_log(self, kind):
+        return []
+
+
+@pytest.fixture
+def screenshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(Screenshot, "SCREENSHOT_DIR", str(tmp_path))
+    monkeypatch.setattr(Screenshot, "_store", None)
+    monkeypatch.setattr(Screenshot, "failures", [])
+    yield tmp_path
+    Screenshot._store = None
+
+
+@pytest.mark.unit
+class TestScreenshot:
+
+    def test_background_write(self, screenshot_dir):
+        """TC_SHOT_001: Verify queued captures are stored once wait_for_pending returns"""
+        Screenshot.capture(StubDriver(base64.b64encode(b"not really a png").decode()), "test_one")
+        written = Screenshot.wait_for_pending()
+        assert len(written) == 1 and written[0].startswith(str(screenshot_dir))
+        assert Screenshot.failures == []
+
+    def test_failed_write_is_reported_not_raised(self, screenshot_dir):
+        """TC_SHOT_002: Verify a decoding error in a worker does not abort session teardown"""
+        Screenshot.capture(StubDriver("abc"), "test_broken")
+        assert Screenshot.wait_for_pending() == []
+        assert len(Screenshot.failures) == 1 and Screenshot.failures[0].startswith("Error:")
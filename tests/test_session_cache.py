@@ -0,0 +1,77 @@
+"""
+Test cases for the authenticated session cache
+Runs without a browser
+"""
+import pytest
+from utils.fake_dom import FakeDriver
+from utils.session_cache import CAPTURE_STORAGE_SCRIPT, RESTORE_STORAGE_SCRIPT, SessionCache
+
+
+LOGIN = "<html><body><form id='login'></form></body></html>"
+INVENTORY = "<html><body><div class='inventory_list'></div></body></html>"
+
+
+class CookieDriver(FakeDriver):
+    """FakeDriver with a cookie jar, like a browser on an http(s) page"""
+
+    def __init__(self, site):
+        super().__init__(LOGIN, site, pages={f"{site}inventory.html": INVENTORY})
+        self.cookies = []
+        self.scripts[CAPTURE_STORAGE_SCRIPT] = lambda: {"local": {}, "session": {}}
+        self.scripts[RESTORE_STORAGE_SCRIPT] = lambda snapshot: None
+
+    def get_cookies(self):
+        return list(self.cookies)
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+    def delete_all_cookies(self):
+        self.cookies = []
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    SessionCache.clear()
+    yield
+    SessionCache.clear()
+
+
+def log_in(driver, site, logins):
+    """Cached login that counts UI logins"""
+    def ui_login():
+        logins.append(site)
+        driver.cookies.append({"name": "session-username", "value": "standard_user"})
+        driver.get(f"{site}inventory.html")
+    return SessionCache.login(driver, "demo:standard_user", ui_login)
+
+
+@pytest.mark.unit
+class TestSessionCache:
+
+    def test_restores_cached_session(self):
+        """TC_SES_001: Verify the second login on an http origin restores the session"""
+        site = "http://127.0.0.1:8000/"
+        logins = []
+        log_in(CookieDriver(site), site, logins)
+        driver = log_in(CookieDriver(site), site, logins)
+        assert logins == [site]
+        assert driver.current_url == f"{site}inventory.html"
+
+    def test_file_urls_skip_the_cache(self):
+        """TC_SES_002: Verify file:// pages log in through the UI without a failed restore"""
+        site = "file:///demo_site/indian/"
+        logins = []
+        for _ in range(2):
+            driver = log_in(CookieDriver(site), site, logins)
+            assert driver.cookies == [{"name": "session-username", "value": "standard_user"}]
+        assert logins == [site, site]
+        assert SessionCache._snapshots == {}
+
+    def test_key_includes_origin(self):
+        """TC_SES_003: Verify storefronts on different origins do not share a session"""
+        local, remote = "http://127.0.0.1:8000/", "https://www.saucedemo.com/"
+        logins = []
+        log_in(CookieDriver(local), local, logins)
+        log_in(CookieDriver(remote), remote, logins)
+        assert logins == [local, remote]
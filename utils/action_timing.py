@@ -0,0 +1,125 @@
+"""
+Page action timing
+Records the latency of every BasePage operation by locator, page class and
+calling test, and writes per-test and per-locator histograms as JSON
+"""
+import functools
+import json
+import os
+from bisect import bisect_left
+from time import perf_counter_ns
+
+
+# Histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+_BUCKET_BOUNDS_NS = tuple(ms * 1_000_000 for ms in BUCKETS_MS)
+_BUCKET_LABELS = [f"<={ms}ms" for ms in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"]
+
+
+class ActionTimer:
+    # Disabled with --no-action-timings
+    enabled = True
+
+    # Node ID of the running test, set by conftest
+    current_test = None
+
+    # Page class of the latest page action, tracked even when timing is
+    # disabled (names --dom-snapshots files)
+    last_page = None
+
+    # key -> [count, total_ns, max_ns, bucket counts]
+    _by_test = {}
+    _by_locator = {}
+    _depth = 0
+
+    @classmethod
+    def record(cls, page, action, locator, elapsed_ns):
+        """Add one measured call to the per-test and per-locator aggregates"""
+        bucket = bisect_left(_BUCKET_BOUNDS_NS, elapsed_ns)
+        locator_key = (page, action, f"{locator[0]}={locator[1]}" if locator else "")
+        for table, key in ((cls._by_test, cls.current_test), (cls._by_locator, locator_key)):
+            stats = table.get(key)
+            if stats is None:
+                stats = table[key] = [0, 0, 0, [0] * len(_BUCKET_LABELS)]
+            stats[0] += 1
+            stats[1] += elapsed_ns
+            if elapsed_ns > stats[2]:
+                stats[2] = elapsed_ns
+            stats[3][bucket] += 1
+
+    @classmethod
+    def reset(cls):
+        """Drop all recorded timings"""
+        cls._by_test.clear()
+        cls._by_locator.clear()
+
+    @classmethod
+    def has_records(cls):
+        """True once at least one action was timed"""
+        return bool(cls._by_test)
+
+    @classmethod
+    def summary(cls):
+        """
+        Aggregated timings
+
+        Returns:
+            dict: {"tests": {node_id: stats}, "locators": [stats with page/action/locator]}
+        """
+        return {
+            "buckets": _BUCKET_LABELS,
+            "tests": {str(test): _stats_dict(stats) for test, stats in cls._by_test.items()},
+            "locators": sorted(
+                (
+                    dict(page=page, action=action, locator=locator, **_stats_dict(stats))
+                    for (page, action, locator), stats in cls._by_locator.items()
+                ),
+                key=lambda entry: entry["total_ms"], reverse=True,
+            ),
+        }
+
+    @classmethod
+    def write_json(cls, path):
+        """Write the summary to a JSON file"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(cls.summary(), f, indent=2)
+        return path
+
+
+def _stats_dict(stats):
+    """Convert raw [count, total_ns, max_ns, buckets] into readable numbers"""
+    count, total_ns, max_ns, buckets = stats
+    return {
+        "count": count,
+        "total_ms": round(total_ns / 1e6, 3),
+        "mean_ms": round(total_ns / count / 1e6, 3),
+        "max_ms": round(max_ns / 1e6, 3),
+        "histogram": dict(zip(_BUCKET_LABELS, buckets)),
+    }
+
+
+def timed(action):
+    """
+    Decorator timing a BasePage method whose first argument is a locator
+
+    Only the outermost timed call is recorded, so get_text() calling
+    find_element() counts once.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            ActionTimer.last_page = type(self).__name__
+            if not ActionTimer.enabled or ActionTimer._depth:
+                return method(self, *args, **kwargs)
+            ActionTimer._depth = 1
+            start = perf_counter_ns()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                elapsed = perf_counter_ns() - start
+                ActionTimer._depth = 0
+                locator = args[0] if args and isinstance(args[0], tuple) else None
+                ActionTimer.record(type(self).__name__, action, locator, elapsed)
+        return wrapper
+    return decorator
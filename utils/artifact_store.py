@@ -0,0 +1,202 @@
+"""
+Content-addressed artifact store
+Files are named by the SHA-256 of their content, so identical screenshots from
+many failing tests are written once. The store keeps an optional thumbnail per
+image and stays under a total size budget by evicting the least recently used
+objects, across runs.
+"""
+import hashlib
+import io
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from utils.file_lock import FileLock
+
+
+class ArtifactStore:
+    def __init__(self, root, max_bytes=None, thumbnails=None, thumbnail_width=320):
+        """
+        Args:
+            root (str): Store directory (objects/, thumbs/ and manifest.jsonl live here)
+            max_bytes (int): Total size budget; None or 0 disables eviction
+            thumbnails (str): None, "png" or "webp" (needs Pillow)
+            thumbnail_width (int): Thumbnail width in pixels
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self.thumbnails = thumbnails
+        self.thumbnail_width = thumbnail_width
+        self.manifest_path = os.path.join(root, "manifest.jsonl")
+        self.lock_path = os.path.join(root, "store.lock")
+        self.hits = 0
+        self.writes = 0
+        self.evicted = 0
+        self._lock = threading.Lock()
+        self._total_bytes = None
+
+    @classmethod
+    def from_env(cls, root):
+        """Store configured by ARTIFACT_STORE_MAX_MB, ARTIFACT_THUMBNAILS and ARTIFACT_THUMBNAIL_WIDTH"""
+        max_mb = float(os.environ.get("ARTIFACT_STORE_MAX_MB", "200"))
+        return cls(
+            root,
+            max_bytes=int(max_mb * 1024 * 1024) if max_mb > 0 else None,
+            thumbnails=os.environ.get("ARTIFACT_THUMBNAILS") or None,
+            thumbnail_width=int(os.environ.get("ARTIFACT_THUMBNAIL_WIDTH", "320")),
+        )
+
+    def put(self, data, suffix):
+        """
+        Store bytes under their content hash
+
+        Args:
+            data (bytes): File content
+            suffix (str): File extension including the dot, e.g. ".png"
+
+        Returns:
+            str: Path of the stored object
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = os.path.join(self.root, "objects", digest[:2], digest + suffix)
+        # Locked so another shard's eviction cannot remove the object between the check and the touch
+        with self._locked():
+            if os.path.exists(path):
+                # Touching the object marks it as recently used for eviction
+                os.utime(path)
+                self.hits += 1
+                return path
+            self._write_atomic(path, data)
+            self.writes += 1
+            self._add_bytes(len(data))
+        return path
+
+    def put_image(self, png_bytes):
+        """
+        Store a PNG and, if enabled, its thumbnail
+
+        Returns:
+            tuple: (image path, thumbnail path or None)
+        """
+        path = self.put(png_bytes, ".png")
+        thumbnail = None
+        if self.thumbnails:
+            digest = os.path.basename(path).split(".")[0]
+            thumbnail = os.path.join(self.root, "thumbs", f"{digest}.{self.thumbnails}")
+            with self._locked():
+                exists = os.path.exists(thumbnail)
+                if exists:
+                    os.utime(thumbnail)
+            if not exists:
+                data = self._make_thumbnail(png_bytes)
+                if data is None:
+                    thumbnail = None
+                else:
+                    with self._locked():
+                        self._write_atomic(thumbnail, data)
+                        self._add_bytes(len(data))
+        return path, thumbnail
+
+    def record(self, **entry):
+        """Append an entry (e.g. test name -> object paths) to the manifest"""
+        entry.setdefault("time", datetime.now().isoformat(timespec="seconds"))
+        with self._locked():
+            with open(self.manifest_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+            self._evict()
+
+    def enforce_budget(self):
+        """Evict least recently used objects until the store fits max_bytes"""
+        with self._locked():
+            self._evict()
+
+    @contextmanager
+    def _locked(self):
+        """Exclusive access across threads and across the processes of parallel shards"""
+        with self._lock, FileLock(self.lock_path):
+            yield
+
+    def _evict(self):
+        """enforce_budget() body; the caller holds the lock"""
+        if not self.max_bytes or self._current_bytes() <= self.max_bytes:
+            return
+        # Another process may have added or evicted objects; rescan before deciding
+        files = self._scan()
+        total = sum(size for _, size, _ in files)
+        for path, size, _ in sorted(files, key=lambda f: f[2]):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.evicted += 1
+        self._total_bytes = total
+        self._compact_manifest()
+
+    def _current_bytes(self):
+        """Total stored bytes, scanned once and then tracked in memory"""
+        if self._total_bytes is None:
+            self._total_bytes = sum(size for _, size, _ in self._scan())
+        return self._total_bytes
+
+    def _add_bytes(self, size):
+        if self._total_bytes is not None:
+            self._total_bytes += size
+
+    def _scan(self):
+        """(path, size, last used) of every object and thumbnail"""
+        files = []
+        for folder in ("objects", "thumbs"):
+            for dirpath, _, filenames in os.walk(os.path.join(self.root, folder)):
+                for filename in filenames:
+                    path = os.path.join(dirpath, filename)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    files.append((path, stat.st_size, stat.st_mtime))
+        return files
+
+    def _compact_manifest(self):
+        """Drop manifest entries whose objects were all evicted; the caller holds the lock"""
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                lines = f.readlines()
+        except OSError:
+            return
+        kept = []
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            paths = [value for value in entry.values() if isinstance(value, str) and value.startswith(self.root)]
+            if any(os.path.exists(path) for path in paths):
+                kept.append(line)
+        self._write_atomic(self.manifest_path, "".join(kept).encode("utf-8"))
+
+    def _make_thumbnail(self, png_bytes):
+        """Downscaled copy in the configured format, or None without Pillow"""
+        try:
+            from PIL import Image
+        except ImportError:
+            return None
+        with Image.open(io.BytesIO(png_bytes)) as image:
+            if image.width > self.thumbnail_width:
+                height = max(1, round(image.height * self.thumbnail_width / image.width))
+                image = image.resize((self.thumbnail_width, height))
+            output = io.BytesIO()
+            image.save(output, format=self.thumbnails.upper())
+        return output.getvalue()
+
+    @staticmethod
+    def _write_atomic(path, data):
+        """Write via a temporary file so parallel workers never see partial objects"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
@@ -0,0 +1,171 @@
+"""
+Browser profiles
+Named Chrome configurations selectable per run (--browser-profile or
+BROWSER_PROFILE) and peak memory measurement for the launched browser
+"""
+import os
+import sys
+from selenium.webdriver.chrome.options import Options
+
+
+# Flags shared by every profile
+COMMON_ARGUMENTS = [
+    "--disable-notifications",
+    "--disable-popup-blocking",
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+]
+
+# Hosts the lean profile may still reach; everything else fails DNS resolution
+LEAN_ALLOWED_HOSTS = os.environ.get(
+    "LEAN_ALLOWED_HOSTS", "localhost,127.0.0.1,saucedemo.com,*.saucedemo.com"
+).split(",")
+
+
+class BrowserProfile:
+    def __init__(self, name, arguments=None, prefs=None, blocked_urls=None):
+        """
+        Args:
+            name (str): Profile name used on the command line
+            arguments (list): Chrome command line switches
+            prefs (dict): Chrome preferences
+            blocked_urls (list): URL patterns blocked through DevTools after launch
+        """
+        self.name = name
+        self.arguments = COMMON_ARGUMENTS + (arguments or [])
+        self.prefs = prefs or {}
+        self.blocked_urls = blocked_urls or []
+
+    def chrome_options(self):
+        """Build Chrome options for this profile"""
+        options = Options()
+        for argument in self.arguments:
+            options.add_argument(argument)
+        if self.prefs:
+            options.add_experimental_option("prefs", self.prefs)
+        # Keep every console message so failure captures include the full log
+        options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+        return options
+
+    def apply(self, driver):
+        """Apply settings that can only be made on a running browser"""
+        if self.blocked_urls:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls})
+
+
+PROFILES = {
+    # Visible, maximized browser for local debugging (the historical default)
+    "headed-debug": BrowserProfile("headed-debug", ["--start-maximized"]),
+    "headless": BrowserProfile("headless", ["--headless=new", "--window-size=1920,1080", "--disable-gpu"]),
+    # Headless with a small fixed viewport, no images, fonts, extensions or third-party hosts
+    "lean": BrowserProfile(
+        "lean",
+        [
+            "--headless=new",
+            "--window-size=1024,768",
+            "--disable-gpu",
+            "--disable-extensions",
+            "--disable-background-networking",
+            "--disable-component-update",
+            "--disable-default-apps",
+            "--disable-sync",
+            "--disable-remote-fonts",
+            "--mute-audio",
+            "--blink-settings=imagesEnabled=false",
+            "--host-resolver-rules=MAP * ~NOTFOUND, "
+            + ", ".join(f"EXCLUDE {host.strip()}" for host in LEAN_ALLOWED_HOSTS),
+        ],
+        prefs={"profile.managed_default_content_settings.images": 2},
+        blocked_urls=["*.woff", "*.woff2", "*.ttf", "*.otf", "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg"],
+    ),
+}
+
+DEFAULT_PROFILE = "headed-debug"
+
+
+def get_profile(name=None):
+    """
+    Look up a profile by name
+
+    Args:
+        name (str): Profile name (default: BROWSER_PROFILE or headed-debug)
+
+    Returns:
+        BrowserProfile: The matching profile
+    """
+    name = name or os.environ.get("BROWSER_PROFILE") or DEFAULT_PROFILE
+    if name not in PROFILES:
+        raise ValueError(f"Unknown browser profile '{name}'. Available: {', '.join(PROFILES)}")
+    return PROFILES[name]
+
+
+def peak_rss_mb(driver):
+    """
+    Peak resident memory of the browser behind a driver
+
+    Sums the peak RSS of every process under the chromedriver service
+    (browser, renderers, GPU/utility processes). Linux reads VmHWM from
+    /proc; elsewhere psutil is used when installed.
+
+    Returns:
+        float: Megabytes, or None if it cannot be measured
+    """
+    try:
+        root_pid = driver.service.process.pid
+    except AttributeError:
+        return None
+    if sys.platform.startswith("linux"):
+        return _linux_peak_rss_mb(root_pid)
+    return _psutil_peak_rss_mb(root_pid)
+
+
+def _linux_peak_rss_mb(root_pid):
+    """Sum VmHWM over a process tree using /proc"""
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", encoding="utf-8") as f:
+                # The command name may contain spaces; fields after ")" are fixed
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    total_kb = 0
+    pending = [root_pid]
+    while pending:
+        pid = pending.pop()
+        pending.extend(children.get(pid, []))
+        try:
+            with open(f"/proc/{pid}/status", encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith("VmHWM:"):
+                        total_kb += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+    return round(total_kb / 1024, 1)
+
+
+def _psutil_peak_rss_mb(root_pid):
+    """Sum peak (Windows) or current RSS over a process tree using psutil"""
+    try:
+        import psutil
+    except ImportError:
+        return None
+    try:
+        root = psutil.Process(root_pid)
+        processes = [root] + root.children(recursive=True)
+    except psutil.Error:
+        return None
+    total = 0
+    for process in processes:
+        try:
+            info = process.memory_info()
+        except psutil.Error:
+            continue
+        total += getattr(info, "peak_wset", info.rss)
+    return round(total / (1024 * 1024), 1)
@@ -0,0 +1,211 @@
+"""
+WebDriver command recording and replay
+Records the command/response traffic of a real browser session to a small
+gzip-compressed JSON file, and serves it back through a ReplayDriver so page
+objects can be unit tested without a browser
+"""
+import copy
+import gzip
+import json
+import os
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+# 2: entries carry a repeat count; version 1 dropped repeats and cannot be replayed exactly
+FORMAT_VERSION = 2
+
+# W3C key identifying an element reference in commands and responses
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+# Answered by the replay executor when a recording does not contain them
+SESSION_COMMANDS = {
+    Command.NEW_SESSION: {"value": {"sessionId": "replay", "capabilities": {"browserName": "replay"}}},
+    Command.QUIT: {"value": None},
+}
+
+
+class ReplayMissError(WebDriverException):
+    """The page object sent a command the recording has no response for"""
+
+
+class CommandRecording:
+    def __init__(self, calls=None):
+        """
+        Args:
+            calls (list): [command, params, response, count] entries in call order
+        """
+        self.calls = calls or []
+        # Key -> index in calls of the latest entry for that call
+        self._last = {self.key(call[0], call[1]): index for index, call in enumerate(self.calls)}
+
+    @staticmethod
+    def key(command, params):
+        """Lookup key of a call; the session id differs between runs, so it is left out"""
+        params = {name: value for name, value in (params or {}).items() if name != "sessionId"}
+        return json.dumps([command, params], sort_keys=True)
+
+    def add(self, command, params, response):
+        """
+        Append a call
+
+        A response identical to the previous one for the same call increments
+        that entry's count instead of adding a new entry, so polling loops stay
+        small while replay still sees every response in the recorded order.
+        """
+        params = {name: value for name, value in (params or {}).items() if name != "sessionId"}
+        key = self.key(command, params)
+        index = self._last.get(key)
+        if index is not None and self.calls[index][2] == response:
+            self.calls[index][3] += 1
+            return
+        self._last[key] = len(self.calls)
+        self.calls.append([command, params, response, 1])
+
+    def respond(self, command, params=None, value=None):
+        """Append a successful response; for building recordings by hand in tests"""
+        self.add(command, params, {"value": value})
+        return self
+
+    def respond_error(self, command, params=None, error="no such element", message=""):
+        """Append an error response, e.g. error="stale element reference" """
+        # Shaped like RemoteConnection's error responses: HTTP status plus the raw JSON body
+        body = json.dumps({"value": {"error": error, "message": message}})
+        self.add(command, params, {"status": 404, "value": body})
+        return self
+
+    def respond_element(self, locator, element_id):
+        """Append a find_element() response for a (By, value) locator"""
+        return self.respond(Command.FIND_ELEMENT, self.find_params(locator), {ELEMENT_KEY: element_id})
+
+    def respond_elements(self, locator, element_ids):
+        """Append a find_elements() response for a (By, value) locator"""
+        elements = [{ELEMENT_KEY: element_id} for element_id in element_ids]
+        return self.respond(Command.FIND_ELEMENTS, self.find_params(locator), elements)
+
+    @staticmethod
+    def find_params(locator):
+        """Parameters WebDriver sends for a lookup; ID, CLASS_NAME and NAME go as CSS selectors"""
+        by, value = locator
+        if by == By.ID:
+            by, value = By.CSS_SELECTOR, f'[id="{value}"]'
+        elif by == By.CLASS_NAME:
+            by, value = By.CSS_SELECTOR, f".{value}"
+        elif by == By.NAME:
+            by, value = By.CSS_SELECTOR, f'[name="{value}"]'
+        return {"using": by, "value": value}
+
+    def save(self, path):
+        """Write the recording as gzip-compressed JSON"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump({"version": FORMAT_VERSION, "calls": self.calls}, f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path):
+        """Read a recording written by save()"""
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported recording version in {path}: {data.get('version')}")
+        return cls(data["calls"])
+
+
+class RecordingExecutor:
+    """Command executor proxy that records every call and forwards it to the real executor"""
+
+    def __init__(self, executor, recording):
+        self.executor = executor
+        self.recording = recording
+
+    def execute(self, command, params):
+        response = self.executor.execute(command, params)
+        # WebDriver.execute unwraps the value in place, so store a copy taken first
+        self.recording.add(command, copy.deepcopy(params), copy.deepcopy(response))
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self.executor, name)
+
+
+class CommandRecorder:
+    """Records a live driver's traffic between attach() and detach()"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.recording = CommandRecording()
+        self._executor = None
+
+    @classmethod
+    def attach(cls, driver):
+        """Start recording a driver's commands"""
+        recorder = cls(driver)
+        recorder._executor = driver.command_executor
+        driver.command_executor = RecordingExecutor(recorder._executor, recorder.recording)
+        return recorder
+
+    def detach(self):
+        """Stop recording and restore the driver's own executor"""
+        if self._executor is not None:
+            self.driver.command_executor = self._executor
+            self._executor = None
+        return self.recording
+
+    def save(self, path):
+        """Stop recording and write the recording to path"""
+        self.detach().save(path)
+
+
+class ReplayExecutor:
+    """
+    Command executor serving recorded responses
+
+    Calls are matched by command and parameters. Repeated identical calls get
+    the recorded responses in order, each as many times as it was recorded,
+    so waits and polls see the page change exactly as it did during
+    recording. Once a call's responses are used up, its last one is repeated.
+    """
+
+    def __init__(self, recording):
+        self.responses = {}
+        for command, params, response, count in recording.calls:
+            self.responses.setdefault(CommandRecording.key(command, params), []).extend([response] * count)
+        self.served = {}
+        self.commands = []
+
+    def execute(self, command, params):
+        self.commands.append(command)
+        key = CommandRecording.key(command, params)
+        responses = self.responses.get(key)
+        if not responses:
+            if command in SESSION_COMMANDS:
+                return copy.deepcopy(SESSION_COMMANDS[command])
+            raise ReplayMissError(f"No recorded response for {key}")
+        index = self.served.get(key, 0)
+        self.served[key] = index + 1
+        # Copied because WebDriver.execute modifies the response it gets
+        return copy.deepcopy(responses[min(index, len(responses) - 1)])
+
+    def close(self):
+        pass
+
+
+class ReplayDriver(WebDriver):
+    """WebDriver that answers every command from a recording, without a browser"""
+
+    def __init__(self, recording):
+        """
+        Args:
+            recording (CommandRecording or str): Recording, or path to a saved one
+        """
+        if isinstance(recording, str):
+            recording = CommandRecording.load(recording)
+        super().__init__(command_executor=ReplayExecutor(recording), options=ArgOptions())
+
+    @property
+    def commands(self):
+        """Names of the commands sent so far, in order"""
+        return self.command_executor.commands
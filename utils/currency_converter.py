@@ -1,12 +1,190 @@
 """
 Currency Converter Utility
 Converts USD to INR for test reporting
+Bulk methods work on whole lists of price strings with integer cents/paise,
+so totals over large carts and catalogs are exact
 """
+import re
+from collections import namedtuple
+from decimal import Decimal, ROUND_HALF_UP
+from utils.exchange_rates import CachedRates
+from utils import inr_format
+
+
+# "$1,299.99", "₹1,24,999.00", "-$5", "$-5", "Rs. 500" -> sign before or after the symbol,
+# integer digits (ungrouped, or grouped in thousands or the Indian way), fraction
+PRICE_PATTERN = re.compile(
+    r"^\s*(-)?\s*(?:\$|₹|Rs\.?|INR|USD)?\s*(-)?\s*"
+    r"(\d{1,3}(?:,\d{3})+|\d{1,2}(?:,\d{2})*,\d{3}|\d+)(?:\.(\d*))?\s*$"
+)
+
+# Result of CurrencyConverter.convert_batch(); amounts are exact Decimals
+BatchConversion = namedtuple(
+    "BatchConversion", ["amounts", "total", "converted", "converted_total", "formatted"]
+)
 
 
 class CurrencyConverter:
     # Exchange rate (approximate - you can update this)
     USD_TO_INR = 83.0  # 1 USD = 83 INR (approximate)
+
+    # Cached rate provider (see use_rates()); None uses USD_TO_INR for USD->INR
+    RATES = None
+
+    # Effective date for rate lookups; None means today
+    RATE_DATE = None
+
+    @staticmethod
+    def use_rates(provider, ttl=3600):
+        """
+        Look rates up through a provider instead of USD_TO_INR
+
+        Args:
+            provider (RateProvider): e.g. FileRateProvider("rates.json"); None restores USD_TO_INR
+            ttl (float): Seconds before a cached rate is refreshed in the background
+        """
+        CurrencyConverter.RATES = CachedRates(provider, ttl) if provider else None
+
+    @staticmethod
+    def rate(base="USD", quote="INR", on_date=None):
+        """
+        Exchange rate for a currency pair
+
+        Args:
+            base (str): Currency converted from
+            quote (str): Currency converted to
+            on_date (date): Effective date (default: RATE_DATE, then today)
+
+        Returns:
+            Decimal: Units of quote per unit of base
+        """
+        if CurrencyConverter.RATES is None:
+            if (base, quote) == ("USD", "INR"):
+                return Decimal(str(CurrencyConverter.USD_TO_INR))
+            raise LookupError(f"No exchange rate for {base}/{quote}; configure a provider with use_rates()")
+        return CurrencyConverter.RATES.get(base, quote, on_date or CurrencyConverter.RATE_DATE)
+
+    @staticmethod
+    def convert(amount, base, quote, on_date=None):
+        """
+        Convert an amount between any two currencies the rate source knows
+
+        Returns:
+            Decimal: Converted amount rounded half up to 2 decimal places
+        """
+        converted = Decimal(str(amount)) * CurrencyConverter.rate(base, quote, on_date)
+        return converted.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+    @staticmethod
+    def parse_cents(price_strings):
+        """
+        Parse price strings into integer minor units (cents/paise)
+
+        Args:
+            price_strings (iterable): Strings like "$29.99" or "₹1,24,999.00"
+
+        Returns:
+            list: Amounts in minor units, e.g. [2999, 12499900]
+
+        Raises:
+            ValueError: If a string is not a price, has two signs or misplaced commas
+        """
+        match = PRICE_PATTERN.match
+        cents = []
+        for price in price_strings:
+            parts = match(price)
+            if parts is None or (parts.group(1) and parts.group(2)):
+                raise ValueError(f"Not a price: {price!r}")
+            sign, inner_sign, whole, fraction = parts.groups()
+            fraction = fraction or ""
+            value = int(whole.replace(",", "")) * 100 + int((fraction + "00")[:2])
+            # Round half up on anything past the second decimal place
+            if len(fraction) > 2 and fraction[2] >= "5":
+                value += 1
+            cents.append(-value if sign or inner_sign else value)
+        return cents
+
+    @staticmethod
+    def convert_cents(cents, rate=None):
+        """
+        Convert minor units at an exchange rate, rounding each result half up
+
+        Args:
+            cents (iterable): Amounts in minor units
+            rate (float|str|Decimal): Exchange rate (default: the current USD->INR rate)
+
+        Returns:
+            list: Converted amounts in minor units
+        """
+        # One rate lookup for the whole batch
+        rate = CurrencyConverter.rate() if rate is None else Decimal(str(rate))
+        # rate == numerator / denominator exactly, so the loop is pure integer math
+        numerator, denominator = rate.as_integer_ratio()
+        half = denominator // 2
+        return [
+            (c * numerator + half) // denominator if c >= 0 else -((-c * numerator + half) // denominator)
+            for c in cents
+        ]
+
+    @staticmethod
+    def format_cents(cents, symbol="₹"):
+        """
+        Format minor units as price strings
+
+        Args:
+            cents (iterable): Amounts in minor units
+            symbol (str): Currency symbol; "₹" uses Indian (lakh/crore) grouping
+
+        Returns:
+            list: Strings like "₹2,489.17"
+        """
+        if symbol == "₹":
+            return inr_format.format_paise_batch(cents)
+        formatted = []
+        for c in cents:
+            whole, fraction = divmod(abs(c), 100)
+            formatted.append(f"{'-' if c < 0 else ''}{symbol}{whole:,}.{fraction:02d}")
+        return formatted
+
+    @staticmethod
+    def sum_prices(price_strings):
+        """
+        Exact total of price strings
+
+        Args:
+            price_strings (iterable): Strings like "$29.99"
+
+        Returns:
+            Decimal: Total, e.g. Decimal("59.98")
+        """
+        return Decimal(sum(CurrencyConverter.parse_cents(price_strings))).scaleb(-2)
+
+    @staticmethod
+    def convert_batch(price_strings, rate=None, symbol="₹"):
+        """
+        Parse, convert and format a whole list of prices in one pass
+
+        The converted total is the converted sum (rounded once), not the sum
+        of individually rounded conversions.
+
+        Args:
+            price_strings (iterable): Strings like "$29.99"
+            rate (float|str|Decimal): Exchange rate (default: the current USD->INR rate)
+            symbol (str): Currency symbol of the formatted results
+
+        Returns:
+            BatchConversion: amounts, total, converted, converted_total (Decimal) and formatted (str)
+        """
+        cents = CurrencyConverter.parse_cents(price_strings)
+        converted = CurrencyConverter.convert_cents(cents + [sum(cents)], rate)
+        converted_total = converted.pop()
+        return BatchConversion(
+            amounts=[Decimal(c).scaleb(-2) for c in cents],
+            total=Decimal(sum(cents)).scaleb(-2),
+            converted=[Decimal(c).scaleb(-2) for c in converted],
+            converted_total=Decimal(converted_total).scaleb(-2),
+            formatted=CurrencyConverter.format_cents(converted, symbol),
+        )
     
     @staticmethod
     def usd_to_inr(usd_amount):
@@ -19,7 +197,7 @@ class CurrencyConverter:
         Returns:
             float: Amount in INR
         """
-        return round(usd_amount * CurrencyConverter.USD_TO_INR, 2)
+        return round(usd_amount * float(CurrencyConverter.rate()), 2)
     
     @staticmethod
     def format_inr(amount):
@@ -30,9 +208,9 @@ class CurrencyConverter:
             amount (float): Amount to format
             
         Returns:
-            str: Formatted string with ₹ symbol
+            str: Formatted string with ₹ symbol and lakh/crore grouping, e.g. "₹12,34,567.89"
         """
-        return f"₹{amount:,.2f}"
+        return inr_format.format_inr(amount)
     
     @staticmethod
     def format_usd(amount):
@@ -58,7 +236,7 @@ class CurrencyConverter:
         Returns:
             float: Parsed amount
         """
-        return float(price_string.replace("$", "").replace(",", "").strip())
+        return CurrencyConverter.parse_cents([price_string])[0] / 100
     
     @staticmethod
     def convert_and_format(usd_string):
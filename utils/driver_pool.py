@@ -0,0 +1,118 @@
+"""
+WebDriver pool
+Keeps a fixed number of browsers alive per worker and resets them between tests
+"""
+import threading
+from selenium.common.exceptions import WebDriverException
+from utils.driver_setup import DriverSetup
+
+
+# Clears web storage for the origin of the currently loaded page and
+# returns how many entries were removed
+CLEAR_STORAGE_SCRIPT = """
+var removed = 0;
+try { removed += window.localStorage.length; window.localStorage.clear(); } catch (e) {}
+try { removed += window.sessionStorage.length; window.sessionStorage.clear(); } catch (e) {}
+return removed;
+"""
+
+
+class DriverPool:
+    def __init__(self, size, base_url, factory=None):
+        """
+        Start the pooled browsers
+
+        Args:
+            size (int): Number of browsers kept alive
+            base_url (str): URL every driver is reset to between tests
+            factory (callable): Returns a new WebDriver (defaults to DriverSetup.get_driver)
+        """
+        self.size = size
+        self.base_url = base_url
+        self.factory = factory or DriverSetup.get_driver
+        self._lock = threading.Lock()
+        self._idle = [self._start() for _ in range(size)]
+        self._in_use = []
+        self.replaced = 0
+
+    def acquire(self):
+        """Hand out a live driver positioned on the base URL"""
+        with self._lock:
+            driver = self._idle.pop() if self._idle else None
+        if driver is None or not self.is_alive(driver):
+            driver = self._replace(driver)
+        with self._lock:
+            self._in_use.append(driver)
+        return driver
+
+    def release(self, driver):
+        """Reset driver state and return it to the pool"""
+        with self._lock:
+            if driver in self._in_use:
+                self._in_use.remove(driver)
+            overflow = len(self._idle) >= self.size
+        if overflow:
+            # Extra browser started while the pool was exhausted
+            DriverSetup.quit_driver(driver)
+            return
+        try:
+            self.reset(driver)
+        except WebDriverException:
+            driver = self._replace(driver)
+        with self._lock:
+            self._idle.append(driver)
+
+    def reset(self, driver):
+        """Clear cookies, web storage and extra windows, leaving the driver on the base URL"""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        # Storage is per origin, so clear the page we are leaving as well
+        driver.execute_script(CLEAR_STORAGE_SCRIPT)
+        driver.delete_all_cookies()
+        driver.get(self.base_url)
+        # The base origin may have kept state from an earlier test on another
+        # origin; only then does the page need a second, clean load
+        stale = driver.execute_script(CLEAR_STORAGE_SCRIPT) or driver.get_cookies()
+        if stale:
+            driver.delete_all_cookies()
+            driver.get(self.base_url)
+
+    @staticmethod
+    def is_alive(driver):
+        """Check if the browser session still responds"""
+        try:
+            driver.execute_script("return 1")
+            return True
+        except WebDriverException:
+            return False
+
+    def close(self):
+        """Quit every pooled driver"""
+        with self._lock:
+            drivers = self._idle + self._in_use
+            self._idle, self._in_use = [], []
+        for driver in drivers:
+            try:
+                DriverSetup.quit_driver(driver)
+            except WebDriverException:
+                pass
+
+    def _replace(self, dead_driver):
+        """Discard a dead session and start a fresh browser in its place"""
+        if dead_driver is not None:
+            self.replaced += 1
+            try:
+                DriverSetup.quit_driver(dead_driver)
+            except WebDriverException:
+                pass
+        return self._start()
+
+    def _start(self):
+        """Launch a browser and load the base URL"""
+        driver = self.factory()
+        driver.get(self.base_url)
+        return driver
@@ -0,0 +1,172 @@
+"""
+ChromeDriver path resolution
+Resolves the driver binary once per process and caches it on disk by browser version
+"""
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+
+class DriverResolver:
+    # On-disk cache location (override with DRIVER_CACHE_DIR)
+    CACHE_DIR = os.environ.get(
+        "DRIVER_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "ecom-selenium")
+    )
+    CACHE_FILE = "driver_cache.json"
+
+    # Browser binaries probed for the installed version
+    BROWSER_BINARIES = [
+        "google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome",
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    ]
+
+    _resolved_path = None
+    _resolved = False
+    # Seconds spent on the first (cold) and latest in-process (warm) resolution
+    timings = {"cold": None, "warm": None}
+    # Where the cold resolution found the driver: env, disk, path, download, selenium-manager
+    source = None
+
+    @classmethod
+    def resolve(cls):
+        """
+        Return the chromedriver path for the installed browser
+
+        Lookup order: in-process memo, CHROMEDRIVER_PATH, on-disk cache,
+        chromedriver on PATH, then a WebDriverManager download. No step
+        after the download needs network access.
+
+        Returns:
+            str: Path to chromedriver, or None to let Selenium locate it
+        """
+        start = time.perf_counter()
+        if cls._resolved:
+            cls.timings["warm"] = time.perf_counter() - start
+            return cls._resolved_path
+
+        version = cls.browser_version()
+        path, cls.source = cls._lookup(version)
+        if path and cls.source in ("path", "download"):
+            cls._store(version, path)
+
+        cls._resolved_path = path
+        cls._resolved = True
+        cls.timings["cold"] = time.perf_counter() - start
+        return path
+
+    @classmethod
+    def invalidate(cls):
+        """Forget the resolved path, in memory and on disk"""
+        version = cls.browser_version()
+        cache = cls._load_cache()
+        if cache.pop(cls._cache_key(version), None) is not None:
+            try:
+                cls._save_cache(cache)
+            except OSError as e:
+                print(f"Could not write driver cache: {e}")
+        cls._resolved_path = None
+        cls._resolved = False
+
+    @classmethod
+    def browser_version(cls):
+        """
+        Detect the installed Chrome version without network access
+
+        Returns:
+            str: Version like "120.0.6099.109", or None if not detected
+        """
+        if sys.platform.startswith("win"):
+            return cls._windows_browser_version()
+        for binary in cls.BROWSER_BINARIES:
+            executable = shutil.which(binary) or (binary if os.path.isfile(binary) else None)
+            if not executable:
+                continue
+            try:
+                output = subprocess.run(
+                    [executable, "--version"], capture_output=True, text=True, timeout=10
+                ).stdout
+            except (OSError, subprocess.SubprocessError):
+                continue
+            match = re.search(r"\d+(\.\d+)+", output)
+            if match:
+                return match.group(0)
+        return None
+
+    @classmethod
+    def _windows_browser_version(cls):
+        """Read the Chrome version from the Windows registry"""
+        try:
+            output = subprocess.run(
+                ["reg", "query", r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon", "/v", "version"],
+                capture_output=True, text=True, timeout=10
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            return None
+        match = re.search(r"\d+(\.\d+)+", output)
+        return match.group(0) if match else None
+
+    @classmethod
+    def _lookup(cls, version):
+        """Walk the resolution sources, returning (path, source)"""
+        env_path = os.environ.get("CHROMEDRIVER_PATH")
+        if env_path and os.path.isfile(env_path):
+            return env_path, "env"
+
+        cached = cls._load_cache().get(cls._cache_key(version))
+        if cached and os.path.isfile(cached):
+            return cached, "disk"
+
+        on_path = shutil.which("chromedriver")
+        if on_path:
+            return on_path, "path"
+
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+            return ChromeDriverManager().install(), "download"
+        except Exception as e:
+            print(f"ChromeDriver download unavailable: {e}")
+            return None, "selenium-manager"
+
+    @staticmethod
+    def _cache_key(version):
+        """ChromeDriver compatibility follows the browser major version"""
+        return version.split(".")[0] if version else "unknown"
+
+    @classmethod
+    def _cache_path(cls):
+        """Full path of the cache file"""
+        return os.path.join(cls.CACHE_DIR, cls.CACHE_FILE)
+
+    @classmethod
+    def _load_cache(cls):
+        """Read the version -> path cache, empty if missing or corrupt"""
+        try:
+            with open(cls._cache_path(), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def _save_cache(cls, cache):
+        """Atomically write the cache file; each writer uses its own temporary file"""
+        os.makedirs(cls.CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cls._cache_path()}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, cls._cache_path())
+
+    @classmethod
+    def _store(cls, version, path):
+        """Persist a resolved path for the browser version"""
+        cache = cls._load_cache()
+        cache[cls._cache_key(version)] = path
+        try:
+            cls._save_cache(cache)
+        except OSError as e:
+            print(f"Could not write driver cache: {e}")
@@ -4,40 +4,50 @@ Handles browser initialization and teardown
 """
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from utils.browser_profiles import get_profile, peak_rss_mb
+from utils.driver_resolver import DriverResolver
 
 
 class DriverSetup:
+    # Profile used when get_driver() is called without one (set from --browser-profile)
+    PROFILE = None
+
+    # Peak RSS per quit browser: [{"profile": name, "peak_rss_mb": value}, ...]
+    memory_samples = []
+
     @staticmethod
-    def get_driver():
-        """Initialize and return Chrome WebDriver"""
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--disable-popup-blocking")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--no-sandbox")
-        
-        # Uncomment below for headless mode
-        # chrome_options.add_argument("--headless")
-        
+    def get_driver(profile=None):
+        """Initialize and return Chrome WebDriver for a browser profile"""
+        profile = get_profile(profile or DriverSetup.PROFILE)
+        chrome_options = profile.chrome_options()
+
+        # Resolved once per process and cached on disk, so this works offline
+        driver_path = DriverResolver.resolve()
         try:
-            # Use WebDriverManager to automatically download and manage ChromeDriver
             driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
+                service=Service(driver_path) if driver_path else Service(),
                 options=chrome_options
             )
         except Exception as e:
             print(f"Error initializing Chrome driver: {e}")
             print("Trying alternative method...")
+            DriverResolver.invalidate()
             driver = webdriver.Chrome(options=chrome_options)
-        
-        driver.implicitly_wait(10)
+
+        profile.apply(driver)
+        driver.browser_profile = profile.name
+
+        # All waiting is explicit (see utils/wait_engine.py); an implicit wait
+        # would stack on top of it and make negative checks burn the timeout
+        driver.implicitly_wait(0)
         return driver
 
     @staticmethod
     def quit_driver(driver):
-        """Quit the WebDriver"""
+        """Record the browser's peak memory, then quit the WebDriver"""
         if driver:
+            DriverSetup.memory_samples.append({
+                "profile": getattr(driver, "browser_profile", None),
+                "peak_rss_mb": peak_rss_mb(driver),
+            })
             driver.quit()
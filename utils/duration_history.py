@@ -0,0 +1,150 @@
+"""
+Test duration history
+Stores per-test, per-phase (setup/call/teardown) durations of every run in a
+local SQLite database, keyed by git commit and browser profile, and computes
+the percentiles used by check_regressions.py
+"""
+import math
+import os
+import sqlite3
+import subprocess
+from contextlib import contextmanager
+from datetime import datetime
+
+
+DEFAULT_DB = "reports/duration_history.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started TEXT NOT NULL,
+    commit_sha TEXT NOT NULL,
+    profile TEXT NOT NULL,
+    shard TEXT
+);
+CREATE TABLE IF NOT EXISTS durations (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    duration REAL NOT NULL,
+    outcome TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS durations_by_test ON durations (nodeid, phase);
+CREATE INDEX IF NOT EXISTS runs_by_profile ON runs (profile, commit_sha);
+"""
+
+
+def current_commit():
+    """Commit under test: GIT_COMMIT, else git rev-parse HEAD, else "unknown" """
+    commit = os.environ.get("GIT_COMMIT")
+    if commit:
+        return commit
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+    return result.stdout.strip() or "unknown"
+
+
+def percentile(values, pct):
+    """Linearly interpolated percentile of a non-empty list"""
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class DurationHistory:
+    # History recording the running session, set from conftest (None when disabled)
+    current = None
+
+    def __init__(self, path=DEFAULT_DB):
+        self.path = path
+        self._pending = []
+
+    def record(self, nodeid, phase, duration, outcome):
+        """Buffer one phase duration; nothing touches the database until save()"""
+        self._pending.append((nodeid, phase, duration, outcome))
+
+    def save(self, commit, profile, shard=None):
+        """
+        Write buffered durations as one run
+
+        Returns:
+            int: Run ID, or None if nothing was recorded
+        """
+        if not self._pending:
+            return None
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "INSERT INTO runs (started, commit_sha, profile, shard) VALUES (?, ?, ?, ?)",
+                (datetime.now().isoformat(timespec="seconds"), commit, profile, shard),
+            )
+            run_id = cursor.lastrowid
+            connection.executemany(
+                "INSERT INTO durations (run_id, nodeid, phase, duration, outcome) VALUES (?, ?, ?, ?, ?)",
+                [(run_id,) + row for row in self._pending],
+            )
+        self._pending = []
+        return run_id
+
+    def commits(self, profile):
+        """
+        Commits with recorded runs for a profile, newest first
+
+        Ordered by each commit's first recorded run, so re-running an old
+        commit does not move it ahead of the commits that came after it.
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT commit_sha, MIN(id) AS first_run FROM runs WHERE profile = ? "
+                "GROUP BY commit_sha ORDER BY first_run DESC",
+                (profile,),
+            ).fetchall()
+        return [commit for commit, _ in rows]
+
+    def samples(self, profile, commits, phase=None, passed_only=True):
+        """
+        Durations grouped by test and phase
+
+        Args:
+            profile (str): Browser profile
+            commits (list): Commits to include
+            phase (str): setup, call or teardown (None for all)
+            passed_only (bool): Ignore failed/skipped phases, whose timing is not representative
+
+        Returns:
+            dict: (nodeid, phase) -> [seconds, ...]
+        """
+        if not commits:
+            return {}
+        query = (
+            "SELECT d.nodeid, d.phase, d.duration FROM durations d JOIN runs r ON r.id = d.run_id "
+            f"WHERE r.profile = ? AND r.commit_sha IN ({', '.join('?' * len(commits))})"
+        )
+        params = [profile] + list(commits)
+        if phase:
+            query += " AND d.phase = ?"
+            params.append(phase)
+        if passed_only:
+            query += " AND d.outcome = 'passed'"
+        grouped = {}
+        with self._connect() as connection:
+            for nodeid, test_phase, duration in connection.execute(query, params):
+                grouped.setdefault((nodeid, test_phase), []).append(duration)
+        return grouped
+
+    @contextmanager
+    def _connect(self):
+        """Open the database in a transaction, creating it on first use (parallel shards wait on the write lock)"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            connection.executescript(SCHEMA)
+            with connection:
+                yield connection
+        finally:
+            connection.close()
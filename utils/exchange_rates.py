@@ -0,0 +1,149 @@
+"""
+Exchange rate providers
+Rates are looked up by currency pair and effective date from a static stub or
+a JSON file, through an in-memory TTL cache that refreshes expired entries in
+the background instead of blocking the caller
+"""
+import json
+import os
+import threading
+import time
+from bisect import bisect_right
+from datetime import date
+from decimal import Decimal
+
+
+class RateProvider:
+    """Source of exchange rates; subclasses implement fetch()"""
+
+    def fetch(self, base, quote, on_date):
+        """
+        Rate for one unit of base in quote currency, effective on a date
+
+        Args:
+            base (str): Currency code, e.g. "USD"
+            quote (str): Currency code, e.g. "INR"
+            on_date (date): Effective date
+
+        Returns:
+            Decimal: Exchange rate
+
+        Raises:
+            LookupError: If the provider has no rate for the pair on that date
+        """
+        raise NotImplementedError
+
+    def get_rate(self, base, quote, on_date):
+        """Rate for a pair, falling back to the inverse of the reversed pair"""
+        if base == quote:
+            return Decimal(1)
+        try:
+            return self.fetch(base, quote, on_date)
+        except LookupError:
+            return Decimal(1) / self.fetch(quote, base, on_date)
+
+
+class StaticRateProvider(RateProvider):
+    def __init__(self, rates):
+        """
+        Args:
+            rates (dict): "USD/INR" -> rate, or "USD/INR" -> {"YYYY-MM-DD": rate, ...}
+                          where each dated rate applies from that date on
+        """
+        self._history = {}
+        for pair, value in rates.items():
+            if isinstance(value, dict):
+                points = sorted((date.fromisoformat(day), Decimal(str(rate))) for day, rate in value.items())
+            else:
+                points = [(date.min, Decimal(str(value)))]
+            self._history[pair.upper()] = ([day for day, _ in points], [rate for _, rate in points])
+
+    def fetch(self, base, quote, on_date):
+        pair = f"{base}/{quote}".upper()
+        if pair not in self._history:
+            raise LookupError(f"No exchange rate for {pair}")
+        days, rates = self._history[pair]
+        index = bisect_right(days, on_date) - 1
+        if index < 0:
+            raise LookupError(f"No exchange rate for {pair} on {on_date}")
+        return rates[index]
+
+
+class FileRateProvider(RateProvider):
+    def __init__(self, path):
+        """
+        Args:
+            path (str): JSON file in the StaticRateProvider format, re-read when it changes
+        """
+        self.path = path
+        self._mtime = None
+        self._rates = None
+
+    def fetch(self, base, quote, on_date):
+        mtime = os.path.getmtime(self.path)
+        if mtime != self._mtime:
+            with open(self.path, encoding="utf-8") as f:
+                self._rates = StaticRateProvider(json.load(f))
+            self._mtime = mtime
+        return self._rates.fetch(base, quote, on_date)
+
+
+class CachedRates:
+    def __init__(self, provider, ttl=3600):
+        """
+        Args:
+            provider (RateProvider): Rate source
+            ttl (float): Seconds a cached rate is fresh; expired rates are still
+                         served while a background refresh runs
+        """
+        self.provider = provider
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._cache = {}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def get(self, base, quote, on_date=None):
+        """
+        Cached rate for a pair and effective date (default: today)
+
+        Returns:
+            Decimal: Exchange rate
+        """
+        key = (base, quote, on_date or date.today())
+        entry = self._cache.get(key)
+        if entry is None:
+            # Only the very first lookup of a key waits on the provider
+            self.misses += 1
+            rate = self.provider.get_rate(*key)
+            self._cache[key] = (rate, time.monotonic())
+            return rate
+        self.hits += 1
+        rate, fetched_at = entry
+        if time.monotonic() - fetched_at > self.ttl:
+            self._refresh_in_background(key)
+        return rate
+
+    def clear(self):
+        """Forget all cached rates"""
+        self._cache.clear()
+
+    def _refresh_in_background(self, key):
+        """Re-fetch one rate on a daemon thread, at most one refresh per key at a time"""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self._cache[key] = (self.provider.get_rate(*key), time.monotonic())
+            except (LookupError, OSError, ValueError):
+                # Keep serving the previous rate
+                pass
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name="rate-refresh", daemon=True).start()
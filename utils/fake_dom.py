@@ -0,0 +1,604 @@
+"""
+In-memory fake WebDriver
+Parses HTML with the standard library and implements the subset of the
+WebDriver API the page objects use (find_element(s), .text, .click(), .clear(),
+.send_keys(), .is_displayed(), current_url and the BasePage scripts), so page
+logic can be unit tested without a browser. Lookups by id, class and tag are
+served from per-document indexes.
+"""
+import re
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from pages.base_page import COUNT_SCRIPT, MUTATION_COUNT_SCRIPT, ROWS_SCRIPT, SET_STORAGE_SCRIPT, TEXTS_SCRIPT
+
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+# Elements whose text starts on a new line in innerText
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "fieldset", "footer", "form",
+    "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section",
+    "table", "tr", "ul",
+}
+
+# Never rendered
+HIDDEN_TAGS = {"head", "meta", "link", "script", "style", "template", "title"}
+
+
+class Node:
+    """An element in a parsed document"""
+
+    def __init__(self, tag, attrs, parent=None):
+        self.tag = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.children = []
+        self.value = attrs.get("value", "")
+
+    @property
+    def classes(self):
+        return self.attrs.get("class", "").split()
+
+    def elements(self):
+        """Descendant elements in document order"""
+        for child in self.children:
+            if isinstance(child, Node):
+                yield child
+                yield from child.elements()
+
+    def ancestors(self):
+        node = self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+    def inner_text(self):
+        """Rendered text, roughly as innerText: block elements on their own lines, whitespace collapsed"""
+        parts = []
+        self._collect_text(parts)
+        lines = (re.sub(r"[ \t\r\f\v]+", " ", line).strip() for line in "".join(parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+    def _collect_text(self, parts):
+        if not self.rendered_itself():
+            return
+        if self.tag in BLOCK_TAGS:
+            parts.append("\n")
+        for child in self.children:
+            if isinstance(child, Node):
+                child._collect_text(parts)
+            else:
+                parts.append(child.replace("\n", " "))
+        if self.tag in BLOCK_TAGS:
+            parts.append("\n")
+
+    def rendered_itself(self):
+        """False when this element alone would hide itself and its subtree"""
+        if self.tag in HIDDEN_TAGS or "hidden" in self.attrs:
+            return False
+        if self.tag == "input" and self.attrs.get("type", "").lower() == "hidden":
+            return False
+        style = self.attrs.get("style", "").replace(" ", "").lower()
+        return "display:none" not in style and "visibility:hidden" not in style
+
+    def is_displayed(self):
+        return self.rendered_itself() and all(node.rendered_itself() for node in self.ancestors())
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Node("#document", {})
+        self.stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        node = Node(tag, {name: "" if value is None else value for name, value in attrs}, self.stack[-1])
+        self.stack[-1].children.append(node)
+        if tag not in VOID_TAGS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.stack.pop()
+
+    def handle_endtag(self, tag):
+        # Close up to the matching open tag; stray end tags are ignored
+        for depth in range(len(self.stack) - 1, 0, -1):
+            if self.stack[depth].tag == tag:
+                del self.stack[depth:]
+                return
+
+    def handle_data(self, data):
+        self.stack[-1].children.append(data)
+
+
+# ---------- CSS selectors ----------
+
+_TOKEN = re.compile(r"""
+    \s*(?P<combinator>>)\s*
+  | (?P<space>\s+)
+  | (?P<tag>\*|[a-zA-Z][\w-]*)
+  | \#(?P<id>[\w-]+)
+  | \.(?P<cls>[\w-]+)
+  | \[\s*(?P<attr>[\w-]+)\s*(?:(?P<op>[~|^$*]?=)\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[\w-]+))\s*)?\]
+""", re.VERBOSE)
+
+_ATTR_TESTS = {
+    None: lambda actual, expected: True,
+    "=": lambda actual, expected: actual == expected,
+    "^=": lambda actual, expected: bool(expected) and actual.startswith(expected),
+    "$=": lambda actual, expected: bool(expected) and actual.endswith(expected),
+    "*=": lambda actual, expected: bool(expected) and expected in actual,
+    "~=": lambda actual, expected: expected in actual.split(),
+    "|=": lambda actual, expected: actual == expected or actual.startswith(expected + "-"),
+}
+
+
+class Compound:
+    """One compound selector, e.g. button[id^='add-to-cart'].primary"""
+
+    def __init__(self):
+        self.tag = None
+        self.id = None
+        self.classes = []
+        self.attrs = []
+
+    def matches(self, node):
+        if self.tag and node.tag != self.tag:
+            return False
+        if self.id is not None and node.attrs.get("id") != self.id:
+            return False
+        node_classes = node.classes
+        if any(cls not in node_classes for cls in self.classes):
+            return False
+        for name, op, expected in self.attrs:
+            actual = node.attrs.get(name)
+            if actual is None or not _ATTR_TESTS[op](actual, expected):
+                return False
+        return True
+
+
+class Selector:
+    """
+    Compiled selector list
+
+    Supports type, #id, .class and [attr], [attr=v], [attr^=v], [attr$=v],
+    [attr*=v], [attr~=v] and [attr|=v], combined with descendant (space) and
+    child (>) combinators, and comma-separated lists.
+    """
+    _compiled = {}
+
+    def __init__(self, text):
+        self.text = text
+        self.alternatives = [self._parse(part.strip()) for part in text.split(",")]
+
+    @classmethod
+    def compile(cls, text):
+        """Compiled selector, cached by text"""
+        if text not in cls._compiled:
+            cls._compiled[text] = cls(text)
+        return cls._compiled[text]
+
+    def _parse(self, text):
+        """List of (combinator, Compound) pairs, left to right; the first combinator is None"""
+        if not text:
+            raise InvalidSelectorException(f"Empty selector in '{self.text}'")
+        steps = []
+        combinator = None
+        compound = None
+        position = 0
+        while position < len(text):
+            match = _TOKEN.match(text, position)
+            if not match or match.end() == position:
+                raise InvalidSelectorException(f"Unsupported selector '{self.text}' at '{text[position:]}'")
+            position = match.end()
+            if match.group("combinator") or match.group("space"):
+                if compound is None:
+                    raise InvalidSelectorException(f"Dangling combinator in '{self.text}'")
+                steps.append((combinator, compound))
+                combinator = ">" if match.group("combinator") else " "
+                compound = None
+                continue
+            compound = compound or Compound()
+            if match.group("tag"):
+                if compound.tag or compound.id or compound.classes or compound.attrs:
+                    raise InvalidSelectorException(f"Type selector must come first in '{self.text}'")
+                compound.tag = None if match.group("tag") == "*" else match.group("tag").lower()
+            elif match.group("id"):
+                compound.id = match.group("id")
+            elif match.group("cls"):
+                compound.classes.append(match.group("cls"))
+            else:
+                name = match.group("attr").lower()
+                op = match.group("op")
+                value = next((v for v in match.group("dq", "sq", "bare") if v is not None), None)
+                # [id="x"] and [class~="x"] can use the indexes like #x and .x
+                if name == "id" and op == "=":
+                    compound.id = value
+                elif name == "class" and op == "~=":
+                    compound.classes.append(value)
+                else:
+                    compound.attrs.append((name, op, value))
+        if compound is None:
+            raise InvalidSelectorException(f"Dangling combinator in '{self.text}'")
+        steps.append((combinator, compound))
+        return steps
+
+    def select(self, document, scope=None):
+        """Matching elements in document order, optionally only descendants of scope"""
+        if len(self.alternatives) == 1:
+            return self._select_steps(document, self.alternatives[0], scope)
+        found = set()
+        for steps in self.alternatives:
+            found.update(map(id, self._select_steps(document, steps, scope)))
+        return [node for node in document.all_nodes() if id(node) in found]
+
+    def _select_steps(self, document, steps, scope):
+        # Right to left, as browsers do: index candidates for the last compound, then check ancestry
+        candidates = document.candidates(steps[-1][1])
+        matches = []
+        for node in candidates:
+            if scope is not None and scope not in node.ancestors():
+                continue
+            if steps[-1][1].matches(node) and self._ancestry_matches(node, steps, len(steps) - 1, scope):
+                matches.append(node)
+        return matches
+
+    def _ancestry_matches(self, node, steps, index, scope):
+        combinator = steps[index][0]
+        if combinator is None:
+            return True
+        compound = steps[index - 1][1]
+        for ancestor in node.ancestors():
+            if ancestor.tag == "#document":
+                return False
+            if compound.matches(ancestor) and self._ancestry_matches(ancestor, steps, index - 1, scope):
+                return True
+            if combinator == ">":
+                return False
+        return False
+
+
+class Document:
+    """Parsed page with id, class and tag indexes"""
+
+    def __init__(self, html, url="about:blank"):
+        builder = _TreeBuilder()
+        builder.feed(html)
+        builder.close()
+        self.root = builder.root
+        self.url = url
+        self.html = html
+        # DOM changes made through FakeElement; read by MUTATION_COUNT_SCRIPT
+        self.mutations = 0
+        self.observed = False
+        self._index = None
+
+    def all_nodes(self):
+        self._ensure_index()
+        return self._index["all"]
+
+    def candidates(self, compound):
+        """Smallest indexed node list that can contain the compound's matches"""
+        self._ensure_index()
+        if compound.id is not None:
+            return self._index["id"].get(compound.id, [])
+        if compound.classes:
+            return min((self._index["class"].get(cls, []) for cls in compound.classes), key=len)
+        if compound.tag:
+            return self._index["tag"].get(compound.tag, [])
+        return self._index["all"]
+
+    def changed(self):
+        """Record a DOM change: counts as a mutation and drops the indexes"""
+        self.mutations += 1
+        self._index = None
+
+    def _ensure_index(self):
+        if self._index is not None:
+            return
+        index = {"all": [], "id": {}, "class": {}, "tag": {}}
+        for node in self.root.elements():
+            index["all"].append(node)
+            index["tag"].setdefault(node.tag, []).append(node)
+            if "id" in node.attrs:
+                index["id"].setdefault(node.attrs["id"], []).append(node)
+            for cls in node.classes:
+                index["class"].setdefault(cls, []).append(node)
+        self._index = index
+
+    def select(self, selector, scope=None):
+        return Selector.compile(selector).select(self, scope)
+
+
+def locator_to_css(by, value):
+    """CSS selector for a (By, value) lookup, converted the way WebDriver does"""
+    if by == By.CSS_SELECTOR:
+        return value
+    if by == By.ID:
+        return f'[id="{value}"]'
+    if by == By.CLASS_NAME:
+        return f".{value}"
+    if by == By.NAME:
+        return f'[name="{value}"]'
+    if by == By.TAG_NAME:
+        return value
+    raise InvalidSelectorException(f"FakeDriver does not support {by} lookups")
+
+
+class FakeElement:
+    """WebElement stand-in for a Node; stale once its document is replaced or the node is removed"""
+
+    def __init__(self, driver, node):
+        self._driver = driver
+        self._node = node
+        self._document = driver.document
+
+    @property
+    def node(self):
+        if self._document is not self._driver.document:
+            raise StaleElementReferenceException("Element belongs to a previous document")
+        if self._node is not self._document.root and self._document.root not in self._node.ancestors():
+            raise StaleElementReferenceException("Element is no longer attached to the DOM")
+        return self._node
+
+    @property
+    def id(self):
+        return str(id(self._node))
+
+    def __eq__(self, other):
+        return isinstance(other, FakeElement) and other._node is self._node
+
+    def __hash__(self):
+        return hash(self._node)
+
+    @property
+    def tag_name(self):
+        return self.node.tag
+
+    @property
+    def text(self):
+        node = self.node
+        return node.inner_text() if node.is_displayed() else ""
+
+    def get_attribute(self, name):
+        node = self.node
+        if name == "value" and node.tag in ("input", "textarea", "select", "option", "button"):
+            return node.value
+        return node.attrs.get(name)
+
+    def get_dom_attribute(self, name):
+        return self.node.attrs.get(name)
+
+    def is_displayed(self):
+        return self.node.is_displayed()
+
+    def is_enabled(self):
+        return "disabled" not in self.node.attrs
+
+    def click(self):
+        node = self.node
+        if not node.is_displayed():
+            raise WebDriverException("element not interactable: element is not displayed")
+        self._driver._click(self)
+
+    def clear(self):
+        self.node.value = ""
+        self._document.changed()
+
+    def send_keys(self, *value):
+        node = self.node
+        node.value += "".join(str(part) for part in value)
+        self._document.changed()
+
+    def find_element(self, by=By.ID, value=None):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"Unable to locate element: {by}={value}")
+        return elements[0]
+
+    def find_elements(self, by=By.ID, value=None):
+        nodes = self._document.select(locator_to_css(by, value), scope=self.node)
+        return [self._driver._wrap(node) for node in nodes]
+
+    # Test helpers for click handlers; not part of the WebDriver API
+
+    def set_attribute(self, name, value):
+        """Set (or with None, remove) an attribute"""
+        node = self.node
+        if value is None:
+            node.attrs.pop(name, None)
+        else:
+            node.attrs[name] = value
+        self._document.changed()
+
+    def set_inner_html(self, html):
+        """Replace the element's children with parsed HTML"""
+        node = self.node
+        fragment = _TreeBuilder()
+        fragment.feed(html)
+        fragment.close()
+        for child in node.children:
+            if isinstance(child, Node):
+                child.parent = None
+        node.children = fragment.root.children
+        for child in node.children:
+            if isinstance(child, Node):
+                child.parent = node
+        self._document.changed()
+
+    def remove(self):
+        """Detach the element from the document"""
+        node = self.node
+        node.parent.children.remove(node)
+        node.parent = None
+        self._document.changed()
+
+
+class FakeDriver:
+    """
+    Browser-free driver over static HTML
+
+    Pages are HTML strings by URL. No page JavaScript runs; behaviour is
+    supplied by click handlers registered with on_click(), which can change
+    the DOM through FakeElement.set_attribute/set_inner_html/remove or load
+    another page with get(). Links to a known page are followed on click.
+    """
+
+    def __init__(self, html=None, url="about:blank", pages=None):
+        """
+        Args:
+            html (str): Markup of the initial page (stored under url)
+            url (str): URL of the initial page
+            pages (dict): URL -> markup for get() and link clicks
+        """
+        self.pages = dict(pages or {})
+        if html is not None:
+            self.pages[url] = html
+        self.local_storage = {}
+        self.session_storage = {}
+        self.clicks = []
+        self._handlers = []
+        self._elements = {}
+        self.scripts = {
+            TEXTS_SCRIPT: self._texts_script,
+            COUNT_SCRIPT: self._count_script,
+            ROWS_SCRIPT: self._rows_script,
+            MUTATION_COUNT_SCRIPT: self._mutation_count_script,
+            SET_STORAGE_SCRIPT: self._set_storage_script,
+        }
+        self.document = None
+        if url in self.pages:
+            self.get(url)
+        else:
+            self._load("", url)
+
+    # ----- navigation -----
+
+    @property
+    def current_url(self):
+        return self.document.url
+
+    @property
+    def page_source(self):
+        return self.document.html
+
+    @property
+    def title(self):
+        titles = self.document.select("title")
+        # <title> is never rendered, so read its text directly
+        return " ".join("".join(c for c in titles[0].children if isinstance(c, str)).split()) if titles else ""
+
+    def get(self, url):
+        if url not in self.pages:
+            raise WebDriverException(f"FakeDriver has no page for {url}")
+        self._load(self.pages[url], url)
+
+    def refresh(self):
+        self._load(self.pages.get(self.document.url, self.document.html), self.document.url)
+
+    def _load(self, html, url):
+        self.document = Document(html, url)
+        self._elements = {}
+
+    # ----- lookups -----
+
+    def find_element(self, by=By.ID, value=None):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"Unable to locate element: {by}={value}")
+        return elements[0]
+
+    def find_elements(self, by=By.ID, value=None):
+        return [self._wrap(node) for node in self.document.select(locator_to_css(by, value))]
+
+    def _wrap(self, node):
+        # One FakeElement per node, like stable WebElement ids within a document
+        if id(node) not in self._elements:
+            self._elements[id(node)] = FakeElement(self, node)
+        return self._elements[id(node)]
+
+    # ----- behaviour -----
+
+    def on_click(self, locator, handler):
+        """
+        Run handler(driver, element) when an element matching locator is clicked
+
+        Args:
+            locator (tuple): (By, value) of the clickable elements
+            handler (callable): Receives the driver and the clicked FakeElement
+        """
+        self._handlers.append((locator_to_css(*locator), handler))
+
+    def _click(self, element):
+        self.clicks.append(element)
+        node = element.node
+        handled = False
+        for selector, handler in list(self._handlers):
+            if node in self.document.select(selector):
+                handler(self, element)
+                handled = True
+        href = node.attrs.get("href")
+        if not handled and node.tag == "a" and href:
+            target = urljoin(self.document.url, href)
+            if target in self.pages:
+                self.get(target)
+
+    # ----- scripts -----
+
+    def execute_script(self, script, *args):
+        """Run one of the known BasePage scripts (or one added to self.scripts)"""
+        implementation = self.scripts.get(script)
+        if implementation is None:
+            raise JavascriptException(f"FakeDriver cannot run script: {script.strip()[:60]}...")
+        return implementation(*args)
+
+    def _texts_script(self, selector):
+        return [node.inner_text() if node.is_displayed() else "" for node in self.document.select(selector)]
+
+    def _count_script(self, selector):
+        return len(self.document.select(selector))
+
+    def _rows_script(self, container_selector, fields):
+        rows = []
+        for container in self.document.select(container_selector):
+            row = {}
+            for name, (selector, source) in fields.items():
+                found = self.document.select(selector, scope=container)
+                if not found:
+                    row[name] = None
+                elif source == "text":
+                    row[name] = found[0].inner_text() if found[0].is_displayed() else ""
+                else:
+                    row[name] = found[0].attrs.get(source)
+            rows.append(row)
+        return rows
+
+    def _mutation_count_script(self):
+        if not self.document.observed:
+            self.document.observed = True
+            return -1
+        return self.document.mutations
+
+    def _set_storage_script(self, key, value):
+        if value is None:
+            self.local_storage.pop(key, None)
+        else:
+            self.local_storage[key] = value
+
+    # ----- no-ops kept for fixture compatibility -----
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def quit(self):
+        pass
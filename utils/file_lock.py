@@ -0,0 +1,40 @@
+"""
+Cross-process file lock
+Lets parallel shards (run_parallel.py) update shared files such as the flaky
+history and the artifact store manifest one at a time
+"""
+import os
+import time
+
+
+class FileLock:
+    """Exclusive lock file; a lock older than stale_after seconds is assumed abandoned"""
+
+    def __init__(self, path, timeout=10, stale_after=30):
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+
+    def __enter__(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                os.close(os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return self
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.path) > self.stale_after:
+                        os.remove(self.path)
+                        continue
+                except OSError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Could not lock {self.path}")
+                time.sleep(0.05)
+
+    def __exit__(self, *exc_info):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
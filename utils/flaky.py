@@ -0,0 +1,78 @@
+"""
+Flaky test tracking
+Classifies each test run as passed, flaky (failed, then passed on a rerun) or
+failed, keeps a rolling window of outcomes per test in a JSON history file
+shared across runs and shards, and decides which tests are quarantined
+"""
+import json
+import os
+from datetime import datetime
+from utils.file_lock import FileLock
+
+
+DEFAULT_HISTORY = "reports/flaky_history.json"
+
+# Outcomes kept per test; older ones drop out so fixed tests leave quarantine
+WINDOW = 20
+
+
+class FlakyTracker:
+    # Tracker for the running session, set from conftest (None when disabled)
+    current = None
+
+    def __init__(self, path=DEFAULT_HISTORY, threshold=0.2, min_runs=3):
+        """
+        Args:
+            path (str): History file
+            threshold (float): Flake rate above which a test is quarantined
+            min_runs (int): Recorded runs needed before a test can be quarantined
+        """
+        self.path = path
+        self.threshold = threshold
+        self.min_runs = min_runs
+        self.history = self._load()
+        self.session = {}
+        # Node ids quarantined in this session (by marker or flake rate)
+        self.quarantined = set()
+
+    def record(self, nodeid, outcome):
+        """Record this session's outcome for a test: "passed", "flaky" or "failed" """
+        self.session[nodeid] = outcome
+
+    def flake_rate(self, nodeid):
+        """Share of recent runs in which the test was flaky"""
+        recent = self.history.get(nodeid, {}).get("recent", [])
+        return recent.count("flaky") / len(recent) if recent else 0.0
+
+    def is_quarantined(self, nodeid):
+        """True when the test flakes more often than the threshold"""
+        recent = self.history.get(nodeid, {}).get("recent", [])
+        return len(recent) >= self.min_runs and self.flake_rate(nodeid) > self.threshold
+
+    def save(self):
+        """Merge this session's outcomes into the history file (safe with parallel shards)"""
+        if not self.session:
+            return
+        with FileLock(f"{self.path}.lock"):
+            history = self._load()
+            now = datetime.now().isoformat(timespec="seconds")
+            for nodeid, outcome in self.session.items():
+                entry = history.setdefault(nodeid, {"recent": []})
+                entry["recent"] = (entry["recent"] + [outcome])[-WINDOW:]
+                entry["last_run"] = now
+                if outcome == "flaky":
+                    entry["last_flake"] = now
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(history, f, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+        self.history = history
+        self.session = {}
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
@@ -0,0 +1,123 @@
+"""
+Indian numbering formatter and parser
+Groups rupee amounts the Indian way (last three digits, then pairs: lakh,
+crore), e.g. ₹12,34,567.89, and parses such strings back exactly. Digit
+groups come from precomputed tables so bulk formatting does no per-digit work.
+"""
+import re
+from decimal import Decimal, ROUND_HALF_UP
+
+
+# "00".."99" and "000".."999", indexed by value
+_PAIRS = tuple(f"{i:02d}" for i in range(100))
+_TRIPLES = tuple(f"{i:03d}" for i in range(1000))
+
+# Every whole-rupee amount below one lakh, pre-grouped ("0" .. "99,999")
+_BELOW_LAKH = tuple(
+    str(i) if i < 1000 else f"{i // 1000},{_TRIPLES[i % 1000]}" for i in range(100000)
+)
+
+# Optional sign and ₹, Indian-grouped (or ungrouped) rupees, optional paise
+INR_PATTERN = re.compile(
+    r"^\s*(-)?\s*(?:₹|Rs\.?|INR)?\s*(\d{1,2}(?:,\d{2})*,\d{3}|\d+)(?:\.(\d{1,2}))?\s*$"
+)
+
+_CENT = Decimal("0.01")
+
+
+def group_indian(rupees):
+    """
+    Indian digit grouping of a non-negative integer
+
+    Args:
+        rupees (int): Whole amount, e.g. 1234567
+
+    Returns:
+        str: e.g. "12,34,567"
+    """
+    if rupees < 100000:
+        return _BELOW_LAKH[rupees]
+    rupees, low = divmod(rupees, 100000)
+    groups = [_BELOW_LAKH[low] if low >= 10000 else f"{_PAIRS[low // 1000]},{_TRIPLES[low % 1000]}"]
+    while rupees >= 100:
+        rupees, pair = divmod(rupees, 100)
+        groups.append(_PAIRS[pair])
+    groups.append(str(rupees))
+    return ",".join(reversed(groups))
+
+
+def format_paise(paise, symbol="₹"):
+    """
+    Format an integer amount in paise
+
+    Args:
+        paise (int): e.g. 123456789
+        symbol (str): Currency symbol
+
+    Returns:
+        str: e.g. "₹12,34,567.89"
+    """
+    if paise < 0:
+        return f"-{format_paise(-paise, symbol)}"
+    rupees, fraction = divmod(paise, 100)
+    return f"{symbol}{group_indian(rupees)}.{_PAIRS[fraction]}"
+
+
+def format_paise_batch(paise_values, symbol="₹"):
+    """Format many paise amounts; same output as format_paise() for each"""
+    below_lakh = _BELOW_LAKH
+    pairs = _PAIRS
+    formatted = []
+    append = formatted.append
+    for paise in paise_values:
+        if 0 <= paise < 10000000:
+            rupees, fraction = divmod(paise, 100)
+            append(f"{symbol}{below_lakh[rupees]}.{pairs[fraction]}")
+        else:
+            append(format_paise(paise, symbol))
+    return formatted
+
+
+def format_inr(amount):
+    """
+    Format a rupee amount with Indian grouping
+
+    Args:
+        amount (int|float|Decimal|str): e.g. 1234567.891
+
+    Returns:
+        str: e.g. "₹12,34,567.89" (rounded half up to paise)
+    """
+    paise = int((Decimal(str(amount)) / _CENT).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+    return format_paise(paise)
+
+
+def parse_paise(text):
+    """
+    Parse an INR string in Indian (or no) grouping
+
+    Args:
+        text (str): e.g. "₹12,34,567.89"
+
+    Returns:
+        int: Amount in paise, e.g. 123456789
+
+    Raises:
+        ValueError: If the string is not an INR amount with valid grouping
+    """
+    match = INR_PATTERN.match(text)
+    if match is None:
+        raise ValueError(f"Not an INR amount: {text!r}")
+    sign, rupees, fraction = match.groups()
+    paise = int(rupees.replace(",", "")) * 100 + int((fraction or "0").ljust(2, "0"))
+    return -paise if sign else paise
+
+
+def parse_inr(text):
+    """
+    Parse an INR string exactly
+
+    Returns:
+        Decimal: e.g. Decimal("1234567.89")
+    """
+    return Decimal(parse_paise(text)).scaleb(-2)
@@ -0,0 +1,239 @@
+"""
+Locator registry and selector compiler
+Enumerates every (By, value) locator defined on the page objects, checks them
+against stored DOM snapshots with the fake DOM, and proposes the fastest
+equivalent strategy (ID > data-test > tightened CSS) for each one
+"""
+import ast
+import importlib
+import inspect
+import os
+import pkgutil
+from collections import namedtuple
+from statistics import median
+from time import perf_counter_ns
+from selenium.common.exceptions import InvalidSelectorException
+from selenium.webdriver.common.by import By
+from pages.base_page import BasePage
+from utils.fake_dom import Document, Selector, locator_to_css
+
+
+STRATEGIES = {value for name, value in vars(By).items() if not name.startswith("_") and isinstance(value, str)}
+
+# BasePage methods that use every match of a locator; all others use the first
+MULTIPLE_METHODS = {
+    "find_elements", "get_texts", "count_elements", "extract_rows", "is_element_present", "is_element_absent",
+}
+
+# page: class name, name: attribute (or "FIELDS.field" for row fields),
+# usage: "single", "multiple", "field" or "unused"
+LocatorEntry = namedtuple("LocatorEntry", "page name locator module usage")
+
+
+def is_locator(value):
+    """True for a (By, value) tuple"""
+    return (
+        isinstance(value, tuple) and len(value) == 2
+        and value[0] in STRATEGIES and isinstance(value[1], str)
+    )
+
+
+def discover(package="pages"):
+    """
+    Every locator defined on BasePage subclasses in a package
+
+    Returns:
+        list: LocatorEntry per locator, sorted by page and name
+    """
+    entries = []
+    for module_info in pkgutil.iter_modules(importlib.import_module(package).__path__):
+        module = importlib.import_module(f"{package}.{module_info.name}")
+        for cls in vars(module).values():
+            if inspect.isclass(cls) and issubclass(cls, BasePage) and cls.__module__ == module.__name__:
+                entries.extend(_class_locators(cls))
+    return sorted(entries, key=lambda entry: (entry.page, entry.name))
+
+
+def _class_locators(cls):
+    usage = _usage(cls)
+    named = {}
+    entries = []
+    for name, value in vars(cls).items():
+        if is_locator(value):
+            named[value] = name
+            entries.append(LocatorEntry(cls.__name__, name, value, cls.__module__, usage.get(name, "unused")))
+    # Row field locators (PRODUCT_FIELDS etc.) that are not also class attributes
+    for name, value in vars(cls).items():
+        if name.endswith("_FIELDS") and isinstance(value, dict):
+            for field, spec in value.items():
+                locator = spec[0] if isinstance(spec, tuple) and spec else None
+                if not is_locator(locator):
+                    continue
+                if locator not in named:
+                    entries.append(LocatorEntry(cls.__name__, f"{name}.{field}", locator, cls.__module__, "field"))
+                elif usage.get(named[locator]) is None:
+                    usage[named[locator]] = "field"
+    return [entry._replace(usage=usage.get(entry.name, entry.usage)) for entry in entries]
+
+
+def _usage(cls):
+    """Attribute name -> "single" or "multiple", from self.method(self.NAME) calls in the class"""
+    try:
+        tree = ast.parse(inspect.getsource(cls))
+    except (OSError, TypeError, SyntaxError):
+        return {}
+    usage = {}
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.args):
+            continue
+        arg = node.args[0]
+        if isinstance(arg, ast.Attribute) and isinstance(arg.value, ast.Name) and arg.value.id == "self":
+            kind = "multiple" if node.func.attr in MULTIPLE_METHODS else "single"
+            # A locator used once through a single-element method must be unambiguous
+            if usage.get(arg.attr) != "single":
+                usage[arg.attr] = kind
+    return usage
+
+
+class LocatorAudit:
+    """Checks locators against one DOM snapshot"""
+
+    def __init__(self, html, repeat=200):
+        """
+        Args:
+            html (str): DOM snapshot (page source of the page the locators belong to)
+            repeat (int): Lookups per locator when measuring lookup time
+        """
+        self.document = Document(html)
+        self.repeat = repeat
+
+    def check(self, entry):
+        """
+        Validate one locator and compile its fastest equivalent
+
+        Returns:
+            dict: page, name, locator, usage, status ("ok", "ambiguous",
+                "absent" or "invalid"), matches, scanned, lookup_us, rewrite
+                (suggested (By, value) or None) and rewrite_us
+        """
+        result = {
+            "page": entry.page, "name": entry.name, "locator": list(entry.locator), "usage": entry.usage,
+            "status": "ok", "matches": 0, "scanned": 0, "lookup_us": None, "rewrite": None, "rewrite_us": None,
+        }
+        try:
+            css = locator_to_css(*entry.locator)
+            matches = self.document.select(css)
+        except InvalidSelectorException as e:
+            result.update(status="invalid", error=str(e))
+            return result
+        result["matches"] = len(matches)
+        result["scanned"] = self._scanned(css)
+        result["lookup_us"] = self.measure(css)
+        if not matches:
+            # Often state-dependent (badges, error messages), so not an error by itself
+            result["status"] = "absent"
+            return result
+        if entry.usage == "single" and len(matches) > 1:
+            result["status"] = "ambiguous"
+        rewrite = self.compile(entry.locator, matches)
+        if rewrite:
+            result["rewrite"] = list(rewrite[0])
+            result["rewrite_us"] = rewrite[1]
+        return result
+
+    def compile(self, locator, matches):
+        """
+        Faster equivalent locator on this snapshot
+
+        Candidates are tried in order: By.ID, a data-test attribute, then the
+        original CSS narrowed by the rarest class shared by every match. A
+        candidate must select exactly the same elements as the original and
+        leave at most half as many nodes to test after the id/class/tag index
+        lookup, which browsers hash as well (timings alone are too noisy to rank).
+
+        Returns:
+            tuple: ((By, value), lookup_us), or None if the locator is already the best
+        """
+        if locator[0] == By.ID:
+            return None
+        candidates = []
+        if len(matches) == 1 and matches[0].attrs.get("id"):
+            candidates.append((By.ID, matches[0].attrs["id"]))
+        tests = {node.attrs.get("data-test") for node in matches}
+        if len(tests) == 1 and None not in tests:
+            candidates.append((By.CSS_SELECTOR, f"[data-test=\"{tests.pop()}\"]"))
+        css = locator_to_css(*locator)
+        scanned = self._scanned(css)
+        compound = Selector.compile(css).alternatives[0][-1][1] if "," not in css else None
+        if compound is not None and not compound.classes and compound.id is None:
+            shared = set(matches[0].classes).intersection(*(node.classes for node in matches[1:]))
+            if shared:
+                rarest = min(sorted(shared), key=lambda cls: len(self.document.candidates(_class_compound(cls))))
+                candidates.append((By.CSS_SELECTOR, f"{css}.{rarest}"))
+        for candidate in candidates:
+            candidate_css = locator_to_css(*candidate)
+            if self._scanned(candidate_css) * 2 <= scanned and self.document.select(candidate_css) == matches:
+                return candidate, self.measure(candidate_css)
+        return None
+
+    def measure(self, css):
+        """Median lookup time in microseconds on the snapshot"""
+        selector = Selector.compile(css)
+        samples = []
+        for _ in range(5):
+            start = perf_counter_ns()
+            for _ in range(self.repeat):
+                selector.select(self.document)
+            samples.append((perf_counter_ns() - start) / self.repeat / 1000)
+        return round(median(samples), 2)
+
+    def _scanned(self, css):
+        """Nodes the lookup has to test after the index narrows it down"""
+        return sum(len(self.document.candidates(steps[-1][1])) for steps in Selector.compile(css).alternatives)
+
+
+def _class_compound(cls):
+    return Selector.compile(f".{cls}").alternatives[0][-1][1]
+
+
+def audit(entries, snapshot_dir, repeat=200, slow_factor=5.0, live_timings=None, slow_ms=250.0):
+    """
+    Check every locator whose page has a snapshot named <PageClass>.html
+
+    Args:
+        entries (list): LocatorEntry items from discover()
+        snapshot_dir (str): Directory of DOM snapshots
+        repeat (int): Lookups per measurement
+        slow_factor (float): Flag lookups this many times slower than the median on the page
+        live_timings (dict): Optional action_timings.json content; adds measured browser times
+        slow_ms (float): Flag locators whose mean browser time is at least this
+
+    Returns:
+        list: check() results, with "slow" (bool) and "live_ms" added
+    """
+    live = {}
+    for row in (live_timings or {}).get("locators", []):
+        key = (row["page"], row["locator"])
+        live[key] = max(live.get(key, 0), row["mean_ms"])
+
+    results = []
+    by_page = {}
+    for entry in entries:
+        by_page.setdefault(entry.page, []).append(entry)
+    for page, page_entries in sorted(by_page.items()):
+        path = os.path.join(snapshot_dir, f"{page}.html")
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding="utf-8") as f:
+            checker = LocatorAudit(f.read(), repeat)
+        page_results = [checker.check(entry) for entry in page_entries]
+        times = [r["lookup_us"] for r in page_results if r["lookup_us"] is not None]
+        typical = median(times) if times else 0
+        for result, entry in zip(page_results, page_entries):
+            result["live_ms"] = live.get((page, f"{entry.locator[0]}={entry.locator[1]}"))
+            result["slow"] = bool(
+                (result["lookup_us"] and typical and result["lookup_us"] >= slow_factor * typical)
+                or (result["live_ms"] is not None and result["live_ms"] >= slow_ms)
+            )
+        results.extend(page_results)
+    return results
@@ -0,0 +1,136 @@
+"""
+Price consistency checks
+Captures a product -> price index from the listing page once per session and
+verifies cart rows and displayed totals against it with one dict lookup per row
+"""
+from decimal import Decimal
+from utils.currency_converter import CurrencyConverter
+
+
+class PriceIndex:
+    # Indexes captured during this session, by storefront key
+    _session = {}
+
+    def __init__(self, prices):
+        """
+        Args:
+            prices (dict): Product name -> price in minor units (cents/paise)
+        """
+        self.prices = prices
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Build an index from listing rows (ProductsPage/IndianProductsPage.get_product_rows())
+
+        Raises:
+            ValueError: If the listing shows the same product at two prices
+        """
+        names = [row["name"] for row in rows]
+        prices = {}
+        for name, cents in zip(names, CurrencyConverter.parse_cents(row["price"] for row in rows)):
+            if prices.get(name, cents) != cents:
+                raise ValueError(f"Listing shows '{name}' at more than one price")
+            prices[name] = cents
+        return cls(prices)
+
+    @classmethod
+    def for_session(cls, key, loader):
+        """
+        Index for a storefront, captured by loader() on first use in the session
+
+        Args:
+            key (str): Storefront, e.g. "saucedemo" or "indian"
+            loader (callable): Returns a PriceIndex, called while on the listing page
+        """
+        if key not in cls._session:
+            cls._session[key] = loader()
+        return cls._session[key]
+
+    @classmethod
+    def clear_session(cls):
+        """Forget captured indexes"""
+        cls._session.clear()
+
+    def verify_rows(self, rows):
+        """
+        Compare cart rows against the listing
+
+        Args:
+            rows (list): Dicts with "name", unit "price" and optionally "quantity"
+                (CartPage/IndianCartPage.get_cart_rows())
+
+        Returns:
+            list: Human-readable mismatches; empty when every row matches
+        """
+        return self._check(rows)[0]
+
+    def expected_total(self, rows):
+        """
+        Total of the listing prices of the products in rows, times their quantity
+
+        Returns:
+            Decimal: Exact total, e.g. Decimal("39.98")
+
+        Raises:
+            ValueError: If a row is not on the listing or has an invalid quantity
+        """
+        problems, total = self._check(rows, prices=False)
+        if problems:
+            raise ValueError("; ".join(problems))
+        return total
+
+    def _check(self, rows, prices=True):
+        """
+        Mismatches and expected total of cart rows
+
+        Args:
+            rows (list): Cart rows
+            prices (bool): Also compare each row's displayed unit price
+
+        Returns:
+            tuple: (list of mismatches, Decimal total of the rows that could be priced)
+        """
+        problems = []
+        total = 0
+        displayed = CurrencyConverter.parse_cents(row["price"] for row in rows) if prices else [None] * len(rows)
+        for row, cents in zip(rows, displayed):
+            expected = self.prices.get(row["name"])
+            quantity = self._quantity(row)
+            if expected is None:
+                problems.append(f"'{row['name']}' is not on the listing page")
+            elif prices and expected != cents:
+                problems.append(f"'{row['name']}' costs {row['price']} in the cart but {self._display(expected)} on the listing")
+            if quantity is None:
+                problems.append(f"'{row['name']}' has an invalid quantity {row.get('quantity')!r}")
+            elif expected is not None:
+                total += expected * quantity
+        return problems, Decimal(total).scaleb(-2)
+
+    def verify_total(self, rows, displayed_total):
+        """
+        Compare cart rows and the displayed cart total against the listing
+
+        Args:
+            rows (list): Cart rows with "name" and "price"
+            displayed_total (str): Total shown on the page, e.g. "₹1,54,989.00"
+
+        Returns:
+            list: Human-readable mismatches; empty when rows and total match
+        """
+        problems, expected = self._check(rows)
+        shown = Decimal(CurrencyConverter.parse_cents([displayed_total])[0]).scaleb(-2)
+        if shown != expected:
+            problems.append(f"Displayed total {displayed_total} does not match listing total {expected}")
+        return problems
+
+    @staticmethod
+    def _quantity(row):
+        """Positive integer quantity of a row (1 when the page shows none), or None if invalid"""
+        text = str(row.get("quantity") or "1").strip()
+        return int(text) if text.isdigit() and int(text) > 0 else None
+
+    @staticmethod
+    def _display(cents):
+        """Plain decimal rendering of minor units for messages"""
+        return str(Decimal(cents).scaleb(-2))
@@ -1,24 +1,100 @@
 """
 Screenshot utility for capturing test failures
+The browser is only asked for the raw data during teardown; decoding and
+writing happen on a background thread pool that is drained once at session end.
+Files go to a content-addressed store (utils/artifact_store.py), so identical
+captures are kept once.
 """
+import base64
+import json
 import os
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from selenium.common.exceptions import WebDriverException
+from utils.artifact_store import ArtifactStore
 
 
 class Screenshot:
+    SCREENSHOT_DIR = "reports/screenshots"
+
+    # Background writer threads (SCREENSHOT_WORKERS)
+    WORKERS = int(os.environ.get("SCREENSHOT_WORKERS", "2"))
+
+    _executor = None
+    _pending = []
+    _store = None
+
+    # Errors from background writes, reported in the terminal summary
+    failures = []
+
     @staticmethod
     def capture(driver, test_name):
-        """Capture screenshot with timestamp"""
-        # Create screenshots directory if it doesn't exist
-        screenshot_dir = "reports/screenshots"
-        os.makedirs(screenshot_dir, exist_ok=True)
-        
-        # Generate filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{test_name}_{timestamp}.png"
-        filepath = os.path.join(screenshot_dir, filename)
-        
-        # Capture screenshot
-        driver.save_screenshot(filepath)
+        """
+        Capture screenshot, DOM and browser console log
+
+        Returns:
+            Future: Resolves to the stored PNG path once the background write is done
+        """
+        png_base64 = driver.get_screenshot_as_base64()
+        try:
+            page_source = driver.page_source
+        except WebDriverException:
+            page_source = None
+        try:
+            console_log = driver.get_log("browser")
+        except (WebDriverException, AttributeError):
+            console_log = None
+
+        if Screenshot._executor is None:
+            Screenshot._executor = ThreadPoolExecutor(
+                max_workers=Screenshot.WORKERS, thread_name_prefix="screenshot"
+            )
+        future = Screenshot._executor.submit(
+            Screenshot._write, Screenshot.store(), test_name, png_base64, page_source, console_log
+        )
+        Screenshot._pending.append(future)
+        return future
+
+    @staticmethod
+    def wait_for_pending():
+        """
+        Block until every queued capture is on disk
+
+        A failed write (disk, decoding or Pillow error) is added to failures
+        instead of raised, so the rest of the session teardown still runs.
+
+        Returns:
+            list: Paths written since the last call
+        """
+        written = []
+        for future in Screenshot._pending:
+            try:
+                written.append(future.result())
+            except Exception as e:
+                Screenshot.failures.append(f"{type(e).__name__}: {e}")
+        Screenshot._pending = []
+        if Screenshot._executor is not None:
+            Screenshot._executor.shutdown(wait=True)
+            Screenshot._executor = None
+        return written
+
+    @staticmethod
+    def store():
+        """Artifact store for this process, rooted at SCREENSHOT_DIR"""
+        if Screenshot._store is None:
+            Screenshot._store = ArtifactStore.from_env(Screenshot.SCREENSHOT_DIR)
+        return Screenshot._store
+
+    @staticmethod
+    def _write(store, test_name, png_base64, page_source, console_log):
+        """Decode and store the screenshot plus its DOM and console snapshots"""
+        filepath, thumbnail = store.put_image(base64.b64decode(png_base64))
+        entry = {"test": test_name, "screenshot": filepath}
+        if thumbnail:
+            entry["thumbnail"] = thumbnail
+        if page_source is not None:
+            entry["dom"] = store.put(page_source.encode("utf-8"), ".html")
+        if console_log is not None:
+            entry["console"] = store.put(json.dumps(console_log, indent=2).encode("utf-8"), ".console.json")
+        store.record(**entry)
         print(f"Screenshot saved: {filepath}")
         return filepath
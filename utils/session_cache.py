@@ -0,0 +1,129 @@
+"""
+Authenticated session cache
+Logs in through the UI once per worker, then restores the captured
+cookies and web storage into later drivers instead of driving the form
+"""
+from urllib.parse import urlsplit
+from selenium.common.exceptions import WebDriverException
+
+
+# Cookies can only be set on http(s) pages; file:// demos always log in through the UI
+CACHEABLE_SCHEMES = ("http", "https")
+
+
+# Returns {"local": {...}, "session": {...}} for the current origin
+CAPTURE_STORAGE_SCRIPT = """
+var dump = function (storage) {
+    var data = {};
+    for (var i = 0; i < storage.length; i++) {
+        var key = storage.key(i);
+        data[key] = storage.getItem(key);
+    }
+    return data;
+};
+return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+RESTORE_STORAGE_SCRIPT = """
+var snapshot = arguments[0];
+Object.keys(snapshot.local).forEach(function (k) { window.localStorage.setItem(k, snapshot.local[k]); });
+Object.keys(snapshot.session).forEach(function (k) { window.sessionStorage.setItem(k, snapshot.session[k]); });
+"""
+
+
+class SessionSnapshot:
+    def __init__(self, cookies, storage, url, login_url):
+        self.cookies = cookies
+        self.storage = storage
+        self.url = url
+        self.login_url = login_url
+
+
+class SessionCache:
+    # Disabled with --no-session-cache
+    enabled = True
+
+    _snapshots = {}
+    hits = 0
+    misses = 0
+    rejected = 0
+
+    @classmethod
+    def login(cls, driver, key, ui_login, verify=None):
+        """
+        Log the driver in, restoring a cached session when possible
+
+        Args:
+            driver: WebDriver positioned on the application's login page
+            key (str): Cache key, e.g. site and username; sessions are also
+                keyed by the login page's origin, so a local and a remote
+                storefront never share one
+            ui_login (callable): Performs a real login through the UI
+            verify (callable): Takes the driver and returns True if logged in.
+                Defaults to "still on the URL the UI login landed on".
+
+        Returns:
+            WebDriver: The same driver, logged in
+        """
+        login_url = driver.current_url
+        origin = urlsplit(login_url)
+        if not cls.enabled or origin.scheme not in CACHEABLE_SCHEMES:
+            ui_login()
+            return driver
+        key = (f"{origin.scheme}://{origin.netloc}", key)
+        snapshot = cls._snapshots.get(key)
+        if snapshot is not None:
+            if cls._restore(driver, snapshot, verify):
+                cls.hits += 1
+                return driver
+            # Snapshot no longer accepted - drop it and log in for real
+            cls.rejected += 1
+            cls._snapshots.pop(key, None)
+            cls._clear(driver)
+            driver.get(snapshot.login_url)
+
+        cls.misses += 1
+        ui_login()
+        snapshot = cls.capture(driver, login_url)
+        # Without a verify callback the landing URL is the only proof of login
+        if verify is not None or snapshot.url != login_url:
+            cls._snapshots[key] = snapshot
+        return driver
+
+    @classmethod
+    def capture(cls, driver, login_url):
+        """Snapshot cookies and web storage of the current page"""
+        return SessionSnapshot(
+            cookies=driver.get_cookies(),
+            storage=driver.execute_script(CAPTURE_STORAGE_SCRIPT),
+            url=driver.current_url,
+            login_url=login_url,
+        )
+
+    @classmethod
+    def clear(cls):
+        """Forget every cached session"""
+        cls._snapshots.clear()
+
+    @classmethod
+    def _restore(cls, driver, snapshot, verify):
+        """Inject a snapshot and check that the application accepts it"""
+        try:
+            for cookie in snapshot.cookies:
+                driver.add_cookie(cookie)
+            driver.execute_script(RESTORE_STORAGE_SCRIPT, snapshot.storage)
+            driver.get(snapshot.url)
+            if verify is not None:
+                return bool(verify(driver))
+            return driver.current_url == snapshot.url
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _clear(driver):
+        """Remove whatever part of the snapshot was injected"""
+        try:
+            driver.delete_all_cookies()
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except WebDriverException:
+            pass
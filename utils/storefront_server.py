@@ -0,0 +1,58 @@
+"""
+Local storefront server
+Serves the bundled stand-in storefronts in demo_site/ over HTTP on localhost,
+so test runs need no network access and do not depend on saucedemo.com
+"""
+import os
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+
+DEMO_SITE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "demo_site")
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        """Keep request logs out of the test output"""
+
+
+class StorefrontServer:
+    def __init__(self, host="127.0.0.1", port=0, root=DEMO_SITE_DIR):
+        """
+        Args:
+            host (str): Interface to bind
+            port (int): Port to bind (0 picks a free port, safe for parallel workers)
+            root (str): Directory to serve
+        """
+        self.host = host
+        self.port = port
+        self.root = root
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        """Base URL of the saucedemo-style storefront (login page)"""
+        return f"http://{self.host}:{self.port}/"
+
+    @property
+    def indian_url(self):
+        """URL of the Indian storefront"""
+        return self.url + "indian_ecommerce.html"
+
+    def start(self):
+        """Start serving in a background thread"""
+        handler = partial(_QuietHandler, directory=self.root)
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Shut the server down"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,121 @@
+"""
+Streaming test report
+Appends each result to a JSONL stream and to an HTML page as it arrives, so
+the report can be opened while the run is still going. Screenshots and other
+artifacts are linked, never inlined.
+"""
+import html
+import json
+import os
+import threading
+from datetime import datetime
+
+
+HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: Arial, Helvetica, sans-serif; margin: 16px; }}
+table {{ border-collapse: collapse; width: 100%; }}
+th, td {{ border: 1px solid #ddd; padding: 4px 8px; text-align: left; vertical-align: top; }}
+tr.passed td.outcome {{ color: #2e7d32; }}
+tr.failed td.outcome, tr.error td.outcome {{ color: #c62828; font-weight: bold; }}
+tr.skipped td.outcome {{ color: #f9a825; }}
+tr.artifact td {{ background: #fafafa; font-size: 90%; }}
+pre {{ margin: 0; white-space: pre-wrap; max-height: 12em; overflow: auto; }}
+#status {{ margin: 8px 0; }}
+</style>
+<script>
+// Reload while the run is in progress; the footer written at session end stops it
+setTimeout(function () {{
+    if (!document.getElementById("run-complete")) {{ window.location.reload(); }}
+}}, 5000);
+</script>
+</head>
+<body>
+<h1>{title}</h1>
+<div id="status">Started {started}. Results appear as tests finish; this page refreshes until the run completes.</div>
+<table>
+<tr><th>Time</th><th>Test</th><th>Outcome</th><th>Duration</th><th>Details</th></tr>
+"""
+
+HTML_ROW = (
+    '<tr class="{outcome}"><td>{time}</td><td>{nodeid}</td><td class="outcome">{outcome}</td>'
+    '<td>{duration:.2f}s</td><td>{details}</td></tr>\n'
+)
+
+HTML_ARTIFACT_ROW = '<tr class="artifact"><td></td><td>{nodeid}</td><td>{kind}</td><td></td><td><a href="{href}">{name}</a></td></tr>\n'
+
+HTML_FOOT = """</table>
+<div id="run-complete">Finished {finished}: {summary}</div>
+</body>
+</html>
+"""
+
+
+class StreamReporter:
+    # Reporter for the running session, set from conftest (None when disabled)
+    current = None
+
+    def __init__(self, path_prefix, title="E-Commerce Automation Test Report"):
+        """
+        Args:
+            path_prefix (str): Output path without extension; writes <prefix>.jsonl and <prefix>.html
+            title (str): Page title
+        """
+        self.jsonl_path = f"{path_prefix}.jsonl"
+        self.html_path = f"{path_prefix}.html"
+        self.counts = {}
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.html_path) or ".", exist_ok=True)
+        # Line buffered, so every record reaches the disk as soon as it is written
+        self._jsonl = open(self.jsonl_path, "w", encoding="utf-8", buffering=1)
+        self._html = open(self.html_path, "w", encoding="utf-8", buffering=1)
+        started = datetime.now().isoformat(timespec="seconds")
+        self._html.write(HTML_HEAD.format(title=html.escape(title), started=started))
+        self._jsonl.write(json.dumps({"event": "start", "time": started}) + "\n")
+
+    def add_result(self, nodeid, outcome, duration, when="call", details=""):
+        """Append one test result"""
+        now = datetime.now()
+        with self._lock:
+            self.counts[outcome] = self.counts.get(outcome, 0) + 1
+            self._jsonl.write(json.dumps({
+                "event": "result", "time": now.isoformat(timespec="seconds"), "nodeid": nodeid,
+                "outcome": outcome, "when": when, "duration": round(duration, 3), "details": details,
+            }) + "\n")
+            self._html.write(HTML_ROW.format(
+                outcome=outcome, time=now.strftime("%H:%M:%S"), nodeid=html.escape(nodeid),
+                duration=duration, details=f"<pre>{html.escape(details)}</pre>" if details else "",
+            ))
+
+    def add_artifact(self, nodeid, kind, path):
+        """Link an artifact (e.g. a screenshot) to a test"""
+        href = os.path.relpath(path, os.path.dirname(os.path.abspath(self.html_path))).replace(os.sep, "/")
+        with self._lock:
+            if self._html.closed:
+                return
+            self._jsonl.write(json.dumps({"event": "artifact", "nodeid": nodeid, "kind": kind, "path": path}) + "\n")
+            self._html.write(HTML_ARTIFACT_ROW.format(
+                nodeid=html.escape(nodeid), kind=html.escape(kind),
+                href=html.escape(href), name=html.escape(os.path.basename(path)),
+            ))
+
+    def attach_future(self, nodeid, kind, future):
+        """Link an artifact once a background write (e.g. Screenshot.capture) finishes"""
+        def done(finished):
+            if finished.exception() is None and finished.result():
+                self.add_artifact(nodeid, kind, finished.result())
+        future.add_done_callback(done)
+
+    def close(self):
+        """Write the footer that marks the run complete"""
+        finished = datetime.now().isoformat(timespec="seconds")
+        summary = ", ".join(f"{count} {outcome}" for outcome, count in sorted(self.counts.items())) or "no tests"
+        with self._lock:
+            self._jsonl.write(json.dumps({"event": "finish", "time": finished, "counts": self.counts}) + "\n")
+            self._html.write(HTML_FOOT.format(finished=finished, summary=html.escape(summary)))
+            self._jsonl.close()
+            self._html.close()
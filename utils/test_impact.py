@@ -0,0 +1,530 @@
+"""
+Test impact analysis
+Builds a static dependency map from every test in tests/ to the page-object
+classes, locators, methods and utils it touches (e.g. TestIndianCart ->
+IndianCartPage.REMOVE_BUTTONS), maps a git diff onto those symbols and
+selects only the tests a change can affect.
+
+Usage:
+    pytest --impacted-since=origin/main
+    python -m utils.test_impact origin/main        # list impacted tests
+    python -m utils.test_impact --map              # print the dependency map
+"""
+import ast
+import os
+import re
+import subprocess
+import sys
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Python sources that are analysed; any other changed file (except IGNORED_PATTERNS) selects every test
+SOURCE_DIRS = ("pages", "utils", "tests")
+SOURCE_FILES = ("conftest.py",)
+
+# Changed paths that never affect test behaviour
+IGNORED_PATTERNS = (
+    re.compile(r"\.md$"),
+    re.compile(r"^\.gitignore$"),
+    re.compile(r"(^|/)LICENSE"),
+    re.compile(r"^reports/"),
+)
+
+# conftest hooks that run per test and can change its outcome; their whole dependency
+# closure is part of every test's. Other hooks (configure, reporting, summaries) only
+# count with their own body, so a util that feeds reporting does not select every test.
+BEHAVIOUR_HOOKS = (
+    "pytest_runtest_protocol", "pytest_runtest_setup", "pytest_runtest_call",
+    "pytest_runtest_teardown", "pytest_runtest_makereport",
+)
+
+# Marker members for statements outside any method/attribute
+CLASS = "<class>"
+MODULE = "<module>"
+
+HUNK_HEADER = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+class ModuleInfo:
+    def __init__(self, name, path, is_test):
+        self.name = name
+        self.path = path
+        self.is_test = is_test
+        # Local name -> (module, name or None for a module import)
+        self.imports = {}
+        # Class -> {"bases": [local names], "members": {member: (refs, params)}}
+        self.classes = {}
+        # Module-level function or global -> (refs, params)
+        self.functions = {}
+        # (first line, last line, (module, class or None, member))
+        self.spans = []
+
+
+class _RefCollector(ast.NodeVisitor):
+    """Collect the references made by one function or statement"""
+
+    def __init__(self, track_instances):
+        self.track_instances = track_instances
+        self.refs = set()
+        self.instances = {}
+
+    def visit_Assign(self, node):
+        # page = ProductsPage(driver) -> later page.method() resolves to ProductsPage.method
+        if self.track_instances and isinstance(node.value, ast.Call) and isinstance(node.value.func, ast.Name):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    self.instances[target.id] = node.value.func.id
+        self.generic_visit(node)
+
+    def visit_Call(self, node):
+        if self.track_instances and isinstance(node.func, ast.Name):
+            self.refs.add(("init", node.func.id))
+            for arg in node.args + [keyword.value for keyword in node.keywords]:
+                self.visit(arg)
+            return
+        self.generic_visit(node)
+
+    def visit_Attribute(self, node):
+        if isinstance(node.value, ast.Call) and isinstance(node.value.func, ast.Name) and node.value.func.id == "super":
+            self.refs.add(("super", node.attr))
+            return
+        if isinstance(node.value, ast.Name):
+            owner = node.value.id
+            if owner == "self":
+                self.refs.add(("self", node.attr))
+            elif owner in self.instances:
+                self.refs.add(("attr", self.instances[owner], node.attr))
+            else:
+                self.refs.add(("attr", owner, node.attr))
+            # The owner name itself is covered by the attribute reference
+            return
+        self.generic_visit(node)
+
+    def visit_Name(self, node):
+        if isinstance(node.ctx, ast.Load):
+            self.refs.add(("name", node.id))
+
+
+def _collect(node, track_instances):
+    """References made by a statement; tests also resolve method calls on page instances"""
+    collector = _RefCollector(track_instances)
+    # Two passes so instance assignments are known before their uses
+    if track_instances:
+        collector.visit(node)
+        collector.refs.clear()
+    collector.visit(node)
+    return collector.refs
+
+
+def _params(node):
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return [arg.arg for arg in node.args.args + node.args.kwonlyargs]
+    return []
+
+
+def _first_line(node):
+    decorators = getattr(node, "decorator_list", [])
+    return min([node.lineno] + [d.lineno for d in decorators])
+
+
+def _assigned_names(node):
+    if isinstance(node, ast.Assign):
+        return [t.id for t in node.targets if isinstance(t, ast.Name)]
+    if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+        return [node.target.id]
+    return []
+
+
+def analyze_module(name, path, source, is_test):
+    """Parse one module into its imports, classes, members and line spans"""
+    info = ModuleInfo(name, path, is_test)
+    tree = ast.parse(source, filename=path)
+    for node in tree.body:
+        start, end = _first_line(node), node.end_lineno
+        if isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            for alias in node.names:
+                info.imports[alias.asname or alias.name] = (node.module, alias.name)
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                info.imports[alias.asname or alias.name.split(".")[0]] = (alias.name if alias.asname else alias.name.split(".")[0], None)
+        if isinstance(node, ast.ClassDef):
+            members = {}
+            member_lines = set()
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    names = [item.name]
+                else:
+                    names = _assigned_names(item)
+                for member in names:
+                    members[member] = (_collect(item, is_test), _params(item))
+                    info.spans.append((_first_line(item), item.end_lineno, (name, node.name, member)))
+                if names:
+                    member_lines.update(range(_first_line(item), item.end_lineno + 1))
+            info.classes[node.name] = {
+                "bases": [base.id for base in node.bases if isinstance(base, ast.Name)],
+                "members": members,
+            }
+            for line in range(start, end + 1):
+                if line not in member_lines:
+                    info.spans.append((line, line, (name, node.name, CLASS)))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            info.functions[node.name] = (_collect(node, is_test), _params(node))
+            info.spans.append((start, end, (name, None, node.name)))
+        elif _assigned_names(node):
+            for target in _assigned_names(node):
+                info.functions[target] = (_collect(node, False), [])
+                info.spans.append((start, end, (name, None, target)))
+        else:
+            info.spans.append((start, end, (name, None, MODULE)))
+    return info
+
+
+class ImpactMap:
+    def __init__(self, root=PROJECT_ROOT):
+        self.root = root
+        self.modules = {}
+        for path in self._source_files():
+            relative = os.path.relpath(path, root).replace(os.sep, "/")
+            module_name = relative[:-3].replace("/", ".")
+            with open(path, encoding="utf-8") as f:
+                source = f.read()
+            self.modules[module_name] = analyze_module(
+                module_name, relative, source, relative.startswith("tests/")
+            )
+        self._closures = {}
+
+    def _source_files(self):
+        for filename in SOURCE_FILES:
+            path = os.path.join(self.root, filename)
+            if os.path.exists(path):
+                yield path
+        for directory in SOURCE_DIRS:
+            for dirpath, _, filenames in os.walk(os.path.join(self.root, directory)):
+                for filename in sorted(filenames):
+                    if filename.endswith(".py"):
+                        yield os.path.join(dirpath, filename)
+
+    # -- symbol resolution -------------------------------------------------
+
+    def _lookup_class(self, module, local):
+        """(module, class) for a class name visible in a module, or None"""
+        info = self.modules.get(module)
+        if info is None:
+            return None
+        if local in info.classes:
+            return module, local
+        if local in info.imports:
+            target_module, target = info.imports[local]
+            if target and target_module in self.modules and target in self.modules[target_module].classes:
+                return target_module, target
+        return None
+
+    def _mro(self, module, cls):
+        """The class and its project base classes, nearest first"""
+        order = [(module, cls)]
+        for base in self.modules[module].classes[cls]["bases"]:
+            resolved = self._lookup_class(module, base)
+            if resolved:
+                order.extend(c for c in self._mro(*resolved) if c not in order)
+        return order
+
+    def _find_member(self, module, cls, member):
+        """Defining (module, class) of a member looked up through the class hierarchy"""
+        for owner in self._mro(module, cls):
+            if member in self.modules[owner[0]].classes[owner[1]]["members"]:
+                return owner
+        return None
+
+    def _resolve(self, module, ref, instance_class=None, owner=None):
+        """
+        Dependencies named by one reference
+
+        Args:
+            module (str): Module the reference appears in
+            ref (tuple): Reference recorded by _RefCollector
+            instance_class (tuple): (module, class) that "self" is an instance of
+            owner (tuple): (module, class) whose method makes the reference
+
+        Returns:
+            list: Work items (module, class, member, instance class)
+        """
+        kind = ref[0]
+        info = self.modules[module]
+        if kind == "super":
+            if owner:
+                for base in self._mro(*owner)[1:]:
+                    if ref[1] in self.modules[base[0]].classes[base[1]]["members"]:
+                        return [(base[0], base[1], ref[1], instance_class)]
+            return []
+        if kind == "self":
+            if instance_class:
+                return [(instance_class[0], instance_class[1], ref[1], instance_class)]
+            return []
+        if kind == "init":
+            resolved = self._lookup_class(module, ref[1])
+            if resolved:
+                return [(resolved[0], resolved[1], "__init__", resolved)]
+            return self._resolve(module, ("name", ref[1]), instance_class)
+        if kind == "attr":
+            owner, attr = ref[1], ref[2]
+            resolved = self._lookup_class(module, owner)
+            if resolved:
+                return [(resolved[0], resolved[1], attr, resolved)]
+            if owner in info.imports and info.imports[owner][1] is None:
+                target_module = info.imports[owner][0]
+            elif owner in info.imports and f"{info.imports[owner][0]}.{info.imports[owner][1]}" in self.modules:
+                target_module = f"{info.imports[owner][0]}.{info.imports[owner][1]}"
+            else:
+                return self._resolve(module, ("name", owner), instance_class)
+            if target_module in self.modules:
+                return [(target_module, None, attr, None)]
+            return []
+        # Bare name: local or imported class, function or global
+        name = ref[1]
+        resolved = self._lookup_class(module, name)
+        if resolved:
+            # Library code holds instances in attributes we cannot type, so a class
+            # used there depends on the whole class
+            return [(resolved[0], resolved[1], None, resolved)]
+        if name in info.functions:
+            return [(module, None, name, None)]
+        if name in info.imports:
+            target_module, target = info.imports[name]
+            if target is None or f"{target_module}.{target}" in self.modules:
+                whole = target_module if target is None else f"{target_module}.{target}"
+                return [(whole, None, None, None)] if whole in self.modules else []
+            if target_module in self.modules and target in self.modules[target_module].functions:
+                return [(target_module, None, target, None)]
+        return []
+
+    def closure(self, items):
+        """
+        Every symbol reachable from some work items
+
+        Returns:
+            set: (module, class or None, member) symbols, including <class>/<module> markers
+        """
+        seen_items = set()
+        symbols = set()
+        pending = list(items)
+        while pending:
+            item = pending.pop()
+            if item in seen_items:
+                continue
+            seen_items.add(item)
+            module, cls, member, instance_class = item
+            info = self.modules.get(module)
+            if info is None:
+                continue
+            symbols.add((module, None, MODULE))
+            if cls is None:
+                if member is None:
+                    # Whole module
+                    pending.extend((module, None, name, None) for name in info.functions)
+                    pending.extend((module, name, None, (module, name)) for name in info.classes)
+                elif member in info.functions:
+                    symbols.add((module, None, member))
+                    refs, params = info.functions[member]
+                    pending.extend(self._resolve_all(module, refs))
+                    if info.is_test or module == "conftest":
+                        pending.extend(self._fixtures(module, params))
+                continue
+            for owner in self._mro(module, cls):
+                symbols.add((owner[0], owner[1], CLASS))
+                symbols.add((owner[0], None, MODULE))
+            if member is None:
+                for owner in self._mro(module, cls):
+                    for name in self.modules[owner[0]].classes[owner[1]]["members"]:
+                        pending.append((module, cls, name, instance_class))
+                continue
+            owner = self._find_member(module, cls, member)
+            if owner is None:
+                continue
+            symbols.add((owner[0], owner[1], member))
+            refs, params = self.modules[owner[0]].classes[owner[1]]["members"][member]
+            pending.extend(self._resolve_all(owner[0], refs, instance_class, owner))
+            if self.modules[owner[0]].is_test:
+                pending.extend(self._fixtures(owner[0], params))
+        return symbols
+
+    def _resolve_all(self, module, refs, instance_class=None, owner=None):
+        items = []
+        for ref in refs:
+            items.extend(self._resolve(module, ref, instance_class, owner))
+        return items
+
+    def _fixtures(self, module, params):
+        """Fixtures requested by parameter name: the test module's own, then conftest's"""
+        items = []
+        conftest = self.modules.get("conftest")
+        for param in params:
+            if param in self.modules[module].functions:
+                items.append((module, None, param, None))
+            elif conftest and param in conftest.functions:
+                items.append(("conftest", None, param, None))
+        return items
+
+    def _hooks(self):
+        """conftest hooks in BEHAVIOUR_HOOKS, whose dependencies every test shares"""
+        conftest = self.modules.get("conftest")
+        if not conftest:
+            return []
+        return [("conftest", None, name, None) for name in conftest.functions if name in BEHAVIOUR_HOOKS]
+
+    def _other_hooks(self):
+        """Symbols of the remaining conftest hooks; a change to their own body still selects every test"""
+        conftest = self.modules.get("conftest")
+        if not conftest:
+            return set()
+        return {
+            ("conftest", None, name) for name in conftest.functions
+            if name.startswith("pytest_") and name not in BEHAVIOUR_HOOKS
+        }
+
+    # -- tests --------------------------------------------------------------
+
+    def tests(self):
+        """
+        Every test with its dependency closure
+
+        Returns:
+            dict: Node ID without parameters -> set of symbols
+        """
+        if self._closures:
+            return self._closures
+        other_hooks = self._other_hooks()
+        for module, info in self.modules.items():
+            if not info.is_test or not os.path.basename(info.path).startswith("test_"):
+                continue
+            for name in info.functions:
+                if name.startswith("test"):
+                    self._closures[f"{info.path}::{name}"] = (
+                        self.closure([(module, None, name, None)] + self._hooks()) | other_hooks
+                    )
+            for cls, details in info.classes.items():
+                if not cls.startswith("Test"):
+                    continue
+                for member in details["members"]:
+                    if member.startswith("test"):
+                        self._closures[f"{info.path}::{cls}::{member}"] = self.closure(
+                            [(module, cls, member, (module, cls))] + self._hooks()
+                        ) | other_hooks
+        return self._closures
+
+    def describe(self, node_id):
+        """Readable dependencies of a test, e.g. ["IndianCartPage.REMOVE_BUTTONS", ...]"""
+        described = set()
+        for module, cls, member in self.tests()[node_id]:
+            if self.modules[module].is_test or member in (CLASS, MODULE):
+                continue
+            described.add(f"{cls}.{member}" if cls else f"{module}.{member}")
+        return sorted(described)
+
+    # -- changes ------------------------------------------------------------
+
+    def changed_symbols(self, changes):
+        """
+        Map changed lines onto symbols
+
+        Args:
+            changes (dict): Repository-relative path -> set of changed line numbers (None = whole file)
+
+        Returns:
+            tuple: (set of changed symbols, True if something unanalysable changed)
+        """
+        symbols = set()
+        by_path = {info.path: info for info in self.modules.values()}
+        for path, lines in changes.items():
+            if any(pattern.search(path) for pattern in IGNORED_PATTERNS):
+                continue
+            info = by_path.get(path)
+            if info is None:
+                # Deleted or renamed modules, demo_site/, pytest.ini, requirements.txt, ...
+                return symbols, True
+            if lines is None:
+                symbols.update(span[2] for span in info.spans)
+                symbols.add((info.name, None, MODULE))
+                continue
+            for start, end, symbol in info.spans:
+                if any(start <= line <= end for line in lines):
+                    symbols.add(symbol)
+        return symbols, False
+
+    def impacted(self, changes):
+        """
+        Tests affected by a set of changes
+
+        Returns:
+            set: Node IDs (without parameters); every test when the change cannot be analysed
+        """
+        symbols, everything = self.changed_symbols(changes)
+        if everything:
+            return set(self.tests())
+        return {node_id for node_id, closure in self.tests().items() if closure & symbols}
+
+
+def git_changes(ref, root=PROJECT_ROOT):
+    """
+    Lines changed in the working tree relative to a git ref
+
+    Returns:
+        dict: Repository-relative path -> set of changed line numbers (None for whole-file changes)
+    """
+    diff = subprocess.run(
+        ["git", "diff", "--no-color", "--no-ext-diff", "-U0", "-M", ref, "--"],
+        cwd=root, capture_output=True, text=True, check=True,
+    ).stdout
+    changes = {}
+    path = None
+    for line in diff.splitlines():
+        if line.startswith("diff --git "):
+            path = None
+        elif line.startswith("--- ") and line != "--- /dev/null":
+            changes.setdefault(line[6:], set())
+        elif line.startswith("+++ "):
+            path = None if line == "+++ /dev/null" else line[6:]
+            if path is not None:
+                changes.setdefault(path, set())
+        elif path is not None:
+            match = HUNK_HEADER.match(line)
+            if match:
+                start, count = int(match.group(1)), int(match.group(2) or 1)
+                # Pure deletions (count 0) touch the lines around the removal point
+                changes[path].update(range(start, start + count) if count else (start, start + 1))
+    for path, lines in list(changes.items()):
+        if not lines:
+            changes[path] = None
+    untracked = subprocess.run(
+        ["git", "ls-files", "--others", "--exclude-standard"],
+        cwd=root, capture_output=True, text=True, check=True,
+    ).stdout
+    for path in untracked.splitlines():
+        changes[path] = None
+    return changes
+
+
+def main(argv=None):
+    """List tests impacted since a git ref, or print the dependency map"""
+    import argparse
+    parser = argparse.ArgumentParser(description="Select tests affected by a change")
+    parser.add_argument("ref", nargs="?", default="HEAD", help="Git ref to diff against (default: HEAD)")
+    parser.add_argument("--map", action="store_true", help="Print each test's dependencies instead")
+    args = parser.parse_args(argv)
+
+    impact = ImpactMap()
+    if args.map:
+        for node_id in sorted(impact.tests()):
+            print(node_id)
+            for dependency in impact.describe(node_id):
+                print(f"    {dependency}")
+        return 0
+    impacted = impact.impacted(git_changes(args.ref))
+    for node_id in sorted(impacted):
+        print(node_id)
+    print(f"{len(impacted)} of {len(impact.tests())} tests impacted since {args.ref}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Wait engine
+Explicit-only waits with configurable polling, per-locator timeout budgets
+and fast-fail presence/absence checks. Drivers run with implicit wait 0,
+so these waits are never stacked on top of an implicit one.
+"""
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+
+class WaitEngine:
+    # Defaults, overridable with --wait-timeout / --wait-poll
+    DEFAULT_TIMEOUT = 10
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, driver, timeout=None, poll_interval=None, budgets=None):
+        """
+        Args:
+            driver: WebDriver instance
+            timeout (float): Default timeout in seconds
+            poll_interval (float): Seconds between condition checks
+            budgets (dict): Locator -> timeout in seconds, overriding the default
+        """
+        self.driver = driver
+        self.timeout = WaitEngine.DEFAULT_TIMEOUT if timeout is None else timeout
+        self.poll_interval = WaitEngine.POLL_INTERVAL if poll_interval is None else poll_interval
+        self.budgets = budgets or {}
+
+    def budget_for(self, locator):
+        """Timeout budget for a locator"""
+        return self.budgets.get(locator, self.timeout)
+
+    def until(self, condition, timeout=None, message=""):
+        """Poll a condition until it returns a truthy value (raises TimeoutException)"""
+        wait = WebDriverWait(
+            self.driver,
+            self.timeout if timeout is None else timeout,
+            # WebDriverWait treats 0 as "use the 0.5s default"
+            poll_frequency=max(self.poll_interval, 0.01),
+        )
+        return wait.until(condition, message)
+
+    def present(self, locator):
+        """Wait for an element to be present in the DOM"""
+        return self.until(EC.presence_of_element_located(locator), self.budget_for(locator))
+
+    def all_present(self, locator):
+        """Wait for at least one matching element, returning [] when none appear"""
+        try:
+            return self.until(EC.presence_of_all_elements_located(locator), self.budget_for(locator))
+        except TimeoutException:
+            return []
+
+    def clickable(self, locator, element=None):
+        """
+        Wait for an element to be visible and enabled
+
+        Args:
+            locator (tuple): Element locator (also selects the timeout budget)
+            element: Already located element to recheck in place instead of looking it up
+        """
+        if element is None:
+            return self.until(EC.element_to_be_clickable(locator), self.budget_for(locator))
+        # Stale handles raise StaleElementReferenceException to the caller
+        return self.until(
+            lambda driver: element if element.is_displayed() and element.is_enabled() else False,
+            self.budget_for(locator),
+        )
+
+    def present_now(self, locator):
+        """Check presence once, without waiting"""
+        return len(self.driver.find_elements(*locator)) > 0
+
+    def absent(self, locator, timeout=None):
+        """
+        Expect an element to be absent
+
+        Returns True as soon as no element matches, so an element that is
+        already gone costs a single lookup instead of a full timeout.
+
+        Args:
+            locator (tuple): Locator expected to match nothing
+            timeout (float): Seconds to wait for it to disappear (default: its budget)
+
+        Returns:
+            bool: True if absent within the timeout
+        """
+        if not self.present_now(locator):
+            return True
+        try:
+            return self.until(
+                lambda driver: not driver.find_elements(*locator),
+                self.budget_for(locator) if timeout is None else timeout,
+            )
+        except TimeoutException:
+            return False